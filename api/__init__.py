@@ -2,4 +2,4 @@
 연호 변환 API 패키지
 """
 
-from .main import app 
\ No newline at end of file
+from .main import app, create_app
@@ -0,0 +1,43 @@
+"""
+연호 변환 API 실행
+
+    python -m api --workers 4 --port 8000
+
+워커 수를 지정하지 않으면 WEB_CONCURRENCY 환경 변수, 없으면 CPU 코어 수만큼 실행합니다.
+"""
+
+import argparse
+import os
+
+import uvicorn
+
+from .metrics import prepare_multiprocess_dir
+
+def default_workers() -> int:
+    """기본 워커 수 (WEB_CONCURRENCY 또는 CPU 코어 수)"""
+    value = os.environ.get("WEB_CONCURRENCY")
+    return int(value) if value else os.cpu_count() or 1
+
+def main():
+    parser = argparse.ArgumentParser(description="연호 변환 API 서버")
+    parser.add_argument("--host", default=os.environ.get("HOST", "0.0.0.0"), help="바인딩 주소")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", "8000")), help="포트")
+    parser.add_argument("--workers", type=int, default=default_workers(), help="워커 프로세스 수")
+    parser.add_argument("--log-level", default="info", help="로그 수준")
+    args = parser.parse_args()
+    
+    # 워커별 지표를 /metrics에서 합산하도록 스냅숏 디렉터리 준비
+    if args.workers > 1:
+        prepare_multiprocess_dir()
+    
+    # 여러 워커로 실행하려면 앱을 import 문자열로 넘겨야 함
+    uvicorn.run(
+        "api.main:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        log_level=args.log_level,
+    )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""
+요청 수용 제어 (admission control)
+
+일괄 변환처럼 무거운 요청이 몰려도 단건 변환 사용자의 지연 시간이 무한정 늘어나지 않도록
+동시 처리 수와 클라이언트별 요청 속도를 제한합니다. 한도를 넘은 요청은 대기열에 쌓지 않고
+바로 429와 Retry-After 헤더로 거절합니다.
+
+설정은 환경 변수로 지정합니다.
+
+- CHRONO_API_MAX_IN_FLIGHT: 일반 요청의 전역 동시 처리 수 (기본 64)
+- CHRONO_API_PRIORITY_IN_FLIGHT: 우선 처리 경로 전용으로 예약한 동시 처리 수 (기본 16)
+- CHRONO_API_RATE: 클라이언트별 초당 요청 수 (기본 20, 0이면 제한 없음)
+- CHRONO_API_BURST: 클라이언트별 순간 최대 요청 수 (기본 40)
+- CHRONO_API_CLIENT_HEADER: 클라이언트 식별에 쓸 헤더 (예: x-forwarded-for, 기본은 접속 주소)
+- CHRONO_API_SESSION_HEADER: 신뢰하는 클라이언트가 보낸 사용자 식별 헤더 (기본 x-chrono-session)
+- CHRONO_API_TRUSTED_CLIENTS: 사용자 식별 헤더를 믿을 클라이언트 주소 (쉼표 구분, 기본 127.0.0.1,::1)
+
+Streamlit 페이지처럼 서버에서 여러 사용자를 대신해 API를 호출하는 클라이언트는 접속 주소가 하나뿐이므로,
+신뢰하는 주소에서 온 요청은 사용자 식별 헤더 값까지 묶어 사용자별로 요청 속도를 제한합니다.
+
+WebSocket(입력 중 실시간 변환)은 연결 하나가 오래 유지되므로 동시 처리 자리를 잡지 않고,
+연결 요청과 받은 메시지마다 클라이언트별 토큰 버킷(live 구간)에서 토큰을 씁니다. 한도를 넘은 연결은
+닫고(1013), 한도를 넘은 메시지는 앱에 전달하지 않고 {"detail": ..., "retry_after": ...}로 바로 답합니다.
+
+워커(프로세스)마다 따로 집계하므로 여러 워커로 실행하면 전체 한도는 워커 수만큼 늘어납니다.
+"""
+
+import json
+import math
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import FrozenSet, Optional, Tuple
+
+from .metrics import REGISTRY, Counter, Gauge, route_label
+
+# 단건 변환처럼 빠르게 끝나는 대화형 요청 (일반 요청과 따로 동시 처리 수를 예약)
+PRIORITY_PATHS = frozenset({"/api/convert"})
+
+# 수용 제어를 적용하지 않는 경로 (지표 수집, 상태 확인, 문서)
+EXEMPT_PATHS = frozenset({"/metrics", "/healthz", "/readyz", "/docs", "/redoc", "/openapi.json"})
+
+# WebSocket 연결/메시지의 요청 속도 구간 (HTTP 요청과 버킷을 따로 씀)
+LIVE_LANE = "live"
+
+# 한도를 넘은 WebSocket 연결을 닫을 때의 종료 코드 (Try Again Later)
+WS_TRY_AGAIN_LATER = 1013
+
+RATE_LIMITED_DETAIL = "요청이 너무 많습니다. 잠시 후 다시 시도해주세요."
+
+# 요청 속도를 추적할 최대 클라이언트 수 (오래 요청이 없던 클라이언트부터 제거)
+MAX_TRACKED_CLIENTS = 10000
+
+# 서버에서 사용자를 대신해 호출하는 클라이언트가 붙이는 사용자 식별 헤더
+SESSION_HEADER = "x-chrono-session"
+
+# 사용자 식별 헤더를 믿을 클라이언트 (같은 호스트의 Streamlit 서버)
+TRUSTED_CLIENTS = frozenset({"127.0.0.1", "::1"})
+
+REJECTED = REGISTRY.register(Counter(
+    "chrono_http_rejected_total", "수용 제어로 거절한 HTTP 요청/WebSocket 메시지 수 (reason: concurrency, rate)", ("lane", "route", "reason")
+))
+LANE_IN_FLIGHT = REGISTRY.register(Gauge(
+    "chrono_admission_in_flight", "처리 구간별 처리 중인 요청 수", ("lane",)
+))
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+def _env_float(name: str, default: float) -> float:
+    value = os.environ.get(name)
+    return float(value) if value else default
+
+@dataclass(frozen=True)
+class AdmissionConfig:
+    """수용 제어 설정"""
+    max_in_flight: int = 64
+    priority_in_flight: int = 16
+    rate: float = 20.0
+    burst: int = 40
+    client_header: Optional[str] = None
+    session_header: str = SESSION_HEADER
+    trusted_clients: FrozenSet[str] = TRUSTED_CLIENTS
+    priority_paths: FrozenSet[str] = PRIORITY_PATHS
+    exempt_paths: FrozenSet[str] = EXEMPT_PATHS
+    
+    @classmethod
+    def from_env(cls) -> "AdmissionConfig":
+        """환경 변수에서 설정 읽기"""
+        header = os.environ.get("CHRONO_API_CLIENT_HEADER")
+        trusted = os.environ.get("CHRONO_API_TRUSTED_CLIENTS")
+        return cls(
+            max_in_flight=_env_int("CHRONO_API_MAX_IN_FLIGHT", cls.max_in_flight),
+            priority_in_flight=_env_int("CHRONO_API_PRIORITY_IN_FLIGHT", cls.priority_in_flight),
+            rate=_env_float("CHRONO_API_RATE", cls.rate),
+            burst=_env_int("CHRONO_API_BURST", cls.burst),
+            client_header=header.lower() if header else None,
+            session_header=os.environ.get("CHRONO_API_SESSION_HEADER", cls.session_header).lower(),
+            trusted_clients=(
+                frozenset(address.strip() for address in trusted.split(",") if address.strip())
+                if trusted is not None else cls.trusted_clients
+            ),
+        )
+
+class TokenBucket:
+    """클라이언트별 토큰 버킷
+    
+    초당 rate개씩 토큰이 채워지고 최대 burst개까지 쌓입니다. 요청마다 토큰 하나를 씁니다.
+    """
+    
+    __slots__ = ("tokens", "updated")
+    
+    def __init__(self, burst: int, now: float):
+        self.tokens = float(burst)
+        self.updated = now
+    
+    def take(self, rate: float, burst: int, now: float) -> float:
+        """토큰 하나를 사용
+        
+        Returns:
+            토큰이 있으면 0, 없으면 다음 토큰까지 기다려야 하는 시간(초)
+        """
+        self.tokens = min(burst, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / rate
+
+class AdmissionController:
+    """동시 처리 수와 클라이언트별 요청 속도 관리
+    
+    이벤트 루프 안에서만 호출되므로 별도의 잠금 없이 카운터를 다룹니다.
+    우선 처리 경로는 예약된 자리를 먼저 쓰고, 모두 차면 일반 자리를 함께 사용합니다.
+    일반 요청은 예약된 자리를 쓸 수 없으므로 일괄 요청이 몰려도 단건 요청이 밀리지 않습니다.
+    """
+    
+    def __init__(self, config: AdmissionConfig):
+        self.config = config
+        self.in_flight = {"shared": 0, "priority": 0}
+        self._buckets: "OrderedDict[Tuple[str, str], TokenBucket]" = OrderedDict()
+        for lane in self.in_flight:
+            LANE_IN_FLIGHT.set(0, lane=lane)
+    
+    def check_rate(self, client: str, lane: str) -> float:
+        """클라이언트 요청 속도 확인
+        
+        단건 요청과 일반 요청은 버킷을 따로 쓰므로 일괄 요청이 단건 요청의 한도를 소진하지 않습니다.
+        
+        Returns:
+            허용이면 0, 거절이면 Retry-After로 보낼 대기 시간(초)
+        """
+        config = self.config
+        if config.rate <= 0:
+            return 0.0
+        
+        now = time.monotonic()
+        key = (client, lane)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(config.burst, now)
+            if len(self._buckets) > MAX_TRACKED_CLIENTS:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket.take(config.rate, config.burst, now)
+    
+    def acquire(self, lane: str) -> Optional[str]:
+        """동시 처리 자리 확보
+        
+        Returns:
+            확보한 자리 종류 ("priority" 또는 "shared"), 자리가 없으면 None
+        """
+        if lane == "priority" and self.in_flight["priority"] < self.config.priority_in_flight:
+            slot = "priority"
+        elif self.in_flight["shared"] < self.config.max_in_flight:
+            slot = "shared"
+        else:
+            return None
+        self.in_flight[slot] += 1
+        LANE_IN_FLIGHT.inc(lane=slot)
+        return slot
+    
+    def release(self, slot: str):
+        """확보한 자리 반납"""
+        self.in_flight[slot] -= 1
+        LANE_IN_FLIGHT.dec(lane=slot)
+
+class AdmissionMiddleware:
+    """한도를 넘은 HTTP 요청을 바로 429로 거절하는 ASGI 미들웨어"""
+    
+    def __init__(self, app, config: Optional[AdmissionConfig] = None):
+        self.app = app
+        self.controller = AdmissionController(config or AdmissionConfig.from_env())
+    
+    def _client(self, scope) -> str:
+        """요청 속도를 집계할 클라이언트 키
+        
+        신뢰하는 클라이언트(서버에서 대신 호출하는 Streamlit 등)가 사용자 식별 헤더를 보내면
+        접속 주소와 헤더 값을 묶어 사용자별로 집계합니다.
+        """
+        config = self.controller.config
+        headers = {
+            name.decode("latin-1"): value.decode("latin-1")
+            for name, value in scope.get("headers", ())
+            if name.decode("latin-1") in (config.client_header, config.session_header)
+        }
+        if config.client_header and config.client_header in headers:
+            # 프록시가 붙인 목록에서 가장 앞의 주소 (원래 클라이언트)
+            client = headers[config.client_header].split(",")[0].strip()
+        else:
+            peer = scope.get("client")
+            client = peer[0] if peer else "unknown"
+        
+        session = headers.get(config.session_header)
+        if session and client in config.trusted_clients:
+            return f"{client}/{session}"
+        return client
+    
+    async def __call__(self, scope, receive, send):
+        config = self.controller.config
+        if scope["type"] not in ("http", "websocket") or scope["path"] in config.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+        if scope["type"] == "websocket":
+            await self._websocket(scope, receive, send)
+            return
+        
+        lane = "priority" if scope["path"] in config.priority_paths else "shared"
+        
+        retry_after = self.controller.check_rate(self._client(scope), lane)
+        if retry_after:
+            REJECTED.inc(lane=lane, route=route_label(scope), reason="rate")
+            await _reject(send, retry_after, RATE_LIMITED_DETAIL)
+            return
+        
+        slot = self.controller.acquire(lane)
+        if slot is None:
+            REJECTED.inc(lane=lane, route=route_label(scope), reason="concurrency")
+            await _reject(send, 1, "서버가 처리할 수 있는 요청 수를 초과했습니다. 잠시 후 다시 시도해주세요.")
+            return
+        
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(slot)
+    
+    async def _websocket(self, scope, receive, send):
+        """WebSocket 연결 요청과 받은 메시지마다 요청 속도 확인 (동시 처리 자리는 잡지 않음)"""
+        client = self._client(scope)
+        route = route_label(scope)
+        
+        connect = await receive()
+        if connect["type"] == "websocket.connect":
+            retry_after = self.controller.check_rate(client, LIVE_LANE)
+            if retry_after:
+                REJECTED.inc(lane=LIVE_LANE, route=route, reason="rate")
+                await send({"type": "websocket.close", "code": WS_TRY_AGAIN_LATER})
+                return
+        
+        pending = [connect]
+        
+        async def limited_receive():
+            if pending:
+                return pending.pop()
+            while True:
+                message = await receive()
+                if message["type"] != "websocket.receive":
+                    return message
+                retry_after = self.controller.check_rate(client, LIVE_LANE)
+                if not retry_after:
+                    return message
+                # 앱은 응답을 보낸 뒤에만 다음 메시지를 받으므로 여기서 보내도 앱의 전송과 겹치지 않음
+                REJECTED.inc(lane=LIVE_LANE, route=route, reason="rate")
+                detail = {"detail": RATE_LIMITED_DETAIL, "retry_after": max(1, math.ceil(retry_after))}
+                await send({"type": "websocket.send", "text": json.dumps(detail, ensure_ascii=False)})
+        
+        await self.app(scope, limited_receive, send)
+
+async def _reject(send, retry_after: float, detail: str):
+    """429 응답 전송 (FastAPI HTTPException과 같은 {"detail": ...} 형식)"""
+    body = json.dumps({"detail": detail}, ensure_ascii=False).encode("utf-8")
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode("latin-1")),
+        (b"retry-after", str(max(1, math.ceil(retry_after))).encode("latin-1")),
+    ]
+    await send({"type": "http.response.start", "status": 429, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
@@ -1,23 +1,54 @@
-from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-import re
-from typing import Optional
-
-app = FastAPI(
-    title="연호 변환 API",
-    description="단기/일본 연호를 서기로 변환하는 API",
-    version="1.0.0"
-)
+from fastapi import APIRouter, File, Header, HTTPException, Query, Request, UploadFile, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field
+import codecs
+import hashlib
+import json
+import os
+import tempfile
+from typing import Iterator, List, Optional
 
-# CORS 설정 추가
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # 모든 도메인 허용
-    allow_credentials=True,
-    allow_methods=["*"],  # 모든 HTTP 메서드 허용
-    allow_headers=["*"],  # 모든 헤더 허용
+from chrono import ERA_TABLE_VERSION, ERAS, ERAS_BY_CODE, convert_to_segi, parse_year_input
+from chrono.batch import (
+    INVALID_YEAR,
+    STATUS_FORMAT_ERROR,
+    STATUS_MISSING,
+    STATUS_OK,
+    STATUS_OUT_OF_RANGE,
+    STATUS_OUT_OF_SCOPE,
+)
+from chrono.dates import (
+    DATE_STATUS_LABELS,
+    PRECISION_DAY,
+    PRECISION_MONTH,
+    PRECISION_YEAR,
+    STATUS_ERA_MISMATCH,
+    STATUS_LUNAR,
+    convert_dates,
 )
+from chrono.extract import extract_mentions, iter_mentions, iter_text_chunks
+
+from .metrics import CONTENT_TYPE, REGISTRY, record_conversion
+
+# 연호 변환 API 라우트 (앱 생성과 미들웨어 구성은 api.main.create_app)
+router = APIRouter()
+
+# 응답 형식 버전 (ETag에 포함)
+API_VERSION = "1.0.0"
+
+# GET /api/convert 응답을 캐시에 보관할 시간 (초, 기본 7일)
+CACHE_MAX_AGE = int(os.environ.get("CHRONO_API_CACHE_MAX_AGE", "604800"))
+CACHE_CONTROL = f"public, max-age={CACHE_MAX_AGE}"
+
+# GET /api/convert 입력 최대 길이 (캐시 키가 무한정 늘어나지 않도록)
+MAX_QUERY_TEXT_LENGTH = 200
+
+# 일괄 변환 요청 하나에 담을 수 있는 최대 입력 수 (넘으면 422, 클라이언트가 나눠 보냄)
+MAX_BATCH_SIZE = int(os.environ.get("CHRONO_API_MAX_BATCH_SIZE", "1000"))
+
+# 업로드 파일을 옮겨 담을 때 읽는 크기와 메모리에 둘 최대 크기 (넘으면 디스크 임시 파일)
+UPLOAD_CHUNK_SIZE = 1 << 16
+UPLOAD_SPOOL_SIZE = 1 << 20
 
 class YearInput(BaseModel):
     """연호 입력 모델"""
@@ -51,125 +82,37 @@ class ConversionResult(BaseModel):
             }
         }
 
-def parse_year_input(text: str) -> tuple[Optional[str], Optional[int]]:
-    """입력 텍스트에서 연호와 연도를 추출
-    
-    Args:
-        text (str): 입력 텍스트 (예: "단기 4356", "메이지 3년")
-        
-    Returns:
-        tuple[Optional[str], Optional[int]]: (연호, 연도) 또는 파싱 실패시 (None, None)
-    """
-    text = text.strip()
-    
-    # 단기 패턴 (예: "단기 4300년", "단기4300", "단기 4300")
-    dangi_pattern = r'단기\s*(\d+)년?'
-    dangi_match = re.search(dangi_pattern, text)
-    if dangi_match:
-        year = int(dangi_match.group(1))
-        return "단기", year
-    
-    # 일본 연호 패턴 (한국식/일본식 모두 지원)
-    era_mapping = {
-        '메이지': '메이지',
-        '명치': '메이지',
-        '다이쇼': '다이쇼',
-        '대정': '다이쇼',
-        '쇼와': '쇼와',
-        '소화': '쇼와'
-    }
-    
-    era_pattern = f"({'|'.join(era_mapping.keys())})\s*(\d+)년?"
-    era_match = re.search(era_pattern, text)
-    if era_match:
-        input_era = era_match.group(1)
-        year = int(era_match.group(2))
-        standardized_era = era_mapping[input_era]
-        return standardized_era, year
-    
-    # 숫자만 있는 경우 단기로 간주
-    number_pattern = r'^\s*(\d+)\s*년?\s*$'
-    number_match = re.search(number_pattern, text)
-    if number_match:
-        year = int(number_match.group(1))
-        return "단기", year
-    
-    return None, None
-
-def is_valid_year(era: str, year: int) -> bool:
-    """연호별 유효 기간 검증
-    
-    Args:
-        era (str): 연호 ("단기", "메이지", "다이쇼", "쇼와")
-        year (int): 연도
-        
-    Returns:
-        bool: 유효한 연도인지 여부
-    """
-    if era == "단기":
-        # 단기는 음수가 되지 않아야 하고, 2002년을 초과하지 않아야 함
-        segi_year = year - 2333
-        return year >= 1 and segi_year <= 2002
-    
-    # 일본 연호별 유효 기간
-    era_limits = {
-        "메이지": (1, 45),    # 1868-1912
-        "다이쇼": (1, 15),    # 1912-1926
-        "쇼와": (1, 64)      # 1926-1989
-    }
-    
-    if era in era_limits:
-        min_year, max_year = era_limits[era]
-        return min_year <= year <= max_year
+class BatchYearInput(BaseModel):
+    """연호 일괄 입력 모델 (최대 MAX_BATCH_SIZE개)"""
+    texts: List[str] = Field(..., max_length=MAX_BATCH_SIZE)
     
-    return False
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "texts": ["단기 4356", "쇼와 20년", "메이지5년"]
+            }
+        }
 
-def convert_to_segi(era: str, year: int) -> Optional[int]:
-    """연호와 연도를 서기로 변환
-    
-    Args:
-        era (str): 연호 ("단기", "메이지", "다이쇼", "쇼와")
-        year (int): 연도
-        
-    Returns:
-        Optional[int]: 서기 연도 또는 변환 실패시 None
-    """
-    if not is_valid_year(era, year):
-        return None
-        
-    if era == "단기":
-        return year - 2333
-    elif era == "메이지":
-        return 1867 + year
-    elif era == "다이쇼":
-        return 1911 + year
-    elif era == "쇼와":
-        return 1925 + year
-    
-    return None
-
-@app.post("/api/convert", response_model=ConversionResult, tags=["연호 변환"])
-async def convert_year(input_data: YearInput) -> ConversionResult:
-    """연호를 서기로 변환
-    
-    입력된 연호(단기/일본 연호)를 서기 연도로 변환합니다.
-    지원하는 연호:
-    - 단기: 모든 양수 연도 (서기 2002년 이하)
-    - 메이지: 1-45년 (1868-1912)
-    - 다이쇼: 1-15년 (1912-1926)
-    - 쇼와: 1-64년 (1926-1989)
+class BatchConversionResult(BaseModel):
+    """연호 일괄 변환 결과 모델"""
+    results: List[ConversionResult]
+    valid_count: int
+    invalid_count: int
+
+def convert_text(text: str) -> ConversionResult:
+    """입력 텍스트 하나를 변환 결과 모델로 변환
     
     Args:
-        input_data (YearInput): 변환할 연호 텍스트
+        text (str): 입력 텍스트 (예: "단기 4356")
         
     Returns:
         ConversionResult: 변환 결과
     """
-    era, year = parse_year_input(input_data.text)
+    era, year = parse_year_input(text)
     
     if not era or not year:
         return ConversionResult(
-            input_text=input_data.text,
+            input_text=text,
             is_valid=False,
             message="입력 형식이 올바르지 않습니다."
         )
@@ -178,7 +121,7 @@ async def convert_year(input_data: YearInput) -> ConversionResult:
     
     if not segi_year:
         return ConversionResult(
-            input_text=input_data.text,
+            input_text=text,
             era=era,
             original_year=year,
             is_valid=False,
@@ -186,7 +129,7 @@ async def convert_year(input_data: YearInput) -> ConversionResult:
         )
     
     return ConversionResult(
-        input_text=input_data.text,
+        input_text=text,
         era=era,
         original_year=year,
         segi_year=segi_year,
@@ -194,15 +137,367 @@ async def convert_year(input_data: YearInput) -> ConversionResult:
         message=None
     )
 
-@app.get("/api", tags=["API 정보"])
+def conversion_etag(text: str) -> str:
+    """입력 텍스트와 연호 표 버전으로 만든 강한 ETag
+    
+    응답의 input_text에 입력이 그대로 담기므로 정규화하기 전의 입력으로 만듭니다.
+    연호 표나 응답 형식이 바뀌면 버전이 달라져 이전에 캐시된 응답은 다시 검증됩니다.
+    """
+    digest = hashlib.sha256(f"{API_VERSION}\0{ERA_TABLE_VERSION}\0{text}".encode("utf-8"))
+    return f'"{digest.hexdigest()[:32]}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 (약한 비교, 여러 값과 * 지원)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+@router.post("/api/convert", response_model=ConversionResult, tags=["연호 변환"])
+async def convert_year(input_data: YearInput) -> ConversionResult:
+    """연호를 서기로 변환
+    
+    입력된 연호(단기/대한제국/일본 연호)를 서기 연도로 변환합니다.
+    한글, 한자(明治 四十年), 가나, 전각 숫자 표기를 모두 지원합니다.
+    지원하는 연호 (일부):
+    - 단기: 모든 양수 연도 (서기 2002년 이하)
+    - 건양/광무/융희: 1896-1910
+    - 메이지: 1-45년 (1868-1912)
+    - 다이쇼: 1-15년 (1912-1926)
+    - 쇼와: 1-64년 (1926-1989)
+    - 헤이세이: 1-31년 (1989-2019)
+    
+    전체 목록은 GET /api/eras 를 참고하세요.
+    
+    Args:
+        input_data (YearInput): 변환할 연호 텍스트
+        
+    Returns:
+        ConversionResult: 변환 결과
+    """
+    result = convert_text(input_data.text)
+    record_conversion(result.era, result.is_valid)
+    return result
+
+@router.get("/api/convert", response_model=ConversionResult, tags=["연호 변환"])
+async def convert_year_cacheable(
+    text: str = Query(..., max_length=MAX_QUERY_TEXT_LENGTH, description="변환할 연호 텍스트"),
+    if_none_match: Optional[str] = Header(None),
+) -> Response:
+    """연호를 서기로 변환 (캐시 가능한 GET)
+    
+    같은 입력의 결과는 바뀌지 않으므로 브라우저, CDN, 리버스 프록시가 응답을 캐시할 수 있도록
+    Cache-Control과 ETag를 붙입니다. If-None-Match가 ETag와 같으면 본문 없이 304로 응답합니다.
+    POST와 같이 input_text에는 입력이 그대로 담깁니다.
+    
+    Args:
+        text (str): 변환할 연호 텍스트 (예: "단기 4356")
+        if_none_match (Optional[str]): 이전에 받은 ETag
+        
+    Returns:
+        Response: 변환 결과 JSON 또는 304 Not Modified
+    """
+    etag = conversion_etag(text)
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    
+    result = convert_text(text)
+    record_conversion(result.era, result.is_valid)
+    return JSONResponse(result.model_dump(), headers=headers)
+
+@router.post("/api/convert/batch", response_model=BatchConversionResult, tags=["연호 변환"])
+async def convert_years(input_data: BatchYearInput) -> BatchConversionResult:
+    """여러 연호를 한 번의 요청으로 서기로 변환
+    
+    입력 순서대로 변환 결과를 반환합니다. 대량 입력 시 값마다
+    요청을 보내지 않고 한 번에 검증할 때 사용합니다.
+    요청 하나에는 MAX_BATCH_SIZE개까지 담을 수 있으며, 넘으면 422로 응답합니다.
+    
+    Args:
+        input_data (BatchYearInput): 변환할 연호 텍스트 목록
+        
+    Returns:
+        BatchConversionResult: 입력 순서와 같은 순서의 변환 결과 목록
+    """
+    results = [convert_text(text) for text in input_data.texts]
+    for result in results:
+        record_conversion(result.era, result.is_valid)
+    valid_count = sum(1 for result in results if result.is_valid)
+    
+    return BatchConversionResult(
+        results=results,
+        valid_count=valid_count,
+        invalid_count=len(results) - valid_count
+    )
+
+class DateConversionResult(BaseModel):
+    """연호 날짜 변환 결과 모델"""
+    input_text: str
+    era: Optional[str] = None
+    resolved_era: Optional[str] = None
+    segi_year: Optional[int] = None
+    date: Optional[str] = None
+    precision: Optional[str] = None
+    status: str
+    is_valid: bool
+    message: Optional[str] = None
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "input_text": "메이지 45년 7월 30일",
+                "era": "메이지",
+                "resolved_era": "다이쇼",
+                "segi_year": 1912,
+                "date": "1912-07-30",
+                "precision": "day",
+                "status": "era_mismatch",
+                "is_valid": False,
+                "message": "메이지 연호의 시행 기간 밖의 날짜입니다. (해당 날짜의 연호: 다이쇼)"
+            }
+        }
+
+class DateBatchConversionResult(BaseModel):
+    """연호 날짜 일괄 변환 결과 모델"""
+    results: List[DateConversionResult]
+    valid_count: int
+    invalid_count: int
+
+# 날짜 변환 상태별 안내 문구
+DATE_STATUS_MESSAGES = {
+    STATUS_MISSING: "입력이 비어 있습니다.",
+    STATUS_FORMAT_ERROR: "입력 형식이 올바르지 않습니다.",
+    STATUS_OUT_OF_RANGE: "유효하지 않은 날짜입니다.",
+    STATUS_OUT_OF_SCOPE: "사업 대상 기간(~2002년)을 초과합니다.",
+    STATUS_LUNAR: "양력 시행 이전의 음력 날짜라 양력으로 변환할 수 없습니다.",
+}
+
+PRECISION_LABELS = {PRECISION_YEAR: "year", PRECISION_MONTH: "month", PRECISION_DAY: "day"}
+
+@router.post("/api/convert/dates", response_model=DateBatchConversionResult, tags=["연호 변환"])
+async def convert_dates_batch(input_data: BatchYearInput) -> DateBatchConversionResult:
+    """여러 연호 날짜(연/월/일)를 한 번의 요청으로 양력 날짜로 변환
+    
+    "메이지 45년 7월 30일", "다이쇼 원년 8월"처럼 월/일이 포함된 표기를 변환합니다.
+    날짜가 표기된 연호의 시행 기간 밖이면 era_mismatch로 표시하고 실제 시행 연호를 함께 반환합니다.
+    date는 입력 정밀도에 맞춘 ISO 8601 표기입니다. (예: 1912-07-30, 1912-08, 1912)
+    
+    Args:
+        input_data (BatchYearInput): 변환할 연호 날짜 텍스트 목록
+        
+    Returns:
+        DateBatchConversionResult: 입력 순서와 같은 순서의 변환 결과 목록
+    """
+    texts = input_data.texts
+    arrays = convert_dates(texts)
+    
+    results = []
+    for text, iso, precision, segi_year, era_code, resolved_code, status in zip(
+        texts,
+        arrays.iso.tolist(),
+        arrays.precision.tolist(),
+        arrays.segi_years.tolist(),
+        arrays.era_codes.tolist(),
+        arrays.resolved_era_codes.tolist(),
+        arrays.status.tolist(),
+    ):
+        era = ERAS_BY_CODE[era_code].name if era_code else None
+        resolved_era = ERAS_BY_CODE[resolved_code].name if resolved_code else None
+        if status == STATUS_ERA_MISMATCH:
+            message = f"{era} 연호의 시행 기간 밖의 날짜입니다. (해당 날짜의 연호: {resolved_era or '알 수 없음'})"
+        else:
+            message = DATE_STATUS_MESSAGES.get(status)
+        # 날짜가 있어도 연호 경계 불일치(era_mismatch)나 사업 기간 초과는 성공으로 집계하지 않음
+        is_valid = status == STATUS_OK
+        record_conversion(era, is_valid)
+        results.append(DateConversionResult(
+            input_text=text,
+            era=era,
+            resolved_era=resolved_era,
+            segi_year=segi_year if segi_year != INVALID_YEAR else None,
+            date=iso or None,
+            precision=PRECISION_LABELS.get(precision),
+            status=DATE_STATUS_LABELS[status],
+            is_valid=is_valid,
+            message=message
+        ))
+    valid_count = sum(1 for result in results if result.is_valid)
+    
+    return DateBatchConversionResult(
+        results=results,
+        valid_count=valid_count,
+        invalid_count=len(results) - valid_count
+    )
+
+class ExtractInput(BaseModel):
+    """문서 텍스트 입력 모델"""
+    text: str
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "text": "본교는 소화 12년 3월에 설립되어 단기 4290년에 교사를 신축하였다."
+            }
+        }
+
+class EraMentionResult(BaseModel):
+    """문서에서 찾은 연호 표기"""
+    start: int
+    end: int
+    text: str
+    era: str
+    year: int
+    segi_year: Optional[int] = None
+    in_scope: bool
+
+class ExtractResult(BaseModel):
+    """문서 추출 결과 모델"""
+    mentions: List[EraMentionResult]
+    count: int
+
+@router.post("/api/extract", response_model=ExtractResult, tags=["문서 추출"])
+async def extract_from_text(input_data: ExtractInput) -> ExtractResult:
+    """문서 텍스트에 포함된 연호 표기를 모두 찾아 서기로 변환
+    
+    Args:
+        input_data (ExtractInput): 문서 텍스트
+        
+    Returns:
+        ExtractResult: 위치(문자 단위) 순서의 연호 표기 목록
+    """
+    mentions = [EraMentionResult(**mention.to_dict()) for mention in extract_mentions(input_data.text)]
+    return ExtractResult(mentions=mentions, count=len(mentions))
+
+@router.post("/api/extract/file", tags=["문서 추출"])
+async def extract_from_file(file: UploadFile = File(...), encoding: str = "utf-8") -> StreamingResponse:
+    """업로드한 텍스트 파일(.txt)에서 연호 표기를 스트리밍으로 추출
+    
+    파일을 일정 크기씩 읽으면서 찾은 표기를 한 줄에 하나씩 JSON(NDJSON)으로 보냅니다.
+    업로드 파일은 응답을 보내기 전에 닫히므로 임시 파일로 옮긴 뒤 그 파일에서 읽으며,
+    임시 파일은 UPLOAD_SPOOL_SIZE를 넘으면 디스크에 기록되므로 서버 메모리 사용량은 일정합니다.
+    
+    Args:
+        file (UploadFile): OCR 결과 등 텍스트 파일
+        encoding (str): 파일 인코딩 (예: utf-8, cp949)
+        
+    Returns:
+        StreamingResponse: application/x-ndjson 형식의 연호 표기 목록
+    """
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 인코딩입니다: {encoding}")
+    
+    spooled = tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_SIZE)
+    try:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            spooled.write(chunk)
+        spooled.seek(0)
+    except BaseException:
+        spooled.close()
+        raise
+    
+    def generate() -> Iterator[bytes]:
+        with spooled:
+            reader = codecs.getreader(encoding)(spooled, errors="replace")
+            for mention in iter_mentions(iter_text_chunks(reader)):
+                yield (json.dumps(mention.to_dict(), ensure_ascii=False) + "\n").encode("utf-8")
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+@router.websocket("/ws/convert")
+async def convert_year_live(websocket: WebSocket):
+    """입력 중 실시간 변환용 WebSocket
+    
+    연결 하나로 여러 메시지를 주고받으며, 메시지마다 받은 순서대로 변환 결과를 보냅니다.
+    요청 속도는 수용 제어(api.admission)가 연결과 메시지마다 제한합니다.
+    
+    메시지 형식:
+    - 텍스트 그대로 (예: "단기 4356")
+    - 또는 JSON 객체 {"id": 요청 식별자, "text": "단기 4356"} — 응답에 같은 id가 포함됩니다.
+    
+    text가 문자열이 아니거나 바이너리 프레임이면 {"id": ..., "detail": 오류 메시지}로 답합니다.
+    """
+    await websocket.accept()
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+            
+            request_id = None
+            text = message.get("text")
+            if text is None:
+                await websocket.send_text(json.dumps({"detail": "텍스트 메시지만 지원합니다."}, ensure_ascii=False))
+                continue
+            
+            if text.startswith("{"):
+                try:
+                    payload = json.loads(text)
+                except ValueError:
+                    payload = None
+                if isinstance(payload, dict):
+                    request_id = payload.get("id")
+                    text = payload.get("text")
+                    if not isinstance(text, str):
+                        error = {"id": request_id, "detail": "text는 문자열이어야 합니다."}
+                        await websocket.send_text(json.dumps(error, ensure_ascii=False))
+                        continue
+            
+            result = convert_text(text).model_dump()
+            record_conversion(result["era"], result["is_valid"], channel="websocket")
+            if request_id is not None:
+                result = {"id": request_id, **result}
+            await websocket.send_text(json.dumps(result, ensure_ascii=False))
+    except WebSocketDisconnect:  # 응답을 보내는 중에 연결이 끊긴 경우
+        pass
+
+@router.get("/api/eras", tags=["API 정보"])
+async def list_eras():
+    """지원하는 연호 목록"""
+    return [
+        {
+            "code": era.code,
+            "name": era.name,
+            "hanja": era.hanja,
+            "calendar": era.calendar,
+            "first_year": era.first_year,
+            "max_year": era.max_year,
+            "aliases": list(era.aliases),
+        }
+        for era in ERAS
+    ]
+
+@router.get("/metrics", tags=["API 정보"], include_in_schema=False)
+async def metrics(request: Request):
+    """Prometheus 텍스트 형식의 지표 (여러 워커로 실행하면 모든 워커의 합계)"""
+    snapshots = request.app.state.metrics_snapshots
+    body = snapshots.render() if snapshots is not None else REGISTRY.render()
+    return PlainTextResponse(body, media_type=CONTENT_TYPE)
+
+@router.get("/api", tags=["API 정보"])
 async def root():
     """API 정보"""
     return {
         "name": "연호 변환 API",
-        "version": "1.0.0",
-        "description": "단기/일본 연호를 서기로 변환하는 API",
+        "version": API_VERSION,
+        "description": "단기/대한제국/일본 연호를 서기로 변환하는 API",
         "endpoints": {
-            "/api/convert": "연호를 서기로 변환 (POST)",
+            "/api/convert": "연호를 서기로 변환 (POST, 캐시 가능한 GET ?text=)",
+            "/api/convert/batch": "여러 연호를 한 번에 변환 (POST)",
+            "/api/convert/dates": "여러 연호 날짜(연/월/일)를 양력 날짜로 변환 (POST)",
+            "/ws/convert": "입력 중 실시간 변환 (WebSocket)",
+            "/api/eras": "지원하는 연호 목록 (GET)",
+            "/api/extract": "문서 텍스트에서 연호 표기 추출 (POST)",
+            "/api/extract/file": "텍스트 파일에서 연호 표기 스트리밍 추출 (POST)",
+            "/metrics": "요청/변환 지표 (Prometheus 텍스트 형식)",
+            "/healthz": "프로세스 동작 확인 (GET)",
+            "/readyz": "요청 처리 준비 확인 (GET)",
             "/docs": "API 문서 (Swagger UI)",
             "/redoc": "API 문서 (ReDoc)"
         }
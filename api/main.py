@@ -0,0 +1,121 @@
+"""
+연호 변환 API 앱 생성과 실행 진입점
+
+uvicorn/gunicorn에서 `api.main:app`으로 실행합니다.
+
+    python -m api --workers 4
+    gunicorn -c gunicorn.conf.py api.main:app
+
+연호 표와 연호 매처는 chrono 패키지를 임포트할 때 한 번 만들어지고,
+각 워커는 시작(lifespan) 단계에서 변환 경로를 한 번씩 실행한 뒤에 준비 완료(/readyz)가 됩니다.
+"""
+
+import time
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+
+from chrono import ERA_TABLE_VERSION, ERAS
+from chrono.dates import convert_dates
+from chrono.extract import extract_mentions
+
+from .admission import AdmissionConfig, AdmissionMiddleware
+from .chrono_api import API_VERSION, convert_text, router
+from .metrics import MetricsMiddleware, worker_snapshots
+
+def warm_up() -> int:
+    """연호마다 변환과 추출 경로를 한 번씩 실행
+    
+    첫 요청이 정규식/모델 직렬화 준비 비용을 떠안지 않도록 워커가 트래픽을 받기 전에 호출합니다.
+    
+    Returns:
+        실행한 예시 입력 수
+    """
+    samples = [f"{era.name} {era.min_year}년" for era in ERAS]
+    samples += [f"{alias}{era.min_year}年" for era in ERAS for alias in era.aliases[:1]]
+    samples.append("4300")
+    for text in samples:
+        convert_text(text).model_dump()
+    convert_dates([f"{text} 1월 1일" for text in samples])
+    extract_mentions(" ".join(samples))
+    return len(samples)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """워커 시작 시 미리 준비하고, 종료가 시작되면 준비 상태를 내림"""
+    started = time.perf_counter()
+    samples = warm_up()
+    app.state.warmup = {
+        "samples": samples,
+        "seconds": round(time.perf_counter() - started, 4),
+    }
+    
+    # 여러 워커로 실행하면 /metrics가 모든 워커의 합계를 보여주도록 스냅숏 기록
+    snapshots = worker_snapshots()
+    app.state.metrics_snapshots = snapshots
+    if snapshots is not None:
+        snapshots.start()
+    
+    app.state.ready = True
+    yield
+    app.state.ready = False
+    if snapshots is not None:
+        snapshots.stop()
+
+def create_app(admission: Optional[AdmissionConfig] = None) -> FastAPI:
+    """연호 변환 API 앱 생성
+    
+    Args:
+        admission: 수용 제어 설정 (없으면 환경 변수에서 읽음)
+    
+    Returns:
+        미들웨어와 라우트를 구성한 FastAPI 앱
+    """
+    app = FastAPI(
+        title="연호 변환 API",
+        description="단기/대한제국/일본 연호를 서기로 변환하는 API",
+        version=API_VERSION,
+        lifespan=lifespan
+    )
+    app.state.ready = False
+    app.state.metrics_snapshots = None
+    
+    # 수용 제어 (동시 처리 수/클라이언트별 요청 속도 제한, CORS 헤더가 429 응답에도 붙도록 안쪽에 둠)
+    app.add_middleware(AdmissionMiddleware, config=admission)
+    
+    # CORS 설정 추가
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],  # 모든 도메인 허용
+        allow_credentials=True,
+        allow_methods=["*"],  # 모든 HTTP 메서드 허용
+        allow_headers=["*"],  # 모든 헤더 허용
+    )
+    
+    # 요청 수/처리 시간 지표 수집
+    app.add_middleware(MetricsMiddleware)
+    
+    app.include_router(router)
+    
+    @app.get("/healthz", tags=["API 정보"], include_in_schema=False)
+    async def healthz():
+        """프로세스 동작 확인 (liveness)"""
+        return {"status": "ok"}
+    
+    @app.get("/readyz", tags=["API 정보"], include_in_schema=False)
+    async def readyz():
+        """요청 처리 준비 확인 (readiness), 준비 전이나 종료 중에는 503"""
+        if not app.state.ready:
+            return JSONResponse({"status": "not_ready"}, status_code=503)
+        return {
+            "status": "ready",
+            "era_table_version": ERA_TABLE_VERSION,
+            "warmup": app.state.warmup,
+        }
+    
+    return app
+
+app = create_app()
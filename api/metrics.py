@@ -0,0 +1,352 @@
+"""
+Prometheus 텍스트 형식의 지표 수집
+
+외부 라이브러리나 수집기 없이 프로세스 안에서 지표를 모으고 /metrics 로 노출합니다.
+여러 워커로 실행하면 지표는 워커(프로세스)별로 집계되므로, CHRONO_METRICS_DIR 환경 변수에
+공유 디렉터리를 지정하면 각 워커가 자기 지표를 파일로 기록하고 /metrics는 모든 워커의 합계를 보여줍니다.
+(gunicorn.conf.py와 python -m api는 워커가 둘 이상이면 임시 디렉터리를 자동으로 지정합니다.)
+"""
+
+import glob
+import json
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from starlette.routing import Match
+
+# 여러 워커의 지표를 합칠 공유 디렉터리를 지정하는 환경 변수
+METRICS_DIR_ENV = "CHRONO_METRICS_DIR"
+
+# 워커가 스냅숏 파일을 갱신하는 주기 (초)
+SNAPSHOT_INTERVAL = 5.0
+
+# 요청 처리 시간 구간 (초)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def _escape(value) -> str:
+    """레이블 값 이스케이프 (역슬래시, 큰따옴표, 줄바꿈)"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+def _combine(current, value):
+    """같은 레이블의 값을 더함 (히스토그램은 구간별로)"""
+    if current is None:
+        return list(value) if isinstance(value, list) else value
+    if isinstance(value, list):
+        return [a + b for a, b in zip(current, value)]
+    return current + value
+
+class _Metric:
+    """레이블별 값을 보관하는 지표 기본 클래스"""
+    kind = "untyped"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], object] = {}
+    
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+    
+    def snapshot(self) -> List[list]:
+        """현재 값 목록 [[레이블 값..., 값], ...] (JSON으로 기록할 수 있는 형태)"""
+        with self._lock:
+            return [[list(key), value] for key, value in self._values.items()]
+    
+    def render(self, values: Optional[Dict[Tuple[str, ...], object]] = None) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        if values is None:
+            with self._lock:
+                values = dict(self._values)
+        for key, value in sorted(values.items()):
+            lines.extend(self._render_sample(key, value))
+        return lines
+    
+    def _render_sample(self, key, value) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"]
+
+class Counter(_Metric):
+    """증가만 하는 지표"""
+    kind = "counter"
+    
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+    
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+class Gauge(_Metric):
+    """증가/감소하는 지표"""
+    kind = "gauge"
+    
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+    
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+    
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+    
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+class Histogram(_Metric):
+    """구간별 누적 분포 지표"""
+    kind = "histogram"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+    
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # [구간별 개수..., +Inf 구간 개수, 합계]
+                state = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            state[index] += 1
+            state[-1] += value
+    
+    def _render_sample(self, key, state) -> List[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), state[:-1]):
+            cumulative += count
+            le = 'le="' + _format_value(bound) + '"'
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+        labels = _format_labels(self.labelnames, key)
+        lines.append(f"{self.name}_sum{labels} {_format_value(state[-1])}")
+        lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+class Registry:
+    """지표 모음"""
+    
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+    
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+    
+    def snapshot(self, include_gauges: bool = True) -> Dict[str, List[list]]:
+        """지표 이름별 현재 값 (워커 스냅숏 파일에 기록)"""
+        return {
+            metric.name: metric.snapshot()
+            for metric in self._metrics
+            if include_gauges or metric.kind != "gauge"
+        }
+    
+    def render(self, snapshots: Optional[Iterable[dict]] = None) -> str:
+        """Prometheus 텍스트 형식(0.0.4)
+        
+        Args:
+            snapshots: 합산할 워커별 스냅숏 (없으면 이 프로세스의 값)
+        """
+        snapshots = list(snapshots) if snapshots is not None else None
+        lines = []
+        for metric in self._metrics:
+            values = None
+            if snapshots is not None:
+                values = {}
+                for snapshot in snapshots:
+                    for key, value in snapshot.get(metric.name, ()):
+                        values[tuple(key)] = _combine(values.get(tuple(key)), value)
+            lines.extend(metric.render(values))
+        return "\n".join(lines) + "\n"
+
+class WorkerSnapshots:
+    """여러 워커의 지표를 합치기 위한 워커별 스냅숏 파일
+    
+    각 워커는 directory/worker-<pid>.json에 자기 지표를 주기적으로, 그리고 /metrics 요청을 받을 때마다 기록합니다.
+    /metrics는 모든 파일을 합산하므로 어느 워커가 응답해도 같은 합계를 보여주고, 파일의 값은 늘어나기만 하므로
+    카운터가 줄어들지 않습니다. 종료한 워커(max_requests로 교체된 워커 등)의 카운터는 파일에 남겨 합계에 포함하고,
+    게이지는 정상 종료할 때 파일에서 뺍니다.
+    """
+    
+    def __init__(self, registry: Registry, directory: str, interval: float = SNAPSHOT_INTERVAL):
+        self.registry = registry
+        self.directory = directory
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def path(self) -> str:
+        # preload_app으로 fork된 워커도 자기 pid의 파일을 쓰도록 기록할 때마다 확인
+        return os.path.join(self.directory, f"worker-{os.getpid()}.json")
+    
+    def write(self, final: bool = False):
+        """이 워커의 스냅숏 기록 (다른 워커가 읽는 도중에도 온전한 파일이 보이도록 교체 방식으로)"""
+        path = self.path
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.registry.snapshot(include_gauges=not final), f)
+        os.replace(temp_path, path)
+    
+    def read_all(self) -> List[dict]:
+        snapshots = []
+        for path in glob.glob(os.path.join(self.directory, "worker-*.json")):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    snapshots.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return snapshots
+    
+    def render(self) -> str:
+        """모든 워커의 합계 (이 워커의 최신 값을 먼저 기록)"""
+        self.write()
+        return self.registry.render(self.read_all())
+    
+    def start(self):
+        """주기적 기록 시작 (워커 시작 시)"""
+        self.write()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="metrics-snapshot", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """주기적 기록을 멈추고 게이지를 뺀 마지막 값 기록 (워커 종료 시)"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.write(final=True)
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.write()
+            except OSError:
+                pass
+
+def prepare_multiprocess_dir(directory: Optional[str] = None) -> str:
+    """여러 워커로 실행하기 전에 스냅숏 디렉터리를 준비하고 환경 변수로 워커에 전달
+    
+    이전 실행의 스냅숏은 지웁니다.
+    
+    Args:
+        directory: 사용할 디렉터리 (없으면 CHRONO_METRICS_DIR, 그것도 없으면 새 임시 디렉터리)
+    
+    Returns:
+        준비한 디렉터리 경로
+    """
+    directory = directory or os.environ.get(METRICS_DIR_ENV) or tempfile.mkdtemp(prefix="chrono-metrics-")
+    os.makedirs(directory, exist_ok=True)
+    for path in glob.glob(os.path.join(directory, "worker-*.json*")):
+        os.remove(path)
+    os.environ[METRICS_DIR_ENV] = directory
+    return directory
+
+def worker_snapshots() -> Optional[WorkerSnapshots]:
+    """CHRONO_METRICS_DIR가 지정되어 있으면 이 프로세스의 스냅숏 기록기"""
+    directory = os.environ.get(METRICS_DIR_ENV)
+    return WorkerSnapshots(REGISTRY, directory) if directory else None
+
+REGISTRY = Registry()
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+REQUESTS = REGISTRY.register(Counter(
+    "chrono_http_requests_total", "HTTP 요청 수", ("method", "route", "status")
+))
+REQUEST_LATENCY = REGISTRY.register(Histogram(
+    "chrono_http_request_duration_seconds", "HTTP 요청 처리 시간(초)", ("method", "route")
+))
+IN_FLIGHT = REGISTRY.register(Gauge(
+    "chrono_http_requests_in_flight", "처리 중인 HTTP 요청 수"
+))
+IN_FLIGHT.set(0)
+CONVERSIONS = REGISTRY.register(Counter(
+    "chrono_conversions_total",
+    "연호 변환 결과 수 (outcome: success, format_error, out_of_range / channel: http, websocket)",
+    ("era", "outcome", "channel"),
+))
+
+def record_conversion(era: Optional[str], is_valid: bool, channel: str = "http"):
+    """연호 변환 결과 기록
+    
+    연호를 인식하지 못하면 format_error, 인식했지만 유효 기간 밖이면 out_of_range로 기록합니다.
+    입력 중 실시간 변환(WebSocket)은 키 입력마다 기록되므로 channel로 구분합니다.
+    """
+    if is_valid:
+        outcome = "success"
+    elif era:
+        outcome = "out_of_range"
+    else:
+        outcome = "format_error"
+    CONVERSIONS.inc(era=era or "none", outcome=outcome, channel=channel)
+
+def route_label(scope) -> str:
+    """지표 레이블로 쓸 라우트 템플릿 (예: /api/convert), 해당 라우트가 없으면 "unmatched"
+    
+    수용 제어의 429처럼 라우팅 전에 응답한 요청은 scope에 라우트가 없으므로 앱의 라우트와 직접 대조합니다.
+    """
+    route = scope.get("route")
+    if route is None:
+        for candidate in getattr(scope.get("app"), "routes", ()):
+            match, _ = candidate.matches(scope)
+            if match == Match.FULL:
+                route = candidate
+                break
+    return getattr(route, "path", None) or "unmatched"
+
+class MetricsMiddleware:
+    """요청 수, 처리 시간, 처리 중인 요청 수를 기록하는 ASGI 미들웨어
+    
+    경로는 실제 URL 대신 라우트 템플릿(예: /api/convert)으로 기록해 레이블 수가 늘어나지 않게 합니다.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        status_code = 500
+        
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            IN_FLIGHT.dec()
+            route = route_label(scope)
+            REQUESTS.inc(method=scope["method"], route=route, status=status_code)
+            REQUEST_LATENCY.observe(elapsed, method=scope["method"], route=route)
@@ -1,10 +1,10 @@
 # app.py
 
 import streamlit as st
-import yaml
-from yaml.loader import SafeLoader
-import streamlit_authenticator as stauth
-from components.ui import section, card, info_box, header
+from components.auth import login, logout
+from components.profiling import profile_stage
+from components.startup import apply_styles, begin_page, finish_page
+from components.ui import section, card, info_box, header, render_html, sidebar
 
 # 페이지 설정
 st.set_page_config(
@@ -14,43 +14,15 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# CSS 스타일 적용
-def load_css(css_file):
-    with open(css_file, encoding='utf-8') as f:
-        return f"<style>{f.read()}</style>"
+# 재실행 시간 측정 시작 (?profile=1 일 때 단계별 프로파일링)
+begin_page("홈")
 
-# 타이포그래피 스타일 적용
-st.markdown(load_css("styles/typography.css"), unsafe_allow_html=True)
+# 타이포그래피 스타일 적용 (프로세스당 한 번만 파일을 읽음)
+apply_styles()
 
-# 세션 상태 초기화
-if 'authentication_status' not in st.session_state:
-    st.session_state['authentication_status'] = None
-if 'name' not in st.session_state:
-    st.session_state['name'] = None
-if 'username' not in st.session_state:
-    st.session_state['username'] = None
-
-# Streamlit Secrets에서 인증 설정 로드
-credentials = {
-    'usernames': st.secrets['credentials']['usernames']
-}
-
-cookie = {
-    'expiry_days': st.secrets['cookie']['expiry_days'],
-    'key': st.secrets['cookie']['key'],
-    'name': st.secrets['cookie']['name']
-}
-
-# 인증 객체 생성
-authenticator = stauth.Authenticate(
-    credentials,
-    cookie['name'],
-    cookie['key'],
-    cookie['expiry_days']
-)
-
-# 로그인 위젯 표시
-name, authentication_status, username = authenticator.login('로그인', 'main')
+# 로그인 위젯 표시 (인증 설정은 프로세스당 한 번만 읽고, 로그인한 세션은 인증 객체를 다시 만들지 않음)
+with profile_stage("인증"):
+    name, authentication_status, username = login('로그인', 'main')
 
 if authentication_status == False:
     st.error('아이디나 비밀번호가 올바르지 않습니다.')
@@ -58,36 +30,12 @@ elif authentication_status == None:
     st.warning('아이디와 비밀번호를 입력하세요.')
 else:
     # 사이드바 구성
-    with st.sidebar:
-        st.image("https://via.placeholder.com/150x50.png?text=Logo", use_column_width=True)
-        st.divider()
-        
+    def user_section():
         # 사용자 정보 표시
         st.markdown(f"### 👤 {st.session_state['name']}님 환영합니다!")
-        authenticator.logout('로그아웃', 'sidebar')
-        
-        st.divider()
-        st.markdown("### 🧰 도구 모음")
-        st.markdown("현재 사용 가능한 도구:")
-        current_page = "홈"
-        
-        menu_items = {
-            "🏠 홈": "홈",
-            "📅 연호 변환기": "연호 변환기",
-            "🔜 추가 예정": "추가 예정"
-        }
-        
-        for label, page in menu_items.items():
-            if page == current_page:
-                st.markdown(f"**{label}** ←")
-            else:
-                st.markdown(label)
-        
-        st.divider()
-        st.markdown("### ℹ️ 정보")
-        st.markdown("버전: 1.0.0")
-        st.markdown("[사용 설명서]()")
-        st.markdown("[피드백 보내기]()")
+        logout('로그아웃', 'sidebar')
+    
+    sidebar("홈", user_section)
 
     # 헤더
     header(
@@ -171,7 +119,12 @@ else:
     st.divider()
     col1, col2, col3 = st.columns([2,1,2])
     with col2:
-        st.markdown('<div class="footer-text" style="text-align: center;">', unsafe_allow_html=True)
-        st.markdown("Made with ❤️ for 경상북도교육청")
-        st.markdown('<div class="version-text">버전: 1.0.0</div>', unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True) 
\ No newline at end of file
+        render_html(
+            '<div class="footer-text" style="text-align: center;">',
+            '<p>Made with ❤️ for 경상북도교육청</p>',
+            '<div class="version-text">버전: 1.0.0</div>',
+            '</div>'
+        )
+
+# 재실행 시간 기록 및 프로파일 패널 (프로파일링이 켜져 있을 때만 표시)
+finish_page()
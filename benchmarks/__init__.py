@@ -0,0 +1,3 @@
+"""
+연호 변환 성능 측정 도구
+"""
@@ -0,0 +1,150 @@
+"""
+기록물 대장 형태의 합성 데이터 생성기
+
+실제 대장과 비슷한 비율로 단기/일본 연호/대한제국 연호 표기, 빈 값, 판독 불가 값,
+사업 대상 기간(~2002년) 이후의 연도, 연호 유효 기간 밖의 연도(오기)를 섞어 만듭니다.
+같은 seed는 항상 같은 데이터를 만듭니다.
+
+    python -m benchmarks.ledger --rows 100000 --output ledger.csv
+"""
+
+import argparse
+import csv
+import random
+from typing import Callable, Dict, List, Optional, Tuple
+
+# 값 종류별 비율
+DEFAULT_MIX: Dict[str, float] = {
+    "dangi": 0.45,
+    "japanese": 0.25,
+    "korean_empire": 0.03,
+    "number_only": 0.10,
+    "blank": 0.07,
+    "junk": 0.05,
+    "out_of_scope": 0.03,
+    "out_of_range": 0.02,
+}
+
+_HANJA_DIGITS = "〇一二三四五六七八九"
+_JUNK = ["미상", "불명", "연도미상", "19??", "4ㅇ93", "-", "?", "단기", "쇼와년", "N/A", "판독불가", "1950년대"]
+_DEPARTMENTS = ["학무과", "총무과", "서무과", "교육지원과", "재무과", "시설과", "장학사실"]
+_TITLES = ["학교 설립 인가", "교원 인사 발령", "학적부", "졸업 대장", "교사 신축 공사", "예산 결산서", "직원 복무 철"]
+
+def _hanja_number(number: int) -> str:
+    """한자 숫자 표기 (예: 40 → 四十)"""
+    tens, ones = divmod(number, 10)
+    text = ""
+    if tens:
+        text += ("" if tens == 1 else _HANJA_DIGITS[tens]) + "十"
+    if ones or not text:
+        text += _HANJA_DIGITS[ones]
+    return text
+
+def _dangi(rng: random.Random) -> str:
+    year = rng.randint(4243, 4335)  # 1910-2002
+    return rng.choice([f"단기 {year}년", f"단기{year}", f"단기 {year}", f"檀紀 {year}年"])
+
+def _japanese(rng: random.Random) -> str:
+    era, max_year = rng.choice([("메이지", 45), ("다이쇼", 15), ("쇼와", 20), ("쇼와", 64)])
+    hanja = {"메이지": "明治", "다이쇼": "大正", "쇼와": "昭和"}[era]
+    korean = {"메이지": "명치", "다이쇼": "대정", "쇼와": "소화"}[era]
+    year = rng.randint(1, max_year)
+    return rng.choice([
+        f"{era} {year}년",
+        f"{era}{year}년",
+        f"{korean} {year}년",
+        f"{hanja} {year}年",
+        f"{hanja}{_hanja_number(year)}年" if year > 1 else f"{hanja}元年",
+        f"{hanja}{str(year).translate(str.maketrans('0123456789', '０１２３４５６７８９'))}年",
+    ])
+
+def _korean_empire(rng: random.Random) -> str:
+    era, hanja, max_year = rng.choice([("광무", "光武", 11), ("융희", "隆熙", 4)])
+    year = rng.randint(1, max_year)
+    return rng.choice([f"{era} {year}년", f"{hanja} {year}年"])
+
+def _number_only(rng: random.Random) -> str:
+    year = rng.randint(4243, 4335)
+    return rng.choice([str(year), f"{year}년"])
+
+def _blank(rng: random.Random) -> Optional[str]:
+    return rng.choice([None, "", " "])
+
+def _junk(rng: random.Random) -> str:
+    return rng.choice(_JUNK)
+
+def _out_of_scope(rng: random.Random) -> str:
+    """변환은 되지만 사업 대상 기간(~2002년) 이후인 연도 (2003-2024)"""
+    return rng.choice([
+        f"헤이세이 {rng.randint(15, 31)}년",
+        f"平成 {rng.randint(15, 31)}年",
+        f"레이와 {rng.randint(1, 6)}년",
+        f"令和 {rng.randint(1, 6)}年",
+    ])
+
+def _out_of_range(rng: random.Random) -> str:
+    """연호 유효 기간을 넘는 연도 (오기, 변환 실패)"""
+    return rng.choice([
+        f"단기 {rng.randint(4336, 4360)}년",
+        f"메이지 {rng.randint(46, 60)}년",
+        f"다이쇼 {rng.randint(16, 20)}년",
+        f"융희 {rng.randint(5, 9)}년",
+    ])
+
+_GENERATORS: Dict[str, Callable[[random.Random], Optional[str]]] = {
+    "dangi": _dangi,
+    "japanese": _japanese,
+    "korean_empire": _korean_empire,
+    "number_only": _number_only,
+    "blank": _blank,
+    "junk": _junk,
+    "out_of_scope": _out_of_scope,
+    "out_of_range": _out_of_range,
+}
+
+def generate_years(rows: int, seed: int = 0, mix: Dict[str, float] = None) -> List[Optional[str]]:
+    """생산년도 칼럼 값 목록 생성
+    
+    Args:
+        rows (int): 행 수
+        seed (int): 난수 시드
+        mix (Dict[str, float]): 값 종류별 비율 (기본값 DEFAULT_MIX)
+        
+    Returns:
+        List[Optional[str]]: 생산년도 값 (빈 값은 None 또는 공백 문자열)
+    """
+    rng = random.Random(seed)
+    mix = mix or DEFAULT_MIX
+    kinds = list(mix)
+    weights = [mix[kind] for kind in kinds]
+    chosen = rng.choices(kinds, weights=weights, k=rows)
+    return [_GENERATORS[kind](rng) for kind in chosen]
+
+def generate_ledger(rows: int, seed: int = 0, mix: Dict[str, float] = None) -> List[Tuple[int, str, Optional[str], str]]:
+    """기록물 대장 행 (번호, 제목, 생산년도, 생산부서) 생성"""
+    rng = random.Random(seed + 1)
+    years = generate_years(rows, seed, mix)
+    return [
+        (number, f"{rng.choice(_TITLES)} {number}", year, rng.choice(_DEPARTMENTS))
+        for number, year in enumerate(years, start=1)
+    ]
+
+def write_ledger_csv(path: str, rows: int, seed: int = 0, mix: Dict[str, float] = None):
+    """기록물 대장을 CSV(UTF-8 BOM) 파일로 저장"""
+    with open(path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["번호", "제목", "생산년도", "생산부서"])
+        writer.writerows(generate_ledger(rows, seed, mix))
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 기록물 대장 생성")
+    parser.add_argument("--rows", type=int, default=10_000, help="행 수")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    parser.add_argument("--output", default="ledger.csv", help="저장할 CSV 경로")
+    args = parser.parse_args()
+    
+    write_ledger_csv(args.output, args.rows, args.seed)
+    print(f"{args.rows:,}행을 {args.output}에 저장했습니다.")
+
+if __name__ == "__main__":
+    main()
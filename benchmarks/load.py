@@ -0,0 +1,232 @@
+"""
+연호 변환 API 부하 테스트
+
+로컬에서 uvicorn으로 API를 띄운 뒤 비동기 HTTP 클라이언트(httpx)로 동시 요청을 보내
+초당 처리량과 지연 시간 분포(p50/p95/p99)를 측정합니다. 외부 서비스는 필요하지 않습니다.
+
+    python -m benchmarks.load --concurrency 1 8 32 --duration 10
+    python -m benchmarks.load --endpoint batch --batch-size 500 --workers 4 --output load.json
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, List
+
+try:
+    import httpx
+except ImportError:  # 부하 테스트 전용 의존성
+    httpx = None
+
+from .ledger import generate_years
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 처리량을 재기 위해 수용 제어 한도를 풀어 둠 (환경 변수로 직접 지정하면 그 값을 사용)
+ADMISSION_DEFAULTS = {
+    "CHRONO_API_RATE": "0",
+    "CHRONO_API_MAX_IN_FLIGHT": "100000",
+}
+
+# 연결 실패 후 다시 요청하기 전 대기 시간 (실패가 이어지면 두 배씩 늘려 최대값까지)
+RETRY_BACKOFF = 0.05
+RETRY_BACKOFF_MAX = 1.0
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(fraction * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+class LocalServer:
+    """부하 테스트 동안 실행되는 로컬 uvicorn 프로세스"""
+    
+    def __init__(self, app: str, workers: int = 1, host: str = "127.0.0.1", port: int = None):
+        self.app = app
+        self.workers = workers
+        self.host = host
+        self.port = port or _free_port()
+        self.process = None
+    
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+    
+    def start(self, timeout: float = 30.0):
+        """서버를 시작하고 준비 완료(/readyz)될 때까지 대기"""
+        self.process = subprocess.Popen(
+            [
+                sys.executable, "-m", "uvicorn", self.app,
+                "--host", self.host,
+                "--port", str(self.port),
+                "--workers", str(self.workers),
+                "--log-level", "warning",
+            ],
+            cwd=PROJECT_ROOT,
+            env={**ADMISSION_DEFAULTS, **os.environ},
+        )
+        
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"서버가 시작되지 않았습니다. (종료 코드 {self.process.returncode})")
+            try:
+                if httpx.get(f"{self.base_url}/readyz", timeout=1.0).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            time.sleep(0.2)
+        self.stop()
+        raise RuntimeError(f"{timeout:.0f}초 안에 서버가 응답하지 않았습니다.")
+    
+    def stop(self):
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+    
+    def __enter__(self):
+        self.start()
+        return self
+    
+    def __exit__(self, *exc):
+        self.stop()
+
+async def _drive(base_url: str, endpoint: str, concurrency: int, duration: float,
+                 texts: List[str], batch_size: int) -> Dict[str, float]:
+    """concurrency개의 작업자가 duration초 동안 쉬지 않고 요청"""
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    errors = 0
+    conversions = 0
+    cycle = itertools.cycle(texts)
+    
+    if endpoint == "batch":
+        path = "/api/convert/batch"
+        make_payload = lambda: {"texts": [next(cycle) for _ in range(batch_size)]}
+        per_request = batch_size
+    else:
+        path = "/api/convert"
+        make_payload = lambda: {"text": next(cycle)}
+        per_request = 1
+    
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        deadline = time.perf_counter() + duration
+        
+        async def worker():
+            nonlocal errors, conversions
+            backoff = RETRY_BACKOFF
+            while time.perf_counter() < deadline:
+                payload = make_payload()
+                started = time.perf_counter()
+                try:
+                    response = await client.post(path, json=payload)
+                except httpx.HTTPError:
+                    # 서버가 죽었거나 연결을 받지 못하면 쉬지 않고 재시도하지 않도록 대기
+                    errors += 1
+                    await asyncio.sleep(min(backoff, max(deadline - time.perf_counter(), 0)))
+                    backoff = min(backoff * 2, RETRY_BACKOFF_MAX)
+                    continue
+                backoff = RETRY_BACKOFF
+                latencies.append(time.perf_counter() - started)
+                statuses[response.status_code] += 1
+                if response.status_code == 200:
+                    conversions += per_request
+                else:
+                    errors += 1
+        
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    
+    latencies.sort()
+    return {
+        "endpoint": endpoint,
+        "concurrency": concurrency,
+        "seconds": elapsed,
+        "requests": len(latencies),
+        "errors": errors,
+        "status_codes": {str(code): count for code, count in sorted(statuses.items())},
+        "requests_per_sec": len(latencies) / elapsed if elapsed else 0.0,
+        "conversions_per_sec": conversions / elapsed if elapsed else 0.0,
+        "latency_ms_mean": statistics.fmean(latencies) * 1000 if latencies else 0.0,
+        "latency_ms_p50": _percentile(latencies, 0.50) * 1000,
+        "latency_ms_p95": _percentile(latencies, 0.95) * 1000,
+        "latency_ms_p99": _percentile(latencies, 0.99) * 1000,
+        "latency_ms_max": latencies[-1] * 1000 if latencies else 0.0,
+    }
+
+def run_load_test(args) -> dict:
+    """서버를 띄우고 동시 요청 수별로 측정한 결과"""
+    texts = [value or "" for value in generate_years(10_000, args.seed)]
+    endpoints = ["single", "batch"] if args.endpoint == "both" else [args.endpoint]
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "app": args.app,
+        "workers": args.workers,
+        "duration": args.duration,
+        "batch_size": args.batch_size,
+        "results": [],
+    }
+    
+    with LocalServer(args.app, args.workers) as server:
+        for endpoint in endpoints:
+            # 첫 요청의 지연(임포트, 캐시 생성)이 결과에 섞이지 않도록 예열
+            asyncio.run(_drive(server.base_url, endpoint, 1, args.warmup, texts, args.batch_size))
+            for concurrency in args.concurrency:
+                result = asyncio.run(
+                    _drive(server.base_url, endpoint, concurrency, args.duration, texts, args.batch_size)
+                )
+                report["results"].append(result)
+                print(
+                    f"{endpoint:>6} 동시 {concurrency:>4}  {result['requests_per_sec']:>9,.0f}요청/초  "
+                    f"{result['conversions_per_sec']:>10,.0f}변환/초  "
+                    f"p50 {result['latency_ms_p50']:>7.2f}ms  p95 {result['latency_ms_p95']:>7.2f}ms  "
+                    f"p99 {result['latency_ms_p99']:>7.2f}ms  오류 {result['errors']:,}",
+                    file=sys.stderr
+                )
+    return report
+
+def main():
+    parser = argparse.ArgumentParser(description="연호 변환 API 부하 테스트")
+    parser.add_argument("--app", default="api.main:app", help="uvicorn 앱 경로")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn 워커 수")
+    parser.add_argument("--endpoint", choices=["single", "batch", "both"], default="both", help="요청할 엔드포인트")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 128], help="동시 요청 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="동시 요청 수별 측정 시간(초)")
+    parser.add_argument("--warmup", type=float, default=2.0, help="예열 시간(초)")
+    parser.add_argument("--batch-size", type=int, default=100, help="일괄 요청당 연호 수")
+    parser.add_argument("--seed", type=int, default=0, help="합성 데이터 난수 시드")
+    parser.add_argument("--output", help="결과 JSON 저장 경로 (없으면 표준 출력)")
+    args = parser.parse_args()
+    
+    if httpx is None:
+        parser.exit(1, "httpx가 필요합니다: pip install httpx\n")
+    
+    report = run_load_test(args)
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+연호 변환 핵심 로직 성능 측정
+
+단건(parse_year_input + convert_to_segi), 일괄(batch_convert), 배열(convert_many), 파일(CSV 읽기 + 일괄 변환)
+경로의 값당 지연 시간, 초당 처리 행 수, 최대 메모리 사용량을 측정해 JSON으로 저장합니다.
+이전 결과 파일과 비교하면 변경 전후의 속도 차이를 확인할 수 있습니다.
+
+    python -m benchmarks.run --sizes 10000 100000 --output bench.json
+    python -m benchmarks.run --sizes 10000 --compare bench.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+from chrono import ERA_TABLE_VERSION, convert_to_segi, parse_year_input
+from chrono.batch import batch_convert, convert_many
+
+from .ledger import generate_years, write_ledger_csv
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+
+# 값당 지연 시간을 개별 측정할 최대 표본 수
+LATENCY_SAMPLE = 20_000
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(fraction * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+def _peak_memory(func: Callable[[], object]) -> int:
+    """func 실행 중 파이썬 할당 최대치 (바이트)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+def _clear_caches():
+    """캐시를 비워 처음 보는 값 기준으로 측정"""
+    parse_year_input.cache_clear()
+
+def _convert_one(value, parse=parse_year_input):
+    if value is None:
+        return None
+    era, year = parse(str(value).strip())
+    return convert_to_segi(era, year) if era and year else None
+
+def bench_single(values: List[Optional[str]]) -> Dict[str, float]:
+    """단건 변환: 값마다 parse_year_input + convert_to_segi 호출"""
+    _clear_caches()
+    sample = values[:LATENCY_SAMPLE]
+    latencies = []
+    clock = time.perf_counter_ns
+    for value in sample:
+        started = clock()
+        _convert_one(value)
+        latencies.append(clock() - started)
+    latencies.sort()
+    
+    # 캐시를 거치지 않은 파서 자체의 지연 시간
+    uncached = []
+    for value in sample:
+        started = clock()
+        _convert_one(value, parse_year_input.__wrapped__)
+        uncached.append(clock() - started)
+    uncached.sort()
+    
+    _clear_caches()
+    started = time.perf_counter()
+    for value in values:
+        _convert_one(value)
+    elapsed = time.perf_counter() - started
+    
+    _clear_caches()
+    peak = _peak_memory(lambda: [_convert_one(value) for value in values])
+    return {
+        "seconds": elapsed,
+        "rows_per_sec": len(values) / elapsed if elapsed else 0.0,
+        "latency_ns_mean": statistics.fmean(latencies) if latencies else 0.0,
+        "latency_ns_p50": _percentile(latencies, 0.50),
+        "latency_ns_p95": _percentile(latencies, 0.95),
+        "latency_ns_p99": _percentile(latencies, 0.99),
+        "uncached_latency_ns_p50": _percentile(uncached, 0.50),
+        "uncached_latency_ns_p99": _percentile(uncached, 0.99),
+        "peak_bytes": peak,
+    }
+
+def bench_batch(values: List[Optional[str]], convert: Callable = batch_convert) -> Dict[str, float]:
+    """일괄 변환: batch_convert(또는 convert_many) 한 번 호출"""
+    _clear_caches()
+    started = time.perf_counter()
+    convert(values)
+    elapsed = time.perf_counter() - started
+    
+    _clear_caches()
+    peak = _peak_memory(lambda: convert(values))
+    return {
+        "seconds": elapsed,
+        "rows_per_sec": len(values) / elapsed if elapsed else 0.0,
+        "latency_ns_mean": elapsed * 1e9 / len(values) if values else 0.0,
+        "peak_bytes": peak,
+    }
+
+def bench_file(rows: int, seed: int) -> Optional[Dict[str, float]]:
+    """파일 변환: CSV 읽기(pandas) + 생산년도 칼럼 일괄 변환 (pandas가 없으면 건너뜀)"""
+    try:
+        import pandas as pd
+    except ImportError:
+        return None
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "ledger.csv")
+        write_ledger_csv(path, rows, seed)
+        
+        def run():
+            df = pd.read_csv(path)
+            return batch_convert(df["생산년도"])
+        
+        _clear_caches()
+        started = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - started
+        
+        _clear_caches()
+        peak = _peak_memory(run)
+        return {
+            "seconds": elapsed,
+            "rows_per_sec": rows / elapsed if elapsed else 0.0,
+            "latency_ns_mean": elapsed * 1e9 / rows if rows else 0.0,
+            "peak_bytes": peak,
+            "file_bytes": os.path.getsize(path),
+        }
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_benchmarks(sizes, seed: int = 0, cases=("single", "batch", "array", "file")) -> dict:
+    """크기별로 각 경로를 측정한 결과"""
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_revision": _git_revision(),
+        "era_table_version": ERA_TABLE_VERSION,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "seed": seed,
+        "results": [],
+    }
+    
+    for size in sizes:
+        values = generate_years(size, seed)
+        for case in cases:
+            if case == "single":
+                metrics = bench_single(values)
+            elif case == "batch":
+                metrics = bench_batch(values)
+            elif case == "array":
+                metrics = bench_batch(values, convert_many)
+            else:
+                metrics = bench_file(size, seed)
+            if metrics is None:
+                continue
+            report["results"].append({"case": case, "rows": size, **metrics})
+            print(
+                f"{case:>6} {size:>10,}행  {metrics['rows_per_sec']:>12,.0f}행/초  "
+                f"평균 {metrics['latency_ns_mean'] / 1000:>8.2f}µs  "
+                f"최대 메모리 {metrics['peak_bytes'] / 1024 / 1024:>8.1f}MiB",
+                file=sys.stderr
+            )
+    return report
+
+def compare(report: dict, baseline: dict):
+    """이전 결과 대비 초당 처리 행 수 비율 출력"""
+    previous = {(item["case"], item["rows"]): item for item in baseline.get("results", [])}
+    print(f"비교 기준: {baseline.get('git_revision')} ({baseline.get('timestamp')})", file=sys.stderr)
+    for item in report["results"]:
+        before = previous.get((item["case"], item["rows"]))
+        if not before or not before["rows_per_sec"]:
+            continue
+        ratio = item["rows_per_sec"] / before["rows_per_sec"]
+        print(f"{item['case']:>6} {item['rows']:>10,}행  {ratio:>6.2f}배", file=sys.stderr)
+
+def main():
+    parser = argparse.ArgumentParser(description="연호 변환 성능 측정")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="측정할 행 수")
+    parser.add_argument("--cases", nargs="+", default=["single", "batch", "array", "file"],
+                        choices=["single", "batch", "array", "file"], help="측정할 경로")
+    parser.add_argument("--seed", type=int, default=0, help="합성 데이터 난수 시드")
+    parser.add_argument("--output", help="결과 JSON 저장 경로 (없으면 표준 출력)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    args = parser.parse_args()
+    
+    report = run_benchmarks(args.sizes, args.seed, args.cases)
+    
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(report, json.load(f))
+    
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+"""
+연호 변환 핵심 로직 패키지
+
+Streamlit/FastAPI에 의존하지 않으며, API와 페이지가 같은 연호 표와 파서를 사용합니다.
+"""
+
+from .eras import (
+    Era,
+    EraIndex,
+    ERAS,
+    ERAS_BY_CODE,
+    ERAS_BY_NAME,
+    ERA_INDEX,
+    ERA_TABLE_VERSION,
+    OPEN_ERA_MAX_SEGI_YEAR,
+    PROJECT_MAX_YEAR,
+)
+from .parser import (
+    convert_to_segi,
+    is_valid_year,
+    is_within_project_scope,
+    normalize_input,
+    parse_numeral,
+    parse_year_input,
+)
@@ -0,0 +1,69 @@
+from collections import deque
+from typing import Dict, Generic, Iterator, List, Tuple, TypeVar
+
+V = TypeVar("V")
+
+class AhoCorasick(Generic[V]):
+    """여러 문자열 패턴을 한 번의 순회로 찾는 Aho-Corasick 오토마톤
+    
+    연호 별칭(한글/한자/가나 표기)이 늘어나도 검색 시간은 입력 길이에만 비례합니다.
+    """
+    
+    def __init__(self, patterns: Dict[str, V]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # 각 상태에서 끝나는 패턴 목록 (길이, 값) — 긴 패턴 우선
+        self._output: List[List[Tuple[int, V]]] = [[]]
+        
+        for pattern, value in patterns.items():
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append((len(pattern), value))
+        
+        self.max_length = max((len(pattern) for pattern in patterns), default=0)
+        self._build_failure_links()
+    
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                candidate = self._goto[fail].get(char, 0)
+                self._fail[next_state] = candidate if candidate != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+        
+        for outputs in self._output:
+            outputs.sort(key=lambda output: -output[0])
+    
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, V]]:
+        """text에서 찾은 모든 패턴을 (시작 위치, 끝 위치, 값)으로 반환 (끝 위치 순)"""
+        state = 0
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length, value in output[state]:
+                yield index + 1 - length, index + 1, value
+    
+    def find_all(self, text: str) -> List[Tuple[int, int, V]]:
+        """겹치는 후보 중 왼쪽에서 시작하는 가장 긴 패턴 순으로 정렬된 검색 결과"""
+        matches = list(self.iter_matches(text))
+        matches.sort(key=lambda match: (match[0], -(match[1] - match[0])))
+        return matches
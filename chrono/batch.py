@@ -0,0 +1,213 @@
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .eras import ERAS, ERAS_BY_NAME
+from .parser import convert_to_segi, is_within_project_scope, parse_year_input
+
+# convert_many 상태 코드
+STATUS_OK = 0            # 변환 성공
+STATUS_MISSING = 1       # 빈 값 (None, NaN, 공백 문자열)
+STATUS_FORMAT_ERROR = 2  # 연호/연도를 인식하지 못함
+STATUS_OUT_OF_RANGE = 3  # 연호는 인식했지만 유효 기간 밖의 연도
+STATUS_OUT_OF_SCOPE = 4  # 변환은 되었지만 사업 대상 기간(PROJECT_MAX_YEAR)을 넘음
+
+STATUS_LABELS = {
+    STATUS_OK: "success",
+    STATUS_MISSING: "missing",
+    STATUS_FORMAT_ERROR: "format_error",
+    STATUS_OUT_OF_RANGE: "out_of_range",
+    STATUS_OUT_OF_SCOPE: "out_of_scope",
+}
+
+# 서기 연도 배열 자료형과 변환하지 못한 행의 값
+SEGI_YEAR_DTYPE = np.dtype(np.int64)
+INVALID_YEAR = int(np.iinfo(SEGI_YEAR_DTYPE).min)
+_MAX_SEGI_YEAR = int(np.iinfo(SEGI_YEAR_DTYPE).max)
+
+# pandas.factorize로 바로 분해해도 서로 다른 자료형의 같은 값(1, 1.0, True)이 합쳐지지 않는 배열 종류 (infer_dtype)
+_HOMOGENEOUS_KINDS = frozenset({"empty", "string", "integer", "floating", "boolean"})
+
+# 연호 코드 배열 자료형 (가장 긴 코드에 맞춘 고정 길이 유니코드, 인식하지 못하면 빈 문자열)
+ERA_CODE_DTYPE = np.dtype(f"<U{max(len(era.code) for era in ERAS)}")
+
+def is_missing(value) -> bool:
+    """빈 값 여부 (None, NaN, NaT, pandas.NA)"""
+    if value is None:
+        return True
+    try:
+        return bool(value != value)
+    except TypeError:  # pandas.NA
+        return True
+
+@dataclass
+class BatchResult:
+    """일괄 변환 결과
+    
+    Attributes:
+        results (List[Optional[int]]): 행별 서기 연도 (변환 실패/빈 값은 None)
+        original_values (List[Optional[str]]): 행별 원본 값 (빈 값은 None)
+        out_of_scope (List[Tuple[int, str, int]]): 사업 대상 기간을 넘는 (행 위치, 원본 값, 서기 연도)
+    """
+    results: List[Optional[int]] = field(default_factory=list)
+    original_values: List[Optional[str]] = field(default_factory=list)
+    out_of_scope: List[Tuple[int, str, int]] = field(default_factory=list)
+
+def batch_convert(values: Iterable) -> BatchResult:
+    """여러 값의 연호를 일괄 변환
+    
+    Args:
+        values (Iterable): 변환할 값 (데이터프레임 칼럼 등)
+        
+    Returns:
+        BatchResult: 입력 순서와 같은 순서의 변환 결과
+    """
+    batch = BatchResult()
+    results = batch.results
+    original_values = batch.original_values
+    
+    for idx, value in enumerate(values):
+        if is_missing(value):  # 빈 값 처리
+            results.append(None)
+            original_values.append(None)
+            continue
+        
+        value = str(value).strip()
+        era, year = parse_year_input(value)
+        segi_year = convert_to_segi(era, year) if era and year else None
+        
+        if segi_year and not is_within_project_scope(segi_year):
+            batch.out_of_scope.append((idx, value, segi_year))
+        results.append(segi_year or None)
+        original_values.append(value)
+    
+    return batch
+
+@dataclass
+class ConversionArrays:
+    """convert_many 결과 (모든 배열은 입력과 같은 길이, 같은 순서)
+    
+    Attributes:
+        segi_years (np.ndarray): int64 서기 연도 (변환하지 못한 행은 INVALID_YEAR)
+        era_codes (np.ndarray): 연호 코드 (예: "dangi", "showa", 인식하지 못한 행은 빈 문자열)
+        status (np.ndarray): int8 상태 코드 (STATUS_*)
+    """
+    segi_years: np.ndarray
+    era_codes: np.ndarray
+    status: np.ndarray
+    
+    @property
+    def converted(self) -> np.ndarray:
+        """서기 연도가 있는 행 (성공 + 사업 대상 기간 초과)"""
+        return (self.status == STATUS_OK) | (self.status == STATUS_OUT_OF_SCOPE)
+
+def _missing_mask(values: np.ndarray) -> np.ndarray:
+    """object 배열의 빈 값(None, NaN, NaT, pandas.NA) 위치"""
+    try:
+        # NaN/NaT는 자기 자신과 같지 않음
+        return np.asarray((values != values) | (values == None), dtype=bool)  # noqa: E711
+    except TypeError:  # pandas.NA는 비교 결과가 bool이 아님
+        return np.fromiter((is_missing(value) for value in values), dtype=bool, count=len(values))
+
+def _object_array(values) -> np.ndarray:
+    """입력을 1차원 object 배열로 변환 (원소는 변환하지 않음)"""
+    if hasattr(values, "to_numpy"):  # pandas.Series/Index
+        return values.to_numpy(dtype=object)
+    if isinstance(values, np.ndarray):
+        return values.ravel().astype(object)
+    if not isinstance(values, (list, tuple)):
+        values = list(values)
+    # np.array는 리스트 원소를 차원으로 펼치므로 Series를 거쳐 원소를 그대로 담음
+    return pd.Series(values, dtype=object).to_numpy()
+
+def _factorize_typed(values: list) -> Tuple[list, np.ndarray]:
+    """자료형이 섞인 값의 분해 (1, 1.0, True는 서로 같은 키로 합쳐지지만 문자열로는 다르므로 자료형까지 키에 넣음)"""
+    keys = list(zip(map(type, values), values))
+    try:
+        positions = dict.fromkeys(keys)
+    except TypeError:  # 해시할 수 없는 값은 문자열로 비교
+        values = [str(value) for value in values]
+        keys = list(zip(map(type, values), values))
+        positions = dict.fromkeys(keys)
+    
+    uniques = [value for _, value in positions]
+    for idx, key in enumerate(list(positions)):
+        positions[key] = idx
+    inverse = np.fromiter(map(positions.__getitem__, keys), dtype=np.intp, count=len(keys))
+    return uniques, inverse
+
+def factorize(values) -> Tuple[list, np.ndarray]:
+    """값을 서로 다른 값 목록과 행별 번호로 분해
+    
+    값이 모두 같은 자료형(문자열, 정수, 실수, 불리언, 빈 값)이면 pandas.factorize의 해시 테이블로
+    행마다 파이썬 코드를 실행하지 않고 분해합니다. 자료형이 섞인 드문 경우만 (자료형, 값)을 키로 분해합니다.
+    
+    Args:
+        values: 분해할 값 (시퀀스, pandas.Series, NumPy 배열)
+        
+    Returns:
+        Tuple[list, np.ndarray]: (처음 나온 순서의 서로 다른 값, 행별 서로 다른 값 번호)
+    """
+    objects = _object_array(values)
+    if pd.api.types.infer_dtype(objects, skipna=True) in _HOMOGENEOUS_KINDS:
+        # 빈 값(None/NaN)도 서로 다른 값 하나로 남겨 unique_strings에서 빈 값으로 판정
+        inverse, uniques = pd.factorize(objects, use_na_sentinel=False)
+        return uniques.tolist(), inverse.astype(np.intp, copy=False)
+    return _factorize_typed(objects.tolist())
+
+def unique_strings(values) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """서로 다른 값을 앞뒤 공백을 제거한 유니코드 배열로 변환
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (서로 다른 값 문자열, 빈 값 여부, 행별 서로 다른 값 번호)
+    """
+    uniques, inverse = factorize(values)
+    objects = np.empty(len(uniques), dtype=object)
+    objects[:] = uniques
+    
+    missing = _missing_mask(objects)
+    strings = objects.astype(str) if len(objects) else np.zeros(0, dtype=str)
+    strings[missing] = ""
+    strings = np.char.strip(strings)
+    return strings, missing | (strings == ""), inverse
+
+def convert_many(values) -> ConversionArrays:
+    """여러 값의 연호를 배열 단위로 일괄 변환
+    
+    서로 다른 값마다 한 번만 파싱하고(factorize), 결과를 원래 위치로 펼칩니다.
+    반복되는 값이 많은 기록물 대장은 행 수가 아니라 서로 다른 값의 수만큼만 파서를 호출합니다.
+    
+    Args:
+        values: 변환할 값 (문자열 시퀀스, pandas.Series, NumPy 배열)
+        
+    Returns:
+        ConversionArrays: 입력 순서와 같은 순서의 서기 연도, 연호 코드, 상태 코드 배열
+    """
+    unique, missing, inverse = unique_strings(values)
+    unique_years = np.full(len(unique), INVALID_YEAR, dtype=SEGI_YEAR_DTYPE)
+    unique_codes = np.zeros(len(unique), dtype=ERA_CODE_DTYPE)
+    unique_status = np.full(len(unique), STATUS_FORMAT_ERROR, dtype=np.int8)
+    
+    for idx, text in enumerate(unique.tolist()):
+        if missing[idx]:
+            unique_status[idx] = STATUS_MISSING
+            continue
+        era, year = parse_year_input(text)
+        if not era or not year:
+            continue
+        unique_codes[idx] = ERAS_BY_NAME[era].code
+        segi_year = convert_to_segi(era, year)
+        # 배열에 담을 수 없는 연도는 예외 대신 유효 기간 밖으로 처리 (한 값 때문에 전체가 실패하지 않도록)
+        if segi_year is None or not INVALID_YEAR < segi_year <= _MAX_SEGI_YEAR:
+            unique_status[idx] = STATUS_OUT_OF_RANGE
+            continue
+        unique_years[idx] = segi_year
+        unique_status[idx] = STATUS_OK if is_within_project_scope(segi_year) else STATUS_OUT_OF_SCOPE
+    
+    return ConversionArrays(
+        segi_years=unique_years[inverse],
+        era_codes=unique_codes[inverse],
+        status=unique_status[inverse],
+    )
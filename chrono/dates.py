@@ -0,0 +1,297 @@
+import re
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .batch import (
+    ERA_CODE_DTYPE,
+    INVALID_YEAR,
+    SEGI_YEAR_DTYPE,
+    STATUS_FORMAT_ERROR,
+    STATUS_MISSING,
+    STATUS_OK,
+    STATUS_OUT_OF_RANGE,
+    STATUS_LABELS,
+    STATUS_OUT_OF_SCOPE,
+    factorize,
+    unique_strings,
+)
+from .eras import ERA_INDEX, ERAS, PROJECT_MAX_YEAR
+from .parser import match_era_year, normalize_input, parse_numeral
+
+# convert_dates 전용 상태 코드 (나머지는 chrono.batch의 STATUS_*와 같음)
+STATUS_ERA_MISMATCH = 5  # 날짜가 표기된 연호의 시행 기간 밖 (예: 메이지 45년 7월 30일 → 다이쇼 원년)
+STATUS_LUNAR = 6         # 음력을 쓰던 시기의 월/일이라 양력 날짜로 바꿀 수 없음
+
+DATE_STATUS_LABELS = {
+    **STATUS_LABELS,
+    STATUS_ERA_MISMATCH: "era_mismatch",
+    STATUS_LUNAR: "lunar",
+}
+
+# 날짜 정밀도
+PRECISION_NONE = 0
+PRECISION_YEAR = 1
+PRECISION_MONTH = 2
+PRECISION_DAY = 3
+
+# 양력 시행일 (이전의 월/일 표기는 음력)
+# 일본: 메이지 5년 12월 3일(음력) = 1873년 1월 1일, 한국: 건양 원년(1896년) 1월 1일
+SOLAR_CALENDAR_START = {
+    "japan": date(1873, 1, 1),
+    "korea": date(1896, 1, 1),
+    "dangi": date(1896, 1, 1),
+}
+
+# 연호 연도 다음의 월/일 (예: 7월 30일, 八月, 十二月 廿五日)
+_MONTH_DAY_REGEX = re.compile(
+    r"\s*(?:(\d{1,2}|[〇一二三四五六七八九十]{1,3})\s*[월月]"
+    r"(?:\s*(\d{1,2}|[〇一二三四五六七八九十廿卅]{1,4})\s*[일日])?)?"
+)
+
+# 연호 없이 숫자 연도로 시작하는 날짜는 단기로 간주 (예: 4293년 4월 19일)
+_NUMBER_DATE_REGEX = re.compile(r"^\s*(\d+)\s*[년年]" + _MONTH_DAY_REGEX.pattern + r"\s*$")
+_NUMBER_ONLY_REGEX = re.compile(r"^\s*(\d+)\s*$")
+_NUMBER_YEAR_REGEX = re.compile(r"^\s*\d+\s*[년年]?\s*$")
+
+# 연호 순서(ERAS 위치)별 배열
+_ERA_CODES = np.array([era.code for era in ERAS], dtype=ERA_CODE_DTYPE)
+_ERA_FIRST_YEAR = np.array([era.first_year for era in ERAS], dtype=np.int64)
+_ERA_MIN_YEAR = np.array([era.min_year for era in ERAS], dtype=np.int64)
+_ERA_MAX_YEAR = np.array([era.year_limit for era in ERAS], dtype=np.int64)
+# 어느 연호의 마지막 연도보다도 큰 연도 (더 큰 연도는 이 값으로 줄여 int64 배열에 담고 유효 기간 밖으로 처리)
+_YEAR_CEILING = int(_ERA_MAX_YEAR.max()) + 1
+_ERA_POSITION = {era.name: idx for idx, era in enumerate(ERAS)}
+
+_EARLIEST = np.datetime64("-9999-01-01", "D")
+_LATEST = np.datetime64("9999-12-31", "D")
+
+def _era_span(era) -> Tuple[np.datetime64, np.datetime64]:
+    """연호의 시행 기간 [개원일, 폐지일 또는 다음 연호 개원일) (개원일이 없으면 제한 없음)"""
+    if not era.start:
+        return _EARLIEST, _LATEST
+    end = era.end or ERA_INDEX.next_start(era)
+    if end is None:
+        end = date(era.last_year + 1, 1, 1) if era.last_year is not None else None
+    return np.datetime64(era.start, "D"), np.datetime64(end, "D") if end else _LATEST
+
+_ERA_SPANS = [_era_span(era) for era in ERAS]
+_ERA_START = np.array([start for start, _ in _ERA_SPANS], dtype="datetime64[D]")
+_ERA_END = np.array([end for _, end in _ERA_SPANS], dtype="datetime64[D]")
+_ERA_HAS_START = np.array([era.start is not None for era in ERAS])
+_ERA_SOLAR_START = np.array(
+    [SOLAR_CALENDAR_START.get(era.calendar, date(1, 1, 1)) for era in ERAS], dtype="datetime64[D]"
+)
+
+def _boundary_tables():
+    """계열별 개원일 경계표 (정렬된 개원일 배열, ERAS 위치 배열)"""
+    tables = {}
+    for calendar in {era.calendar for era in ERAS}:
+        starts, members = ERA_INDEX.date_table(calendar)
+        if starts:
+            tables[calendar] = (
+                np.array(starts, dtype="datetime64[D]"),
+                np.array([_ERA_POSITION[era.name] for era in members], dtype=np.int64),
+            )
+    return tables
+
+_BOUNDARIES = _boundary_tables()
+_ERA_CALENDAR = np.array([era.calendar for era in ERAS])
+
+@lru_cache(maxsize=65536)
+def parse_date_input(text: str) -> Tuple[Optional[str], Optional[int], Optional[int], Optional[int]]:
+    """입력 텍스트에서 연호, 연도, 월, 일을 추출
+    
+    Args:
+        text (str): 입력 텍스트 (예: "메이지 45년 7월 30일", "다이쇼 원년 8월", "昭和 二年 三月")
+    
+    Returns:
+        Tuple: (연호 표준 표기, 연도, 월, 일), 월/일이 없으면 None, 파싱 실패시 모두 None
+    """
+    text = normalize_input(text)
+    
+    found = match_era_year(text)
+    if found:
+        era, year, end = found
+        match = _MONTH_DAY_REGEX.match(text, end)
+        return era.name, year, parse_numeral(match.group(1)), parse_numeral(match.group(2))
+    
+    # 숫자만 있는 경우 단기로 간주
+    match = _NUMBER_DATE_REGEX.match(text)
+    if match:
+        return "단기", int(match.group(1)), parse_numeral(match.group(2)), parse_numeral(match.group(3))
+    match = _NUMBER_ONLY_REGEX.match(text)
+    if match:
+        return "단기", int(match.group(1)), None, None
+    
+    return None, None, None, None
+
+@dataclass
+class DateConversionArrays:
+    """convert_dates 결과 (모든 배열은 입력과 같은 길이, 같은 순서)
+    
+    Attributes:
+        dates (np.ndarray): datetime64[D] 양력 날짜 (월/일이 없으면 1월/1일, 변환하지 못하면 NaT)
+        iso (np.ndarray): 정밀도에 맞춘 ISO 8601 표기 (예: "1912-07-30", "1912-08", "1912", 실패는 빈 문자열)
+        precision (np.ndarray): int8 정밀도 (PRECISION_YEAR, PRECISION_MONTH, PRECISION_DAY)
+        segi_years (np.ndarray): int64 서기 연도 (변환하지 못한 행은 INVALID_YEAR)
+        era_codes (np.ndarray): 표기된 연호 코드
+        resolved_era_codes (np.ndarray): 날짜에 실제로 시행 중이던 연호 코드
+        status (np.ndarray): int8 상태 코드 (chrono.batch.STATUS_*, STATUS_ERA_MISMATCH, STATUS_LUNAR)
+    """
+    dates: np.ndarray
+    iso: np.ndarray
+    precision: np.ndarray
+    segi_years: np.ndarray
+    era_codes: np.ndarray
+    resolved_era_codes: np.ndarray
+    status: np.ndarray
+    
+    @property
+    def converted(self) -> np.ndarray:
+        """양력 날짜가 있는 행 (성공 + 사업 대상 기간 초과 + 연호 경계 불일치)"""
+        return ~np.isnat(self.dates)
+
+def _parse_unique(strings: np.ndarray, missing: np.ndarray):
+    """서로 다른 값을 파싱해 (연호 위치, 연도, 월, 일) 배열로 반환
+    
+    날짜가 모두 달라도 연도 부분과 월/일 부분은 각각 반복되므로, 첫 '년/年'을 기준으로 나눠
+    서로 다른 연도 부분과 월/일 부분만 파싱한 뒤 합칩니다.
+    """
+    parts = np.char.partition(np.char.replace(strings, "年", "년"), "년")
+    heads = np.where(parts[:, 1] != "", np.char.add(parts[:, 0], "년"), parts[:, 0])
+    head_uniques, head_inverse = factorize(heads)
+    tail_uniques, tail_inverse = factorize(parts[:, 2])
+    
+    head_count = len(head_uniques)
+    head_eras = np.full(head_count, -1, dtype=np.int64)
+    head_years = np.zeros(head_count, dtype=np.int64)
+    head_months = np.zeros(head_count, dtype=np.int64)
+    head_days = np.zeros(head_count, dtype=np.int64)
+    head_bare = np.zeros(head_count, dtype=bool)
+    for idx, head in enumerate(head_uniques):
+        era, year, month, day = parse_date_input(head)
+        if not era or not year:
+            continue
+        head_eras[idx] = _ERA_POSITION[era]
+        head_years[idx] = min(year, _YEAR_CEILING)
+        head_months[idx] = month or 0
+        head_days[idx] = day or 0
+        head_bare[idx] = _NUMBER_YEAR_REGEX.match(head) is not None
+    
+    tail_count = len(tail_uniques)
+    tail_months = np.zeros(tail_count, dtype=np.int64)
+    tail_days = np.zeros(tail_count, dtype=np.int64)
+    tail_complete = np.zeros(tail_count, dtype=bool)
+    for idx, tail in enumerate(tail_uniques):
+        tail = normalize_input(tail)
+        match = _MONTH_DAY_REGEX.match(tail)
+        tail_months[idx] = parse_numeral(match.group(1)) or 0
+        tail_days[idx] = parse_numeral(match.group(2)) or 0
+        tail_complete[idx] = match.end() == len(tail)
+    
+    era_positions = head_eras[head_inverse]
+    years = head_years[head_inverse]
+    months = np.where(head_months[head_inverse] > 0, head_months[head_inverse], tail_months[tail_inverse])
+    days = np.where(head_days[head_inverse] > 0, head_days[head_inverse], tail_days[tail_inverse])
+    
+    # 연호 없는 숫자 연도는 월/일 뒤에 다른 글자가 없을 때만 단기로 간주 (parse_date_input과 같은 규칙)
+    rejected = missing | (head_bare[head_inverse] & ~tail_complete[tail_inverse])
+    era_positions[rejected] = -1
+    return era_positions, years, months, days
+
+def _resolve_eras(dates: np.ndarray, era_positions: np.ndarray) -> np.ndarray:
+    """개원일 경계표를 이분 탐색(searchsorted)해 날짜에 시행 중이던 연호 위치를 찾음"""
+    resolved = np.full(len(dates), -1, dtype=np.int64)
+    calendars = _ERA_CALENDAR[era_positions]
+    for calendar, (starts, positions) in _BOUNDARIES.items():
+        mask = calendars == calendar
+        if not mask.any():
+            continue
+        index = np.searchsorted(starts, dates[mask], side="right") - 1
+        found = positions[np.maximum(index, 0)]
+        inside = (index >= 0) & (dates[mask] < _ERA_END[found])
+        resolved[mask] = np.where(inside, found, -1)
+    return resolved
+
+def convert_dates(values) -> DateConversionArrays:
+    """여러 값의 연호 날짜를 배열 단위로 일괄 변환
+    
+    연/월/일(원년 포함)을 서로 다른 연도 부분과 월/일 부분마다 한 번만 파싱한 뒤, 날짜 계산과 연호 경계 검사는
+    NumPy 배열 연산으로 처리합니다. 월까지 있으면 표기된 연호의 시행 기간과 겹치는지,
+    일까지 있으면 그 날 시행 중이던 연호가 맞는지 확인합니다.
+    양력 시행 이전(일본 1873년, 한국 1896년)의 월/일은 음력이므로 날짜를 만들지 않습니다.
+    
+    Args:
+        values: 변환할 값 (문자열 시퀀스, pandas.Series, NumPy 배열)
+    
+    Returns:
+        DateConversionArrays: 입력 순서와 같은 순서의 날짜, ISO 표기, 연호, 상태 코드 배열
+    """
+    strings, missing, inverse = unique_strings(values)
+    era_positions, years, months, days = _parse_unique(strings, missing)
+    
+    parsed = era_positions >= 0
+    era_positions = np.where(parsed, era_positions, 0)
+    year_valid = parsed & (years >= _ERA_MIN_YEAR[era_positions]) & (years <= _ERA_MAX_YEAR[era_positions])
+    segi = np.where(year_valid, _ERA_FIRST_YEAR[era_positions] + years - 1, 1970)
+    
+    precision = np.where(days > 0, PRECISION_DAY, np.where(months > 0, PRECISION_MONTH, PRECISION_YEAR))
+    precision = np.where(parsed, precision, PRECISION_NONE).astype(np.int8)
+    
+    # 월/일 범위 검사 (월의 일수는 다음 달 1일과의 차이)
+    month_valid = (months == 0) | ((months >= 1) & (months <= 12))
+    month_index = (segi - 1970) * 12 + np.where(month_valid & (months > 0), months - 1, 0)
+    month_start = month_index.astype("datetime64[M]")
+    first_day = month_start.astype("datetime64[D]")
+    next_month = (month_start + 1).astype("datetime64[D]")
+    days_in_month = (next_month - first_day).astype(np.int64)
+    day_valid = (days == 0) | ((days >= 1) & (days <= days_in_month) & (months > 0))
+    valid = year_valid & month_valid & day_valid
+    
+    dates = first_day + np.where(days > 0, days - 1, 0)
+    year_start = (segi - 1970).astype("datetime64[Y]")
+    period_start = np.where(precision == PRECISION_YEAR, year_start.astype("datetime64[D]"), dates)
+    period_end = np.select(
+        [precision == PRECISION_DAY, precision == PRECISION_MONTH],
+        [dates + 1, next_month],
+        (year_start + 1).astype("datetime64[D]"),
+    )
+    
+    # 연호 경계: 기간이 표기된 연호의 시행 기간과 겹치지 않으면 실제 시행 연호를 찾음
+    overlaps = (period_start < _ERA_END[era_positions]) & (period_end > _ERA_START[era_positions])
+    mismatch = valid & (precision >= PRECISION_MONTH) & _ERA_HAS_START[era_positions] & ~overlaps
+    resolved = np.where(mismatch, _resolve_eras(dates, era_positions), era_positions)
+    
+    lunar = valid & (precision >= PRECISION_MONTH) & (dates < _ERA_SOLAR_START[era_positions])
+    
+    status = np.select(
+        [missing, ~parsed, ~valid, lunar, mismatch, segi > PROJECT_MAX_YEAR],
+        [STATUS_MISSING, STATUS_FORMAT_ERROR, STATUS_OUT_OF_RANGE, STATUS_LUNAR, STATUS_ERA_MISMATCH, STATUS_OUT_OF_SCOPE],
+        STATUS_OK,
+    ).astype(np.int8)
+    has_date = valid & ~lunar
+    
+    # 정밀도에 맞춘 ISO 표기 (날짜가 있는 행만 변환)
+    iso = np.zeros(len(dates), dtype="<U16")
+    for level, unit, values in (
+        (PRECISION_DAY, "D", dates),
+        (PRECISION_MONTH, "M", month_start),
+        (PRECISION_YEAR, "Y", year_start),
+    ):
+        mask = has_date & (precision == level)
+        iso[mask] = np.datetime_as_string(values[mask], unit=unit)
+    unique_dates = np.where(has_date, dates, np.datetime64("NaT"))
+    
+    return DateConversionArrays(
+        dates=unique_dates[inverse],
+        iso=iso[inverse],
+        precision=precision[inverse],
+        segi_years=np.where(valid, segi, INVALID_YEAR).astype(SEGI_YEAR_DTYPE)[inverse],
+        era_codes=np.where(parsed, _ERA_CODES[era_positions], "").astype(ERA_CODE_DTYPE)[inverse],
+        resolved_era_codes=np.where(valid & (resolved >= 0), _ERA_CODES[np.maximum(resolved, 0)], "").astype(ERA_CODE_DTYPE)[inverse],
+        status=status[inverse],
+    )
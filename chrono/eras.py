@@ -0,0 +1,153 @@
+import hashlib
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+# 사업 대상 기간의 마지막 서기 연도
+PROJECT_MAX_YEAR = 2002
+
+# 현재 사용 중인 연호(레이와)가 유효한 마지막 서기 연도 (날짜 변환이 다루는 4자리 연도까지)
+OPEN_ERA_MAX_SEGI_YEAR = 9999
+
+@dataclass(frozen=True)
+class Era:
+    """연호 정보
+    
+    Attributes:
+        code (str): 영문 식별자 (예: "meiji")
+        name (str): 표준 표기 (예: "메이지")
+        hanja (str): 한자 표기 (예: "明治")
+        calendar (str): 연호 계열 ("dangi", "korea", "japan")
+        first_year (int): 원년(1년)에 해당하는 서기 연도
+        max_year (Optional[int]): 마지막 연도 (None이면 현재 사용 중, 유효 범위는 year_limit)
+        start (Optional[date]): 개원일 (양력, 날짜 단위 변환에 사용)
+        aliases (Tuple[str, ...]): 표준 표기 외의 한글/한자/가나 표기
+        min_year (int): 첫 연도
+        end (Optional[date]): 다음 연호 없이 폐지된 날 (양력, 이 날 전까지 시행)
+    """
+    code: str
+    name: str
+    hanja: str
+    calendar: str
+    first_year: int
+    max_year: Optional[int]
+    start: Optional[date] = None
+    aliases: Tuple[str, ...] = ()
+    min_year: int = 1
+    end: Optional[date] = None
+    
+    @property
+    def last_year(self) -> Optional[int]:
+        """마지막 연도에 해당하는 서기 연도"""
+        if self.max_year is None:
+            return None
+        return self.first_year + self.max_year - 1
+    
+    @property
+    def year_limit(self) -> int:
+        """유효한 마지막 연도 (현재 사용 중인 연호는 서기 OPEN_ERA_MAX_SEGI_YEAR년까지)"""
+        if self.max_year is None:
+            return OPEN_ERA_MAX_SEGI_YEAR - self.first_year + 1
+        return self.max_year
+    
+    def to_segi(self, year: int) -> int:
+        """연호 연도를 서기 연도로 변환"""
+        return self.first_year + year - 1
+    
+    def is_valid(self, year: int) -> bool:
+        """연호별 유효 기간 검증"""
+        return self.min_year <= year <= self.year_limit
+
+def _katakana(hiragana: str) -> str:
+    """히라가나 표기를 가타카나로 변환"""
+    return "".join(chr(ord(char) + 0x60) if "ぁ" <= char <= "ゖ" else char for char in hiragana)
+
+def _japanese(code, name, hanja, first_year, max_year, start, korean=(), kana="", extra=()):
+    """일본 연호 (한자/가나/한국식 독음 표기 포함)"""
+    aliases = (hanja, *korean, *extra)
+    if kana:
+        aliases += (kana, _katakana(kana))
+    return Era(code, name, hanja, "japan", first_year, max_year, start, aliases)
+
+# 연호 표
+# - 단기는 사업 대상 기간(서기 2002년 = 단기 4335년)까지만 유효합니다.
+# - 일본 연호는 한국 기록물에 쓰인 덴포(天保) 이후 연호를 다룹니다.
+#   메이지 이전 연호의 한국식 독음(예: 안정, 문구)은 일반 낱말과 겹치므로 별칭에서 제외합니다.
+# - 1873년(일본)/1896년(한국) 이전은 음력을 사용했으므로 개원일은 양력 환산일입니다.
+# - 다음 연호 없이 끝난 연호는 폐지일(end)을 둡니다. (융희: 1910년 8월 29일 국권 피탈)
+ERAS: Tuple[Era, ...] = (
+    Era("dangi", "단기", "檀紀", "dangi", -2332, PROJECT_MAX_YEAR + 2333, aliases=("檀紀", "단군기원")),
+    Era("gaeguk", "개국", "開國", "korea", 1392, 504, aliases=("開國", "開国")),
+    Era("geonyang", "건양", "建陽", "korea", 1896, 2, date(1896, 1, 1), aliases=("建陽",)),
+    Era("gwangmu", "광무", "光武", "korea", 1897, 11, date(1897, 8, 17), aliases=("光武",)),
+    Era("yunghui", "융희", "隆熙", "korea", 1907, 4, date(1907, 8, 12), aliases=("隆熙", "륭희"), end=date(1910, 8, 29)),
+    _japanese("tenpo", "덴포", "天保", 1830, 15, date(1831, 1, 23), kana="てんぽう", extra=("텐포",)),
+    _japanese("koka", "고카", "弘化", 1844, 5, date(1845, 1, 9), kana="こうか"),
+    _japanese("kaei", "가에이", "嘉永", 1848, 7, date(1848, 4, 1), kana="かえい"),
+    _japanese("ansei", "안세이", "安政", 1854, 7, date(1855, 1, 15), kana="あんせい"),
+    _japanese("manen", "만엔", "万延", 1860, 2, date(1860, 4, 8), kana="まんえん", extra=("萬延",)),
+    _japanese("bunkyu", "분큐", "文久", 1861, 4, date(1861, 3, 29), kana="ぶんきゅう"),
+    _japanese("genji", "겐지", "元治", 1864, 2, date(1864, 3, 27), kana="げんじ"),
+    _japanese("keio", "게이오", "慶応", 1865, 4, date(1865, 5, 1), kana="けいおう", extra=("慶應",)),
+    _japanese("meiji", "메이지", "明治", 1868, 45, date(1868, 10, 23), ("명치",), "めいじ", ("㍾",)),
+    _japanese("taisho", "다이쇼", "大正", 1912, 15, date(1912, 7, 30), ("대정",), "たいしょう", ("㍽",)),
+    _japanese("showa", "쇼와", "昭和", 1926, 64, date(1926, 12, 25), ("소화",), "しょうわ", ("㍼",)),
+    _japanese("heisei", "헤이세이", "平成", 1989, 31, date(1989, 1, 8), ("평성",), "へいせい", ("㍻",)),
+    _japanese("reiwa", "레이와", "令和", 2019, None, date(2019, 5, 1), (), "れいわ", ("㋿",)),
+)
+
+ERAS_BY_NAME: Dict[str, Era] = {era.name: era for era in ERAS}
+ERAS_BY_CODE: Dict[str, Era] = {era.code: era for era in ERAS}
+
+# 모든 표기 → 연호 (표기는 NFKC 정규화 후 비교)
+ERA_ALIASES: Dict[str, Era] = {}
+for _era in ERAS:
+    for _alias in (_era.name, *_era.aliases):
+        ERA_ALIASES.setdefault(_alias, _era)
+
+# 연호 표가 바뀌면 달라지는 버전 문자열 (캐시 무효화용)
+ERA_TABLE_VERSION = hashlib.sha256(repr(ERAS).encode("utf-8")).hexdigest()[:12]
+
+class EraIndex:
+    """연호 계열별로 정렬된 구간 색인
+    
+    개원 연도/개원일을 정렬해 두고 이분 탐색(bisect)으로 서기 연도나 날짜에
+    해당하는 연호를 찾습니다. 연호 수가 늘어나도 조회 비용은 O(log n)입니다.
+    """
+    
+    def __init__(self, eras: Tuple[Era, ...] = ERAS):
+        self._by_year: Dict[str, Tuple[List[int], List[Era]]] = {}
+        self._by_date: Dict[str, Tuple[List[int], List[Era]]] = {}
+        
+        for calendar in {era.calendar for era in eras}:
+            members = sorted((era for era in eras if era.calendar == calendar), key=lambda era: era.first_year)
+            self._by_year[calendar] = ([era.first_year for era in members], members)
+            
+            dated = sorted((era for era in members if era.start), key=lambda era: era.start)
+            self._by_date[calendar] = ([era.start.toordinal() for era in dated], dated)
+    
+    def eras_for_year(self, segi_year: int, calendar: str) -> List[Era]:
+        """서기 연도에 사용된 연호 목록 (개원한 해에는 이전 연호와 새 연호 모두)"""
+        starts, members = self._by_year.get(calendar, ([], []))
+        position = bisect_right(starts, segi_year)
+        found = []
+        for era in members[max(position - 2, 0):position]:
+            if era.last_year is None or segi_year <= era.last_year:
+                found.append(era)
+        return found
+    
+    def date_table(self, calendar: str) -> Tuple[List[date], List[Era]]:
+        """연호 계열의 개원일 경계표 (개원일 오름차순의 개원일 목록, 연호 목록)"""
+        _, members = self._by_date.get(calendar, ([], []))
+        return [era.start for era in members], list(members)
+    
+    def next_start(self, era: Era) -> Optional[date]:
+        """같은 계열에서 다음 연호의 개원일 (없으면 None)"""
+        starts, members = self._by_date.get(era.calendar, ([], []))
+        position = bisect_right(starts, era.start.toordinal()) if era.start else 0
+        if position < len(members):
+            return members[position].start
+        return None
+
+ERA_INDEX = EraIndex()
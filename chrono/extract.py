@@ -0,0 +1,111 @@
+import re
+from dataclasses import asdict, dataclass
+from typing import Iterable, Iterator, List, Optional
+
+from .parser import ERA_MATCHER, parse_numeral
+from .eras import PROJECT_MAX_YEAR
+
+# 연호 다음의 연도 표기 (문서 추출용, 길이를 제한해 청크 경계 처리 범위를 고정)
+_MENTION_NUMERAL_REGEX = re.compile(
+    r"\s{0,8}(\d{1,5}(?!\d)|[〇零一二三四五六七八九十百千廿卅]{1,8}|원(?=\s{0,3}년)|元(?=\s{0,3}[年년]))(?:\s{0,3}[년年])?"
+)
+
+# 한 번의 연호 표기가 차지할 수 있는 최대 길이 (연호 + 공백 + 숫자 + 년)
+MAX_MENTION_LENGTH = ERA_MATCHER.max_length + 32
+
+@dataclass(frozen=True)
+class EraMention:
+    """문서에서 찾은 연호 표기
+    
+    Attributes:
+        start (int): 원문에서의 시작 위치 (문자 단위)
+        end (int): 원문에서의 끝 위치
+        text (str): 원문 표기 (예: "소화 12년")
+        era (str): 연호 표준 표기
+        year (int): 연호 연도
+        segi_year (Optional[int]): 서기 연도 (연호 유효 기간 밖이면 None)
+        in_scope (bool): 사업 대상 기간(~2002년) 여부
+    """
+    start: int
+    end: int
+    text: str
+    era: str
+    year: int
+    segi_year: Optional[int]
+    in_scope: bool
+    
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+def _scan(text: str, offset: int, limit: int) -> Iterator[EraMention]:
+    """text에서 시작 위치가 limit 미만인 연호 표기를 겹치지 않게 찾음"""
+    last_end = 0
+    for begin, end, era in ERA_MATCHER.iter_matches(text):
+        if begin < last_end or begin >= limit:
+            continue
+        match = _MENTION_NUMERAL_REGEX.match(text, end)
+        if not match:
+            continue
+        year = parse_numeral(match.group(1))
+        if not year:
+            continue
+        
+        segi_year = era.to_segi(year) if era.is_valid(year) else None
+        last_end = match.end()
+        yield EraMention(
+            start=offset + begin,
+            end=offset + last_end,
+            text=text[begin:last_end],
+            era=era.name,
+            year=year,
+            segi_year=segi_year,
+            in_scope=segi_year is not None and segi_year <= PROJECT_MAX_YEAR,
+        )
+
+def iter_mentions(chunks: Iterable[str]) -> Iterator[EraMention]:
+    """텍스트 조각 스트림에서 연호 표기를 한 번의 순회로 찾음
+    
+    조각 경계에 걸친 표기를 놓치지 않도록 마지막 MAX_MENTION_LENGTH 글자만
+    다음 조각과 이어 붙여 다시 검사합니다. 보관하는 텍스트는 조각 하나와
+    경계 구간뿐이므로 입력 크기와 관계없이 메모리 사용량이 일정합니다.
+    
+    Args:
+        chunks (Iterable[str]): 텍스트 조각 (예: 파일을 일정 크기씩 읽은 값)
+        
+    Returns:
+        Iterator[EraMention]: 원문 위치 순서의 연호 표기
+    """
+    buffer = ""
+    offset = 0
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buffer += chunk
+        
+        # 끝부분은 다음 조각에서 이어질 수 있으므로 시작 위치가 limit 이전인 표기만 확정
+        limit = len(buffer) - MAX_MENTION_LENGTH
+        if limit <= 0:
+            continue
+        
+        keep_from = limit
+        for mention in _scan(buffer, offset, limit):
+            keep_from = max(keep_from, mention.end - offset)
+            yield mention
+        
+        buffer = buffer[keep_from:]
+        offset += keep_from
+    
+    if buffer:
+        yield from _scan(buffer, offset, len(buffer))
+
+def extract_mentions(text: str) -> List[EraMention]:
+    """문자열 전체에서 연호 표기를 찾음"""
+    return list(_scan(text, 0, len(text)))
+
+def iter_text_chunks(stream, chunk_size: int = 1 << 16) -> Iterator[str]:
+    """텍스트 파일 객체를 chunk_size 글자씩 읽음"""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
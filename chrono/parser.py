@@ -0,0 +1,137 @@
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Optional
+
+from .automaton import AhoCorasick
+from .eras import ERA_ALIASES, ERAS_BY_NAME, PROJECT_MAX_YEAR, Era
+
+# 한자 숫자
+_HANJA_DIGITS = {"〇": 0, "零": 0, "一": 1, "二": 2, "三": 3, "四": 4, "五": 5, "六": 6, "七": 7, "八": 8, "九": 9}
+_HANJA_UNITS = {"十": 10, "百": 100, "千": 1000}
+_HANJA_TENS = {"廿": 20, "卅": 30}
+
+# 연호 다음에 오는 연도 (아라비아 숫자, 한자 숫자, 원년/元年)
+NUMERAL_PATTERN = (
+    r"(\d+|[〇零一二三四五六七八九十百千廿卅]+|원(?=\s*년)|元(?=\s*[年년]))\s*[년年]?"
+)
+_NUMERAL_REGEX = re.compile(r"\s*" + NUMERAL_PATTERN)
+
+# 숫자만 있는 경우 단기로 간주
+_NUMBER_ONLY_REGEX = re.compile(r"^\s*(\d+)\s*[년年]?\s*$")
+
+# 모든 연호 표기(한글/한자/가나)를 한 번에 찾는 오토마톤
+# 정규화 전 원문(문서 추출)과 NFKC 정규화 후 입력 모두에서 찾을 수 있도록 두 형태를 함께 등록
+ERA_MATCHER = AhoCorasick({
+    form: era
+    for alias, era in ERA_ALIASES.items()
+    for form in (alias, unicodedata.normalize("NFKC", alias))
+})
+
+def normalize_input(text: str) -> str:
+    """입력 정규화 (전각 숫자/공백, ㍻ 같은 합자 연호를 NFKC로 통일)"""
+    return unicodedata.normalize("NFKC", text).strip()
+
+def parse_numeral(token: str) -> Optional[int]:
+    """아라비아/전각 숫자, 한자 숫자(四十, 一九, 廿三), 원년 표기를 정수로 변환
+    
+    Args:
+        token (str): 숫자 표기
+        
+    Returns:
+        Optional[int]: 정수 또는 해석할 수 없으면 None
+    """
+    if not token:
+        return None
+    if token.isdecimal():
+        return int(token)
+    if token in ("원", "元"):
+        return 1
+    
+    # 자릿수 단위 없이 나열된 한자 숫자 (예: 一九 → 19)
+    if all(char in _HANJA_DIGITS for char in token):
+        return int("".join(str(_HANJA_DIGITS[char]) for char in token))
+    
+    total = 0
+    current = None
+    for char in token:
+        if char in _HANJA_DIGITS:
+            current = _HANJA_DIGITS[char]
+        elif char in _HANJA_UNITS:
+            total += (1 if current is None else current) * _HANJA_UNITS[char]
+            current = None
+        elif char in _HANJA_TENS:
+            total += _HANJA_TENS[char]
+            current = None
+        else:
+            return None
+    return total + (current or 0)
+
+def match_era_year(text: str, start: int = 0) -> Optional[tuple[Era, int, int]]:
+    """text[start:]에서 처음 나오는 '연호 + 연도' 표기를 찾음
+    
+    Returns:
+        Optional[tuple[Era, int, int]]: (연호, 연도, 표기 끝 위치) 또는 None
+    """
+    for begin, end, era in ERA_MATCHER.find_all(text[start:] if start else text):
+        match = _NUMERAL_REGEX.match(text, start + end)
+        if match:
+            year = parse_numeral(match.group(1))
+            if year is not None:
+                return era, year, match.end()
+    return None
+
+@lru_cache(maxsize=65536)
+def parse_year_input(text: str) -> tuple[Optional[str], Optional[int]]:
+    """입력 텍스트에서 연호와 연도를 추출
+    
+    Args:
+        text (str): 입력 텍스트 (예: "단기 4356", "메이지 3년", "明治 四十年", "光武 9年")
+        
+    Returns:
+        tuple[Optional[str], Optional[int]]: (연호 표준 표기, 연도) 또는 파싱 실패시 (None, None)
+    """
+    text = normalize_input(text)
+    
+    found = match_era_year(text)
+    if found:
+        era, year, _ = found
+        return era.name, year
+    
+    # 숫자만 있는 경우 단기로 간주
+    number_match = _NUMBER_ONLY_REGEX.match(text)
+    if number_match:
+        return "단기", int(number_match.group(1))
+    
+    return None, None
+
+def is_valid_year(era: str, year: int) -> bool:
+    """연호별 유효 기간 검증
+    
+    Args:
+        era (str): 연호 표준 표기 (예: "단기", "메이지", "광무")
+        year (int): 연도
+        
+    Returns:
+        bool: 유효한 연도인지 여부
+    """
+    era_info = ERAS_BY_NAME.get(era)
+    return era_info is not None and era_info.is_valid(year)
+
+def convert_to_segi(era: str, year: int) -> Optional[int]:
+    """연호와 연도를 서기로 변환
+    
+    Args:
+        era (str): 연호 표준 표기 (예: "단기", "메이지", "광무")
+        year (int): 연도
+        
+    Returns:
+        Optional[int]: 서기 연도 또는 변환 실패시 None
+    """
+    if not is_valid_year(era, year):
+        return None
+    return ERAS_BY_NAME[era].to_segi(year)
+
+def is_within_project_scope(segi_year: int) -> bool:
+    """사업 대상 연도 검증 (2002년 이하)"""
+    return segi_year <= PROJECT_MAX_YEAR
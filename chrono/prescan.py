@@ -0,0 +1,236 @@
+import csv
+import random
+import re
+from dataclasses import dataclass, field
+from typing import BinaryIO, Dict, Hashable, Iterable, List, Optional, Sequence, TextIO, Tuple
+
+import numpy as np
+
+from .batch import (
+    STATUS_FORMAT_ERROR,
+    STATUS_MISSING,
+    STATUS_OK,
+    STATUS_OUT_OF_RANGE,
+    STATUS_OUT_OF_SCOPE,
+    convert_many,
+)
+
+# 사전 점검에 사용할 표본 행 수
+SAMPLE_SIZE = 1000
+
+# 연도 칼럼일 가능성이 높은 칼럼명
+_YEAR_COLUMN_NAME = re.compile(r"연도|년도|생산|year", re.IGNORECASE)
+
+# 숫자만으로 된 값 (연호 없이 숫자만 있으면 단기로 해석되므로 순번/코드 칼럼과 구분하기 어려움)
+_BARE_NUMBER = re.compile(r"^\s*[\d.]+\s*$")
+
+def reservoir_sample(items: Iterable, k: int = SAMPLE_SIZE, seed: Optional[int] = 0) -> Tuple[list, int]:
+    """길이를 모르는 입력에서 k개를 균등하게 표본 추출 (저수지 표본 추출, Algorithm R)
+    
+    입력을 한 번만 읽으며 메모리는 k개만 사용합니다.
+    
+    Args:
+        items (Iterable): 표본을 뽑을 입력 (파일 행 등)
+        k (int): 표본 크기
+        seed (Optional[int]): 난수 시드 (같은 입력이면 같은 표본)
+    
+    Returns:
+        Tuple[list, int]: (입력 순서대로 정렬된 표본, 전체 입력 수)
+    """
+    rng = random.Random(seed)
+    reservoir: List[Tuple[int, object]] = []
+    count = 0
+    for count, item in enumerate(items, start=1):
+        if count <= k:
+            reservoir.append((count, item))
+        else:
+            slot = rng.randrange(count)
+            if slot < k:
+                reservoir[slot] = (count, item)
+    reservoir.sort(key=lambda pair: pair[0])
+    return [item for _, item in reservoir], count
+
+@dataclass
+class ColumnEstimate:
+    """칼럼 하나의 표본 변환 결과
+    
+    Attributes:
+        column: 칼럼명
+        sampled (int): 표본 행 수
+        success (int): 변환 성공 수
+        out_of_scope (int): 변환은 되지만 사업 대상 기간을 넘는 수
+        failure (int): 변환 실패 수 (형식 오류 + 유효 기간 밖)
+        missing (int): 빈 값 수
+        bare_numbers (int): 연호 없이 숫자만 있는 값 중 변환된 수
+    """
+    column: Hashable
+    sampled: int
+    success: int = 0
+    out_of_scope: int = 0
+    failure: int = 0
+    missing: int = 0
+    bare_numbers: int = 0
+    
+    def rate(self, count: int) -> float:
+        return count / self.sampled if self.sampled else 0.0
+    
+    @property
+    def success_rate(self) -> float:
+        return self.rate(self.success)
+    
+    @property
+    def out_of_scope_rate(self) -> float:
+        return self.rate(self.out_of_scope)
+    
+    @property
+    def failure_rate(self) -> float:
+        return self.rate(self.failure)
+    
+    @property
+    def missing_rate(self) -> float:
+        return self.rate(self.missing)
+    
+    @property
+    def margin(self) -> float:
+        """성공률 추정의 95% 오차 범위 (정규 근사)"""
+        if not self.sampled:
+            return 0.0
+        p = self.success_rate
+        return 1.96 * (p * (1 - p) / self.sampled) ** 0.5
+    
+    @property
+    def score(self) -> float:
+        """연도 칼럼일 가능성 점수
+        
+        변환된 값의 비율을 기준으로 하되, 숫자만 있는 값은 절반만 인정하고(순번/코드 칼럼 구분)
+        칼럼명이 연도를 뜻하면 가산합니다.
+        """
+        converted = self.success + self.out_of_scope
+        score = self.rate(converted - self.bare_numbers / 2)
+        if converted and _YEAR_COLUMN_NAME.search(str(self.column)):
+            score += 0.25
+        return score
+
+@dataclass
+class PrescanResult:
+    """사전 점검 결과
+    
+    Attributes:
+        total_rows (int): 전체 행 수
+        columns (List[ColumnEstimate]): 칼럼별 추정 (가능성 점수 내림차순)
+        column_names (List[Hashable]): 파일에 나온 순서대로의 칼럼명
+    """
+    total_rows: int
+    columns: List[ColumnEstimate] = field(default_factory=list)
+    column_names: List[Hashable] = field(default_factory=list)
+    
+    @property
+    def suggested_column(self) -> Optional[Hashable]:
+        """연도 칼럼으로 추천하는 칼럼 (변환되는 칼럼이 없으면 None)"""
+        if self.columns and self.columns[0].score > 0:
+            return self.columns[0].column
+        return None
+    
+    def get(self, column: Hashable) -> Optional[ColumnEstimate]:
+        for estimate in self.columns:
+            if estimate.column == column:
+                return estimate
+        return None
+
+def estimate_column(column: Hashable, values: Sequence) -> ColumnEstimate:
+    """표본 값을 변환해 칼럼 하나의 성공/실패/범위 초과 비율 추정"""
+    arrays = convert_many(values)
+    status = arrays.status
+    counts = np.bincount(status, minlength=STATUS_OUT_OF_SCOPE + 1)
+    
+    converted = arrays.converted
+    bare_numbers = sum(
+        1 for value, ok in zip(values, converted.tolist())
+        if ok and isinstance(value, (str, int, float, np.number)) and _BARE_NUMBER.match(str(value))
+    )
+    return ColumnEstimate(
+        column=column,
+        sampled=len(status),
+        success=int(counts[STATUS_OK]),
+        out_of_scope=int(counts[STATUS_OUT_OF_SCOPE]),
+        failure=int(counts[STATUS_FORMAT_ERROR] + counts[STATUS_OUT_OF_RANGE]),
+        missing=int(counts[STATUS_MISSING]),
+        bare_numbers=bare_numbers,
+    )
+
+def estimate_columns(columns: Dict[Hashable, Sequence], total_rows: int) -> PrescanResult:
+    """칼럼별 표본 값으로 사전 점검
+    
+    Args:
+        columns (Dict[Hashable, Sequence]): 칼럼명별 표본 값 (모든 칼럼이 같은 행의 표본)
+        total_rows (int): 전체 행 수
+    
+    Returns:
+        PrescanResult: 가능성 점수 내림차순의 칼럼별 추정
+    """
+    estimates = [estimate_column(name, list(values)) for name, values in columns.items()]
+    estimates.sort(key=lambda estimate: estimate.score, reverse=True)
+    return PrescanResult(total_rows=total_rows, columns=estimates, column_names=list(columns))
+
+def prescan_rows(rows: Iterable[Sequence], header: Sequence[str],
+                 k: int = SAMPLE_SIZE, seed: Optional[int] = 0) -> PrescanResult:
+    """행 단위 입력(CSV 리더 등)을 읽으면서 표본을 뽑아 사전 점검
+    
+    Args:
+        rows (Iterable[Sequence]): 헤더를 제외한 행
+        header (Sequence[str]): 칼럼명
+        k (int): 표본 크기
+        seed (Optional[int]): 난수 시드
+    
+    Returns:
+        PrescanResult: 가능성 점수 내림차순의 칼럼별 추정
+    """
+    sample, total_rows = reservoir_sample(rows, k, seed)
+    columns = {
+        name: [row[idx] if idx < len(row) else None for row in sample]
+        for idx, name in enumerate(header)
+    }
+    return estimate_columns(columns, total_rows)
+
+def prescan_csv(stream: TextIO, k: int = SAMPLE_SIZE, seed: Optional[int] = 0) -> PrescanResult:
+    """CSV를 한 번만 훑으며 표본을 뽑아 사전 점검 (전체를 데이터프레임으로 읽지 않음)
+    
+    Args:
+        stream (TextIO): 첫 행이 헤더인 CSV 텍스트 (newline=""로 연 파일)
+        k (int): 표본 크기
+        seed (Optional[int]): 난수 시드
+    
+    Returns:
+        PrescanResult: 가능성 점수 내림차순의 칼럼별 추정
+    """
+    reader = csv.reader(stream)
+    header = next(reader, [])
+    return prescan_rows(reader, header, k, seed)
+
+def prescan_xlsx(stream: BinaryIO, k: int = SAMPLE_SIZE, seed: Optional[int] = 0) -> PrescanResult:
+    """Excel(xlsx) 첫 시트를 읽기 전용 모드로 한 행씩 훑으며 사전 점검 (데이터프레임을 만들지 않음)
+    
+    빈 헤더 칸은 pandas와 같이 'Unnamed: 번호'로, 완전히 빈 행은 건너뜁니다.
+    
+    Args:
+        stream (BinaryIO): xlsx 파일
+        k (int): 표본 크기
+        seed (Optional[int]): 난수 시드
+    
+    Returns:
+        PrescanResult: 가능성 점수 내림차순의 칼럼별 추정
+    """
+    from openpyxl import load_workbook
+    
+    workbook = load_workbook(stream, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = [
+            f"Unnamed: {idx}" if name is None else name
+            for idx, name in enumerate(next(rows, ()))
+        ]
+        return prescan_rows(
+            (row for row in rows if any(value is not None for value in row)), header, k, seed
+        )
+    finally:
+        workbook.close()
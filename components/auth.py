@@ -0,0 +1,174 @@
+import threading
+import time
+from collections import OrderedDict
+
+import streamlit as st
+import streamlit_authenticator as stauth
+
+# 프로세스에 보관할 검증된 세션 토큰 최대 개수
+MAX_VERIFIED_SESSIONS = 10000
+
+_AUTHENTICATOR_KEY = "_authenticator"
+_TOKEN_KEY = "_auth_token"
+
+def _plain(value):
+    """st.secrets의 읽기 전용 객체를 일반 dict로 변환"""
+    if hasattr(value, "items"):
+        return {key: _plain(item) for key, item in value.items()}
+    return value
+
+@st.cache_resource
+def auth_config():
+    """Streamlit Secrets의 인증 설정을 프로세스당 한 번만 읽음
+
+    Returns:
+        (credentials, cookie) 튜플
+    """
+    credentials = {'usernames': _plain(st.secrets['credentials']['usernames'])}
+    cookie = {
+        'expiry_days': st.secrets['cookie']['expiry_days'],
+        'key': st.secrets['cookie']['key'],
+        'name': st.secrets['cookie']['name']
+    }
+    return credentials, cookie
+
+class VerifiedSessions:
+    """쿠키 토큰별로 검증이 끝난 사용자 정보를 만료 시각까지 보관
+
+    같은 토큰이 다시 들어오면 JWT 복호화와 사용자 조회를 건너뜁니다.
+    """
+
+    def __init__(self, max_size=MAX_VERIFIED_SESSIONS):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token):
+        """토큰에 해당하는 (name, username) 반환, 없거나 만료되었으면 None"""
+        if not token:
+            return None
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                return None
+            name, username, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[token]
+                return None
+            return name, username
+
+    def add(self, token, name, username, expires_at):
+        """검증된 토큰 저장 (가장 오래된 항목부터 밀어냄)"""
+        if not token or expires_at <= time.time():
+            return
+        with self._lock:
+            self._entries[token] = (name, username, expires_at)
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def discard(self, token):
+        """로그아웃한 토큰 제거"""
+        if token:
+            with self._lock:
+                self._entries.pop(token, None)
+
+@st.cache_resource
+def verified_sessions():
+    """프로세스 전체에서 공유하는 검증된 세션 캐시"""
+    return VerifiedSessions()
+
+def _new_authenticator():
+    credentials, cookie = auth_config()
+    # Authenticate가 credentials['usernames']를 교체하므로 얕은 복사본을 넘김
+    return stauth.Authenticate(
+        {'usernames': dict(credentials['usernames'])},
+        cookie['name'],
+        cookie['key'],
+        cookie['expiry_days']
+    )
+
+def _session_authenticator():
+    """세션의 인증 객체 (세션마다 한 번만 만들고, 재실행 때는 쿠키만 다시 읽음)
+
+    인증 객체를 만들면 사용자 목록 복사와 쿠키 컴포넌트 생성이 함께 일어나므로
+    로그인 폼을 입력하는 동안의 재실행마다 새로 만들지 않습니다.
+    """
+    authenticator = st.session_state.get(_AUTHENTICATOR_KEY)
+    if authenticator is None:
+        authenticator = _new_authenticator()
+        st.session_state[_AUTHENTICATOR_KEY] = authenticator
+    else:
+        # 쿠키 컴포넌트는 매 실행 그려야 브라우저의 쿠키 값을 계속 받음 (인증 객체가 쓰는 키와 같게)
+        authenticator.cookie_manager.get_all(key='init')
+    return authenticator
+
+def _issued_token(authenticator, cookie_token):
+    """로그인 직후 쿠키 토큰과 만료 시각(Unix timestamp) 반환"""
+    token = getattr(authenticator, 'token', None)
+    if isinstance(token, dict):
+        # 쿠키로 로그인한 경우 복호화된 페이로드가 담겨 있음
+        return cookie_token, token.get('exp_date', 0)
+    if isinstance(token, str):
+        # 로그인 폼으로 새 토큰을 발급한 경우
+        return token, getattr(authenticator, 'exp_date', 0)
+    return None, 0
+
+def is_authenticated():
+    """세션 상태만 보고 로그인 여부 확인 (설정을 다시 읽지 않음)"""
+    return bool(st.session_state.get('authentication_status'))
+
+def login(form_name='로그인', location='main'):
+    """로그인 처리
+
+    이미 로그인한 세션은 인증 객체를 만들지 않고 세션 상태를 그대로 반환합니다.
+    로그인하지 않은 세션은 인증 객체를 세션당 한 번만 만들어 재실행마다 다시 씁니다.
+    쿠키 토큰이 이미 검증된 것이면 캐시된 사용자 정보로 바로 로그인합니다.
+
+    Args:
+        form_name: 로그인 폼 제목
+        location: 로그인 폼 위치 ('main' 또는 'sidebar')
+
+    Returns:
+        (name, authentication_status, username) 튜플
+    """
+    if is_authenticated():
+        return st.session_state['name'], True, st.session_state['username']
+
+    authenticator = _session_authenticator()
+
+    cookie_token = None
+    if not st.session_state.get('logout'):
+        cookie_token = authenticator.cookie_manager.get(authenticator.cookie_name)
+
+    sessions = verified_sessions()
+    cached = sessions.get(cookie_token)
+    if cached is not None:
+        name, username = cached
+        st.session_state['name'] = name
+        st.session_state['username'] = username
+        st.session_state['authentication_status'] = True
+        st.session_state[_TOKEN_KEY] = cookie_token
+        return name, True, username
+
+    name, authentication_status, username = authenticator.login(form_name, location)
+    if authentication_status:
+        token, expires_at = _issued_token(authenticator, cookie_token)
+        sessions.add(token, name, username, expires_at)
+        st.session_state[_TOKEN_KEY] = token
+    return name, authentication_status, username
+
+def logout(button_name='로그아웃', location='sidebar'):
+    """로그아웃 버튼 표시, 로그아웃하면 검증된 세션 캐시에서도 토큰을 제거"""
+    authenticator = st.session_state.get(_AUTHENTICATOR_KEY)
+    if authenticator is None:
+        return
+    authenticator.logout(button_name, location)
+    if st.session_state.get('logout'):
+        verified_sessions().discard(st.session_state.pop(_TOKEN_KEY, None))
+
+def require_login():
+    """로그인하지 않은 세션이면 안내 후 페이지 실행 중단"""
+    if not is_authenticated():
+        st.error('이 페이지에 접근하려면 로그인이 필요합니다.')
+        st.stop()
@@ -0,0 +1,235 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import ExitStack, contextmanager, nullcontext
+from datetime import datetime, timezone
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# 재실행별 프로파일 기록 파일 (JSON Lines)
+PROFILE_LOG_PATH = os.environ.get("RERUN_PROFILE_LOG", "logs/rerun_profile.jsonl")
+
+_SESSION_KEY = "_rerun_profiler"
+
+def profiling_enabled():
+    """프로파일링 사용 여부 (?profile=1 쿼리 파라미터 또는 secrets의 [profiling] enabled)"""
+    values = st.experimental_get_query_params().get("profile")
+    if values:
+        return values[0].lower() not in ("0", "false", "off")
+    try:
+        return bool(st.secrets["profiling"]["enabled"])
+    except (FileNotFoundError, KeyError):
+        return False
+
+class _Tracing:
+    """프로파일링 중인 재실행이 있는 동안만 tracemalloc을 켬
+    
+    할당 추적은 프로세스 전체를 느리게 하므로, 마지막으로 측정을 마친 재실행이 끄도록
+    사용 중인 재실행 수를 셉니다. 다른 곳에서 이미 켜 둔 추적은 끄지 않습니다.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._users = 0
+        self._owned = False
+    
+    def acquire(self):
+        with self._lock:
+            if self._users == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._owned = True
+            self._users += 1
+    
+    def release(self):
+        with self._lock:
+            self._users -= 1
+            if self._users == 0 and self._owned:
+                tracemalloc.stop()
+                self._owned = False
+
+_TRACING = _Tracing()
+
+class DeltaCounter:
+    """현재 세션이 브라우저로 보내는 델타 메시지 수와 직렬화 크기 집계
+    
+    with 블록 동안 세션의 ScriptRunContext가 메시지를 보내는 함수를 감싸고, 블록을 나가면 예외가
+    나도 원래 함수로 되돌립니다. st.rerun/st.stop으로 재실행이 중단되어 블록을 나가지 못했으면
+    다음 재실행의 첫 메시지에서 스스로 되돌립니다. Streamlit 내부 속성(_enqueue, cursors)을 쓰므로
+    찾지 못하면 집계하지 않습니다.
+    """
+    
+    def __init__(self):
+        self.count = 0
+        self.bytes = 0
+        self.enqueue = None
+        self._ctx = get_script_run_ctx()
+        self._run = None
+    
+    @property
+    def active(self):
+        return self.enqueue is not None
+    
+    def __enter__(self):
+        enqueue = getattr(self._ctx, "_enqueue", None)
+        if isinstance(enqueue, DeltaCounter):
+            # 이전 재실행이 중단되어 되돌리지 못한 집계
+            enqueue.close()
+            enqueue = self._ctx._enqueue
+        if enqueue is not None:
+            self.enqueue = enqueue
+            # 재실행마다 ScriptRunContext.reset()이 새 dict로 바꾸므로 재실행 식별에 사용
+            self._run = getattr(self._ctx, "cursors", None)
+            self._ctx._enqueue = self
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+    
+    def __call__(self, msg):
+        if getattr(self._ctx, "cursors", None) is not self._run:
+            # 다른 재실행의 메시지는 세지 않고 원래 함수로 되돌림
+            self.close()
+        elif msg.HasField("delta"):
+            self.count += 1
+            self.bytes += msg.ByteSize()
+        self.enqueue(msg)
+    
+    def close(self):
+        """집계를 멈추고 원래 전송 함수로 되돌림 (여러 번 호출해도 됨)"""
+        if self.active and self._ctx._enqueue is self:
+            self._ctx._enqueue = self.enqueue
+
+class RerunProfiler:
+    """한 번의 재실행을 단계별로 측정
+    
+    메모리 증감은 tracemalloc 기준이며, 여러 세션이 한 프로세스에서 실행되므로
+    프로세스 전체의 할당이 함께 집계됩니다. 할당 추적은 측정 중인 재실행이 있는 동안만 켜집니다.
+    """
+    
+    def __init__(self, page):
+        self.page = page
+        self.stages = []
+        self.closed = False
+        # close()에서 시작한 것의 역순으로 정리 (델타 집계 복원, tracemalloc 해제)
+        self._cleanup = ExitStack()
+        _TRACING.acquire()
+        self._cleanup.callback(_TRACING.release)
+        self.started = time.perf_counter()
+        self.start_memory = tracemalloc.get_traced_memory()[0]
+        self.deltas = self._cleanup.enter_context(DeltaCounter())
+    
+    @contextmanager
+    def stage(self, name):
+        """이름 붙인 단계의 소요 시간과 메모리 증감 측정"""
+        memory_before = tracemalloc.get_traced_memory()[0]
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages.append({
+                "stage": name,
+                "ms": (time.perf_counter() - started) * 1000,
+                "memory_kib": (tracemalloc.get_traced_memory()[0] - memory_before) / 1024,
+            })
+    
+    def close(self):
+        """측정 종료 (델타 집계를 되돌리고, 마지막 사용자면 tracemalloc도 끔)"""
+        if self.closed:
+            return
+        self.closed = True
+        self._cleanup.close()
+    
+    def finish(self):
+        """전체 소요 시간과 단계 밖 시간(기타)을 포함한 기록"""
+        total_ms = (time.perf_counter() - self.started) * 1000
+        memory_kib = (tracemalloc.get_traced_memory()[0] - self.start_memory) / 1024
+        self.close()
+        staged_ms = sum(stage["ms"] for stage in self.stages)
+        return {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "page": self.page,
+            "total_ms": total_ms,
+            "other_ms": max(total_ms - staged_ms, 0.0),
+            "memory_kib": memory_kib,
+            "stages": self.stages,
+            "deltas": self.deltas.count if self.deltas.active else None,
+            "delta_bytes": self.deltas.bytes if self.deltas.active else None,
+        }
+
+def stop_profiling():
+    """기록하지 않고 측정 종료 (st.stop/st.rerun으로 페이지 끝까지 가지 않는 재실행)"""
+    profiler = st.session_state.pop(_SESSION_KEY, None)
+    if profiler is not None:
+        profiler.close()
+
+def start_profiling(page):
+    """재실행 측정 시작 (프로파일링이 꺼져 있으면 None)
+    
+    이전 재실행이 중단되어 남은 측정은 먼저 정리합니다.
+    """
+    stop_profiling()
+    profiler = RerunProfiler(page) if profiling_enabled() else None
+    st.session_state[_SESSION_KEY] = profiler
+    return profiler
+
+def profile_stage(name):
+    """현재 재실행의 단계 측정 컨텍스트 (프로파일링이 꺼져 있으면 아무 일도 하지 않음)"""
+    profiler = st.session_state.get(_SESSION_KEY)
+    if profiler is None:
+        return nullcontext()
+    return profiler.stage(name)
+
+def _append_log(record):
+    try:
+        os.makedirs(os.path.dirname(PROFILE_LOG_PATH) or ".", exist_ok=True)
+        with open(PROFILE_LOG_PATH, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    except OSError:
+        pass
+
+def render_profile_panel(startup=None, render=None):
+    """측정 결과를 사이드바에 표시하고 로그 파일에 추가 (페이지 맨 끝에서 호출)
+    
+    Args:
+        startup (dict): 콜드 스타트/웜 재실행 시간 (components.startup.finish_page)
+        render (dict): 렌더 버퍼 집계 (components.ui.finish_render_buffer)
+    """
+    profiler = st.session_state.pop(_SESSION_KEY, None)
+    if profiler is None:
+        return
+    
+    record = profiler.finish()
+    if startup:
+        record["startup"] = startup
+    if render:
+        record["render"] = render
+    _append_log(record)
+    
+    rows = [
+        {"단계": stage["stage"], "시간(ms)": round(stage["ms"], 1), "메모리(KiB)": round(stage["memory_kib"], 1)}
+        for stage in record["stages"]
+    ]
+    rows.append({"단계": "기타", "시간(ms)": round(record["other_ms"], 1), "메모리(KiB)": None})
+    
+    with st.sidebar.expander("⏱️ 재실행 프로파일", expanded=True):
+        st.markdown(f"전체 **{record['total_ms']:,.1f}ms** · 메모리 {record['memory_kib']:+,.1f}KiB")
+        st.dataframe(rows, use_container_width=True, hide_index=True)
+        if startup:
+            warm = f"{startup['warm_avg_ms']:,.1f}ms" if startup["warm_avg_ms"] is not None else "-"
+            st.markdown(
+                f"{'콜드 스타트' if startup['run_kind'] == 'cold' else '웜 재실행'} · "
+                f"첫 화면 {startup['first_paint_ms']:,.0f}ms · 콜드 {startup['cold_ms']:,.1f}ms · 웜 평균 {warm}"
+            )
+        if record["deltas"] is not None:
+            line = f"델타 **{record['deltas']:,}**개 · {record['delta_bytes'] / 1024:,.1f}KiB"
+            if render:
+                line += (
+                    f" · HTML 조각 {render['fragments']:,}개 → markdown {render['calls']:,}회"
+                    f" (렌더 버퍼 {'켜짐' if render['enabled'] else '꺼짐'})"
+                )
+            st.markdown(line)
+        st.caption(f"기록 파일: {PROFILE_LOG_PATH}")
@@ -0,0 +1,102 @@
+import importlib.util
+import sys
+import threading
+import time
+
+import streamlit as st
+
+from .profiling import render_profile_panel, start_profiling, stop_profiling
+from .ui import finish_render_buffer, reset_render_buffer
+
+# 이 모듈이 처음 임포트된 시점 (프로세스 시작 직후)
+PROCESS_STARTED = time.perf_counter()
+
+_SESSION_KEY = "_page_started"
+
+def lazy_import(name):
+    """처음 속성에 접근할 때 실제로 임포트되는 모듈
+    
+    requests처럼 무거운 모듈을 그 기능을 쓰지 않는 재실행에서는 불러오지 않도록 합니다.
+    이미 임포트된 모듈은 그대로 반환하므로 streamlit이 먼저 임포트하는 pandas/numpy에는 효과가 없습니다.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+@st.cache_resource
+def load_css(css_file):
+    """CSS 파일을 프로세스당 한 번만 읽어 <style> 태그로 반환"""
+    with open(css_file, encoding='utf-8') as f:
+        return f"<style>{f.read()}</style>"
+
+def apply_styles(css_file="styles/typography.css"):
+    """타이포그래피 스타일 적용"""
+    st.markdown(load_css(css_file), unsafe_allow_html=True)
+
+@st.cache_resource
+def _page_timings():
+    """페이지별 콜드 스타트/웜 재실행 시간 (프로세스 전체 공유)"""
+    return {"lock": threading.Lock(), "pages": {}}
+
+def begin_page(page):
+    """페이지 재실행 시작 (set_page_config 직후 호출)"""
+    st.session_state[_SESSION_KEY] = (page, time.perf_counter())
+    start_profiling(page)
+    reset_render_buffer()
+
+def rerun_page():
+    """진행 중인 측정을 기록하지 않고 정리한 뒤 재실행 (페이지에서 st.rerun 대신 사용)
+    
+    st.rerun은 페이지 끝(finish_page)까지 가지 않으므로 tracemalloc과 델타 집계를 여기서 정리합니다.
+    """
+    st.session_state.pop(_SESSION_KEY, None)
+    stop_profiling()
+    st.rerun()
+
+def finish_page():
+    """페이지 재실행 종료: 콜드 스타트/웜 재실행 시간과 렌더 버퍼 집계를 기록하고 프로파일 패널 표시
+    
+    프로세스에서 해당 페이지를 처음 그린 재실행을 콜드 스타트로,
+    이후 재실행을 웜 재실행으로 집계합니다.
+    """
+    render = finish_render_buffer()
+    started = st.session_state.pop(_SESSION_KEY, None)
+    if started is None:
+        return
+    page, page_started = started
+    now = time.perf_counter()
+    elapsed_ms = (now - page_started) * 1000
+    
+    timings = _page_timings()
+    with timings["lock"]:
+        stats = timings["pages"].get(page)
+        if stats is None:
+            stats = timings["pages"][page] = {
+                "cold_ms": elapsed_ms,
+                "first_paint_ms": (now - PROCESS_STARTED) * 1000,
+                "warm_count": 0,
+                "warm_total_ms": 0.0,
+            }
+            run_kind = "cold"
+        else:
+            stats["warm_count"] += 1
+            stats["warm_total_ms"] += elapsed_ms
+            run_kind = "warm"
+        summary = {
+            "run_kind": run_kind,
+            "run_ms": elapsed_ms,
+            "cold_ms": stats["cold_ms"],
+            "first_paint_ms": stats["first_paint_ms"],
+            "warm_avg_ms": stats["warm_total_ms"] / stats["warm_count"] if stats["warm_count"] else None,
+        }
+    
+    render_profile_panel(summary, render)
@@ -1,25 +1,122 @@
+import os
+
 import streamlit as st
 from contextlib import contextmanager
+from functools import lru_cache
+
+LOGO_URL = "https://via.placeholder.com/150x50.png?text=Logo"
+
+# 정적 HTML 조각을 모아서 출력할지 여부 (?buffer=0 쿼리 파라미터나 UI_RENDER_BUFFER=0 으로 끔)
+RENDER_BUFFER_DEFAULT = os.environ.get("UI_RENDER_BUFFER", "1").lower() not in ("0", "false", "off")
+
+_BUFFER_KEY = "_render_buffer"
+
+# 사이드바 도구 메뉴 (표시 이름: 페이지 이름)
+MENU_ITEMS = {
+    "🏠 홈": "홈",
+    "📅 연호 변환기": "연호 변환기",
+    "🔜 추가 예정": "추가 예정"
+}
+
+class RenderBuffer:
+    """컴포넌트의 정적 HTML 조각을 모아 한 번의 st.markdown으로 출력
+    
+    st.markdown 호출 하나가 브라우저로 가는 델타 메시지 하나이고, Streamlit은 호출마다 별도 요소로
+    그리므로 여는 태그와 닫는 태그를 따로 보내도 서로 감싸지지 않습니다. 그래서 여는 태그와 제목은
+    하나로 합쳐 보내고, 따로 오는 닫는 태그는 아무것도 닫지 못하므로 보내지 않고 버립니다.
+    (다음 출력에 붙이면 관계없는 st.markdown 앞에 닫는 태그가 섞여 들어감)
+    
+    Attributes:
+        enabled (bool): 조각을 모아서 출력할지 여부 (False면 조각마다 st.markdown 호출)
+        fragments (int): 이번 재실행에서 받은 HTML 조각 수
+        calls (int): 이번 재실행에서 실제로 호출한 st.markdown 수
+    """
+    
+    def __init__(self, enabled=RENDER_BUFFER_DEFAULT):
+        self.enabled = enabled
+        self.fragments = 0
+        self.calls = 0
+    
+    def emit(self, *fragments):
+        """HTML 조각 출력 (켜져 있으면 한 번의 st.markdown으로)"""
+        fragments = [fragment for fragment in fragments if fragment]
+        self.fragments += len(fragments)
+        if not self.enabled:
+            for fragment in fragments:
+                self._markdown(fragment)
+            return
+        
+        html = "".join(fragments)
+        if html:
+            self._markdown(html)
+    
+    def close(self, fragment='</div>'):
+        """닫는 태그 출력 (켜져 있으면 별도 요소로 보내도 감쌀 내용이 없으므로 버림)"""
+        self.fragments += 1
+        if not self.enabled:
+            self._markdown(fragment)
+    
+    def finish(self):
+        """재실행 종료: 집계 반환
+        
+        Returns:
+            dict: 모드, 받은 조각 수, st.markdown 호출 수
+        """
+        return {"enabled": self.enabled, "fragments": self.fragments, "calls": self.calls}
+    
+    def _markdown(self, html):
+        self.calls += 1
+        st.markdown(html, unsafe_allow_html=True)
+
+def _buffer_enabled():
+    values = st.experimental_get_query_params().get("buffer")
+    if values:
+        return values[0].lower() not in ("0", "false", "off")
+    return RENDER_BUFFER_DEFAULT
+
+def reset_render_buffer():
+    """재실행 시작 시 새 렌더 버퍼 준비 (components.startup.begin_page에서 호출)"""
+    buffer = st.session_state[_BUFFER_KEY] = RenderBuffer(_buffer_enabled())
+    return buffer
+
+def render_buffer():
+    """현재 세션의 렌더 버퍼"""
+    buffer = st.session_state.get(_BUFFER_KEY)
+    if buffer is None:
+        buffer = reset_render_buffer()
+    return buffer
+
+def finish_render_buffer():
+    """재실행 종료 시 렌더 버퍼 집계 반환 (버퍼를 쓰지 않은 재실행이면 None)"""
+    buffer = st.session_state.pop(_BUFFER_KEY, None)
+    return buffer.finish() if buffer is not None else None
+
+def render_html(*fragments):
+    """정적 HTML 출력 (렌더 버퍼가 켜져 있으면 조각을 합쳐 한 번의 st.markdown으로)"""
+    render_buffer().emit(*fragments)
 
 @contextmanager
 def section(title=None, icon=None):
     """기본 섹션 컴포넌트"""
-    st.markdown('<div class="section">', unsafe_allow_html=True)
-    if title:
-        st.markdown(f'<div class="section-title">{icon + " " if icon else ""}{title}</div>', unsafe_allow_html=True)
+    buffer = render_buffer()
+    buffer.emit(
+        '<div class="section">',
+        f'<div class="section-title">{icon + " " if icon else ""}{title}</div>' if title else None
+    )
     yield
-    st.markdown('</div>', unsafe_allow_html=True)
+    buffer.close()
 
 @contextmanager
 def card(title=None, description=None, icon=None):
     """카드 컴포넌트"""
-    st.markdown('<div class="card">', unsafe_allow_html=True)
-    if title:
-        st.markdown(f'<div class="card-title">{icon + " " if icon else ""}{title}</div>', unsafe_allow_html=True)
-    if description:
-        st.markdown(f'<div class="card-description">{description}</div>', unsafe_allow_html=True)
+    buffer = render_buffer()
+    buffer.emit(
+        '<div class="card">',
+        f'<div class="card-title">{icon + " " if icon else ""}{title}</div>' if title else None,
+        f'<div class="card-description">{description}</div>' if description else None
+    )
     yield
-    st.markdown('</div>', unsafe_allow_html=True)
+    buffer.close()
 
 def info_box(content, type="info"):
     """정보 박스 컴포넌트"""
@@ -29,16 +126,33 @@ def info_box(content, type="info"):
         "success": "✅",
         "error": "❌"
     }
-    st.markdown(f'<div class="info-box info-box-{type}">{icons.get(type, "")} {content}</div>', unsafe_allow_html=True)
+    render_html(f'<div class="info-box info-box-{type}">{icons.get(type, "")} {content}</div>')
 
 @contextmanager
 def result_box(title=None):
     """결과 표시 컴포넌트"""
-    st.markdown('<div class="result-container">', unsafe_allow_html=True)
-    if title:
-        st.markdown(f'### {title}')
+    buffer = render_buffer()
+    # 마크다운 제목은 HTML 블록 안에서 해석되지 않으므로 모아서 출력할 때는 <h3>로 씀
+    heading = (f'<h3>{title}</h3>' if buffer.enabled else f'### {title}') if title else None
+    buffer.emit('<div class="result-container">', heading)
     yield
-    st.markdown('</div>', unsafe_allow_html=True)
+    buffer.close()
+
+def result_highlight(subject, result, suffix="입니다."):
+    """변환 결과 강조 표시 (가운데 정렬한 한 덩어리의 HTML)
+    
+    Args:
+        subject (str): 결과 앞 문장 (HTML)
+        result (str): 크게 표시할 결과
+        suffix (str): 결과 뒤 문장
+    """
+    render_html(
+        '<div style="text-align: center; font-size: 1.2rem;">'
+        f'<p>{subject}</p>'
+        f'<div style="font-size: 2rem; font-weight: bold; margin: 1rem 0;">{result}</div>'
+        f'<p>{suffix}</p>'
+        '</div>'
+    )
 
 def action_button(label, key=None, help=None):
     """액션 버튼 컴포넌트"""
@@ -53,5 +167,39 @@ def header(title, description=None):
     """페이지 헤더 컴포넌트"""
     st.title(title)
     if description:
-        st.markdown(f'<div class="page-description">{description}</div>', unsafe_allow_html=True)
-    st.markdown("---") 
\ No newline at end of file
+        render_html(f'<div class="page-description">{description}</div>')
+    st.markdown("---") 
+
+@lru_cache(maxsize=None)
+def _menu_markdown(current_page):
+    """도구 메뉴 마크다운 (페이지별로 한 번만 생성)"""
+    lines = ["### 🧰 도구 모음", "현재 사용 가능한 도구:"]
+    for label, page in MENU_ITEMS.items():
+        lines.append(f"**{label}** ←" if page == current_page else label)
+    return "\n\n".join(lines)
+
+_INFO_MARKDOWN = "\n\n".join([
+    "### ℹ️ 정보",
+    "버전: 1.0.0",
+    "[사용 설명서]()",
+    "[피드백 보내기]()"
+])
+
+def sidebar(current_page, user_section=None):
+    """공통 사이드바 컴포넌트
+    
+    Args:
+        current_page (str): 메뉴에서 강조할 페이지 이름
+        user_section (callable): 로고 아래에 표시할 사용자 정보 영역 (선택)
+    """
+    with st.sidebar:
+        st.image(LOGO_URL, use_column_width=True)
+        st.divider()
+        
+        if user_section:
+            user_section()
+            st.divider()
+        
+        st.markdown(_menu_markdown(current_page))
+        st.divider()
+        st.markdown(_INFO_MARKDOWN)
@@ -0,0 +1,35 @@
+# gunicorn 설정 (연호 변환 API)
+#
+#     gunicorn -c gunicorn.conf.py api.main:app
+#
+# preload_app으로 마스터 프로세스에서 앱을 한 번 임포트해 연호 표와 연호 매처를 만든 뒤
+# 워커를 fork하므로, 워커는 이를 다시 만들지 않고 메모리 페이지를 공유합니다.
+# 각 워커는 lifespan 시작 단계(예열)를 마친 뒤에 요청을 받습니다.
+#
+# 지표(/metrics)는 워커마다 따로 모이므로, 워커가 둘 이상이면 시작할 때 스냅숏 디렉터리
+# (CHRONO_METRICS_DIR, 없으면 임시 디렉터리)를 준비해 어느 워커가 응답해도 전체 합계를 보여줍니다.
+
+import multiprocessing
+import os
+
+bind = os.environ.get("BIND", f"0.0.0.0:{os.environ.get('PORT', '8000')}")
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+
+# 응답이 없는 워커 재시작, 종료 신호 후 처리 중인 요청을 마칠 시간 (초)
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = 30
+keepalive = 5
+
+# 메모리 단편화를 막기 위해 일정 요청 수마다 워커 교체 (0이면 교체하지 않음)
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", "0"))
+max_requests_jitter = max_requests // 10
+
+accesslog = "-"
+
+def on_starting(server):
+    """워커를 띄우기 전에 지표 스냅숏 디렉터리 준비 (이전 실행의 스냅숏 삭제)"""
+    if server.cfg.workers > 1:
+        from api.metrics import prepare_multiprocess_dir
+        server.log.info("Metrics snapshot dir: %s", prepare_multiprocess_dir())
@@ -1,17 +1,29 @@
 import streamlit as st
 import pandas as pd
-import re
+import numpy as np
 import io
-from components.ui import section, card, info_box, header, result_box, action_button
+from components.auth import require_login
+from components.startup import apply_styles, begin_page, finish_page
+from components.ui import section, card, info_box, header, result_box, result_highlight, action_button, sidebar
+from components.profiling import profile_stage
+from chrono import ERAS, ERAS_BY_NAME, ERA_INDEX, PROJECT_MAX_YEAR, is_valid_year, parse_year_input
+from chrono import convert_to_segi as convert_era_to_segi
+from chrono.batch import (
+    STATUS_FORMAT_ERROR,
+    STATUS_MISSING,
+    STATUS_OK,
+    STATUS_OUT_OF_RANGE,
+    STATUS_OUT_OF_SCOPE,
+    convert_many,
+)
+from chrono.dates import STATUS_ERA_MISMATCH, STATUS_LUNAR, convert_dates
+from chrono.prescan import prescan_csv, prescan_rows, prescan_xlsx
+from chrono.extract import iter_mentions, iter_text_chunks
 
 # 연호 변환기
 
-import streamlit as st
-
-# 인증 상태 확인
-if 'authentication_status' not in st.session_state or not st.session_state['authentication_status']:
-    st.error('이 페이지에 접근하려면 로그인이 필요합니다.')
-    st.stop()
+# 인증 상태 확인 (세션 상태만 확인하므로 인증 설정을 다시 읽지 않음)
+require_login()
 
 # 페이지 설정
 st.set_page_config(
@@ -20,107 +32,42 @@ st.set_page_config(
     layout="wide"
 )
 
-# CSS 스타일 적용
-def load_css(css_file):
-    with open(css_file, encoding='utf-8') as f:
-        return f"<style>{f.read()}</style>"
+# 재실행 시간 측정 시작 (?profile=1 일 때 단계별 프로파일링)
+begin_page("연호 변환기")
 
-# 타이포그래피 스타일 적용
-st.markdown(load_css("styles/typography.css"), unsafe_allow_html=True)
+# 타이포그래피 스타일 적용 (프로세스당 한 번만 파일을 읽음)
+apply_styles()
 
 # 사이드바 구성
-with st.sidebar:
-    st.image("https://via.placeholder.com/150x50.png?text=Logo", use_column_width=True)
-    st.divider()
-    
-    st.markdown("### 🧰 도구 모음")
-    st.markdown("현재 사용 가능한 도구:")
-    current_page = "연호 변환기"
-    
-    menu_items = {
-        "🏠 홈": "홈",
-        "📅 연호 변환기": "연호 변환기",
-        "🔜 추가 예정": "추가 예정"
-    }
-    
-    for label, page in menu_items.items():
-        if page == current_page:
-            st.markdown(f"**{label}** ←")
-        else:
-            st.markdown(label)
-    
-    st.divider()
-    st.markdown("### ℹ️ 정보")
-    st.markdown("버전: 1.0.0")
-    st.markdown("[사용 설명서]()")
-    st.markdown("[피드백 보내기]()")
+sidebar("연호 변환기")
 
-def parse_year_input(text):
-    """입력 텍스트에서 연호와 연도를 추출"""
-    text = text.strip()
-    
-    # 단기 패턴 (예: "단기 4300년", "단기4300", "단기 4300")
-    dangi_pattern = r'단기\s*(\d+)년?'
-    dangi_match = re.search(dangi_pattern, text)
-    if dangi_match:
-        year = int(dangi_match.group(1))
-        return "단기", year
-    
-    # 일본 연호 패턴 (한국식/일본식 모두 지원)
-    era_mapping = {
-        '메이지': '메이지',
-        '명치': '메이지',
-        '다이쇼': '다이쇼',
-        '대정': '다이쇼',
-        '쇼와': '쇼와',
-        '소화': '쇼와'
-    }
-    
-    era_pattern = f"({'|'.join(era_mapping.keys())})\s*(\d+)년?"
-    era_match = re.search(era_pattern, text)
-    if era_match:
-        input_era = era_match.group(1)
-        year = int(era_match.group(2))
-        standardized_era = era_mapping[input_era]
-        return standardized_era, year
-    
-    # 숫자만 있는 경우 단기로 간주
-    number_pattern = r'^\s*(\d+)\s*년?\s*$'
-    number_match = re.search(number_pattern, text)
-    if number_match:
-        year = int(number_match.group(1))
-        return "단기", year
-    
-    return None, None
+def era_label(era):
+    """선택 목록용 연호 표기 (예: 메이지 (明治/명치))"""
+    korean = [alias for alias in era.aliases if "가" <= alias[0] <= "힣"]
+    return f"{era.name} ({'/'.join([era.hanja, *korean[:1]])})"
 
-def is_valid_year(era, year):
-    """연호별 유효 기간 검증"""
-    if era == "단기":
-        # 단기는 음수가 되지 않아야 하고, 2002년을 초과하지 않아야 함
-        segi_year = year - 2333
-        return year >= 1 and segi_year <= 2002
-    
-    # 일본 연호별 유효 기간
-    era_limits = {
-        "메이지": (1, 45),    # 1868-1912
-        "다이쇼": (1, 15),    # 1912-1926
-        "쇼와": (1, 64)      # 1926-1989
-    }
-    
-    if era in era_limits:
-        min_year, max_year = era_limits[era]
-        return min_year <= year <= max_year
-    
-    return False
+def era_span(era):
+    """연호의 서기 기간 표기 (예: 1868-1912)"""
+    return f"{era.first_year}-{era.last_year if era.last_year else ''}"
 
-def is_within_project_scope(segi_year):
-    """사업 대상 연도 검증 (2002년 이하)"""
-    return segi_year <= 2002
+# 일반 입력에서 선택할 수 있는 연호 (대한제국/일본)
+KOREAN_ERAS = [era for era in ERAS if era.calendar == "korea"]
+JAPANESE_ERAS = [era for era in ERAS if era.calendar == "japan"]
+
+# 사업 대상 기간 이후에 시작한 연호 (선택 목록에서 제외)
+OUT_OF_SCOPE_ERAS = [era for era in KOREAN_ERAS + JAPANESE_ERAS if era.first_year > PROJECT_MAX_YEAR]
+
+# 문서 추출 결과를 표와 CSV에 담을 최대 건수 (전체 건수는 따로 셈)
+MAX_EXTRACT_ROWS = 10_000
+
+def selectable_eras(eras):
+    """선택 목록에 표시할 연호 (사업 대상 기간 안에 시작한 연호)"""
+    return [era for era in eras if era.first_year <= PROJECT_MAX_YEAR]
 
 def convert_to_segi(era, year):
-    """연호와 연도를 서기로 변환"""
-    # 유효성 검사 추가
-    if not is_valid_year(era, year):
+    """연호와 연도를 서기로 변환 (유효하지 않으면 오류 표시)"""
+    segi_year = convert_era_to_segi(era, year)
+    if segi_year is None:
         if era == "단기":
             segi_year = year - 2333
             if segi_year > 2002:
@@ -128,56 +75,147 @@ def convert_to_segi(era, year):
             else:
                 st.error("유효하지 않은 단기 연도입니다.")
         return None
-        
-    segi_year = None
-    if era == "단기":
-        segi_year = year - 2333
-    elif era == "메이지":
-        segi_year = 1867 + year
-    elif era == "다이쇼":
-        segi_year = 1911 + year
-    elif era == "쇼와":
-        segi_year = 1925 + year
     
     return segi_year
 
 def batch_convert_years(df, column_name):
-    """데이터프레임의 특정 칼럼에서 연호를 일괄 변환"""
-    results = []
-    original_values = []
-    out_of_scope_years = []
+    """데이터프레임의 특정 칼럼에서 연호를 일괄 변환해 결과 칼럼을 추가
     
-    for idx, value in enumerate(df[column_name]):
-        if pd.isna(value):  # 빈 값 처리
-            results.append(None)
-            original_values.append(None)
-            continue
-            
-        value = str(value).strip()
-        era, year = parse_year_input(value)
-        
-        if era and year:
-            segi_year = convert_to_segi(era, year)
-            if segi_year:
-                if not is_within_project_scope(segi_year):
-                    out_of_scope_years.append((idx + 2, value, segi_year))  # Excel 행 번호는 1부터 시작, 헤더 제외
-                results.append(segi_year)
-                original_values.append(value)
-            else:
-                results.append(None)
-                original_values.append(value)
-        else:
-            results.append(None)
-            original_values.append(value)
+    Returns:
+        int: 서기 연도로 변환된 행 수
+    """
+    result = convert_many(df[column_name])
+    converted = result.converted
+    original_values = df[column_name].astype("string").str.strip()
     
-    # 범위 초과 데이터 경고
-    if out_of_scope_years:
+    # 범위 초과 데이터 경고 (Excel 행 번호는 1부터 시작, 헤더 제외)
+    out_of_scope = np.flatnonzero(result.status == STATUS_OUT_OF_SCOPE)
+    if len(out_of_scope):
         warning_msg = "### ⚠️ 사업 대상 기간(~2002년)을 초과하는 데이터가 발견되었습니다:\n\n"
-        for row_num, orig_value, converted_year in out_of_scope_years:
-            warning_msg += f"- {row_num}행: {orig_value} → 서기 {converted_year}년\n"
+        for idx in out_of_scope.tolist():
+            warning_msg += f"- {idx + 2}행: {original_values.iat[idx]} → 서기 {result.segi_years[idx]}년\n"
         st.warning(warning_msg)
     
-    return results, original_values
+    df["원본_연도"] = original_values
+    df["변환_서기"] = pd.Series(result.segi_years, index=df.index, dtype="Int64").where(converted)
+    return int(converted.sum())
+
+# 날짜 변환 상태 표기
+DATE_STATUS_NAMES = {
+    STATUS_OK: "성공",
+    STATUS_MISSING: "빈 값",
+    STATUS_FORMAT_ERROR: "형식 오류",
+    STATUS_OUT_OF_RANGE: "유효하지 않은 날짜",
+    STATUS_OUT_OF_SCOPE: "사업 기간 초과",
+    STATUS_ERA_MISMATCH: "연호 경계 불일치",
+    STATUS_LUNAR: "음력 (변환 불가)",
+}
+
+def batch_convert_dates(df, column_name):
+    """데이터프레임의 특정 칼럼에서 연호 날짜를 일괄 변환해 결과 칼럼을 추가
+    
+    Returns:
+        int: 양력 날짜로 변환된 행 수
+    """
+    result = convert_dates(df[column_name])
+    era_names = {era.code: era.name for era in ERAS}
+    era_names[""] = ""
+    
+    df["변환_날짜"] = result.iso
+    df["실제_연호"] = [era_names[code] for code in result.resolved_era_codes.tolist()]
+    df["변환_상태"] = [DATE_STATUS_NAMES[status] for status in result.status.tolist()]
+    
+    mismatch_count = int((result.status == STATUS_ERA_MISMATCH).sum())
+    if mismatch_count:
+        st.warning(
+            f"⚠️ 표기된 연호의 시행 기간 밖의 날짜가 {mismatch_count:,}건 있습니다. "
+            "(예: 메이지 45년 7월 30일은 다이쇼 원년) '실제_연호' 칼럼을 확인하세요."
+        )
+    lunar_count = int((result.status == STATUS_LUNAR).sum())
+    if lunar_count:
+        st.info(f"양력 시행 이전(일본 1873년, 한국 1896년)의 음력 날짜 {lunar_count:,}건은 날짜로 변환하지 않았습니다.")
+    
+    return int(result.converted.sum())
+
+def collect_mentions(mentions, limit=MAX_EXTRACT_ROWS):
+    """찾은 연호 표기를 표시용 행으로 모으되 처음 limit건만 보관
+    
+    Returns:
+        tuple: (표시용 행 목록, 찾은 전체 건수, 변환 성공 건수)
+    """
+    rows = []
+    total = valid = 0
+    for mention in mentions:
+        total += 1
+        valid += mention.segi_year is not None
+        if len(rows) < limit:
+            rows.append({
+                "위치": mention.start,
+                "원문 표기": mention.text,
+                "연호": mention.era,
+                "연도": mention.year,
+                "변환_서기": mention.segi_year,
+                "사업 대상": "예" if mention.in_scope else "아니오"
+            })
+    return rows, total, valid
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def prescan_csv_upload(file_id, size, _uploaded_file):
+    """CSV 업로드를 데이터프레임으로 읽기 전에 행 단위로 훑어 표본만 변환
+    
+    같은 업로드(file_id, 크기)는 캐시된 결과를 사용하므로 위젯 조작으로 재실행될 때 다시 훑지 않습니다.
+    """
+    _uploaded_file.seek(0)
+    text = io.TextIOWrapper(_uploaded_file, encoding="utf-8-sig", newline="")
+    try:
+        return prescan_csv(text)
+    finally:
+        # 업로드 파일이 함께 닫히지 않도록 분리한 뒤 전체 읽기를 위해 처음으로 되돌림
+        text.detach()
+        _uploaded_file.seek(0)
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def prescan_excel_upload(file_id, size, file_ext, _uploaded_file):
+    """Excel 업로드를 사전 점검 (xlsx는 행 단위로 훑고, xls는 읽은 뒤 행을 훑음, 같은 업로드는 캐시된 결과 사용)"""
+    _uploaded_file.seek(0)
+    try:
+        if file_ext == "xlsx":
+            return prescan_xlsx(_uploaded_file)
+        df = pd.read_excel(_uploaded_file)
+        return prescan_rows(df.itertuples(index=False), df.columns.tolist())
+    finally:
+        _uploaded_file.seek(0)
+
+def read_upload(uploaded_file, file_ext, **kwargs):
+    """업로드 파일을 처음부터 데이터프레임으로 읽기 (nrows, usecols 등은 pandas 읽기 함수에 전달)"""
+    uploaded_file.seek(0)
+    if file_ext == "csv":
+        return pd.read_csv(uploaded_file, **kwargs)
+    return pd.read_excel(uploaded_file, **kwargs)
+
+def show_prescan(prescan, target_column):
+    """사전 점검 결과 표시 (선택한 칼럼의 예상 결과와 추천 칼럼)"""
+    estimate = prescan.get(target_column)
+    sampled = estimate.sampled if estimate else 0
+    st.markdown(f"### 🔍 사전 점검 (표본 {sampled:,}행 / 전체 {prescan.total_rows:,}행)")
+    
+    if estimate:
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("예상 성공률", f"{estimate.success_rate * 100:.1f}%", help=f"95% 오차 범위 ±{estimate.margin * 100:.1f}%p")
+        with col2:
+            st.metric("예상 실패율", f"{estimate.failure_rate * 100:.1f}%")
+        with col3:
+            st.metric("사업 기간 초과", f"{estimate.out_of_scope_rate * 100:.1f}%")
+        with col4:
+            st.metric("빈 값", f"{estimate.missing_rate * 100:.1f}%")
+        
+        if estimate.success_rate < 0.5:
+            st.warning(f"'{target_column}' 칼럼은 절반 이상 변환되지 않을 것으로 예상됩니다. 칼럼 선택과 값 형식을 확인하세요.")
+    
+    suggested = prescan.suggested_column
+    if suggested is not None and suggested != target_column:
+        st.info(f"💡 '{suggested}' 칼럼이 연도 칼럼일 가능성이 높습니다. (예상 성공률 {prescan.get(suggested).success_rate * 100:.1f}%)")
 
 # 헤더
 header(
@@ -192,30 +230,33 @@ with section("도구 소개", "📋"):
     
     with col1:
         with card("연호 체계", icon="📅"):
-            st.markdown("""
-            * **단기(檀紀)**: 한국의 전통 연호
-            * **일본 연호**
-                - 메이지(明治/명치): 1868-1912
-                - 다이쇼(大正/대정): 1912-1926
-                - 쇼와(昭和/소화): 1926-1989
-            """)
+            st.markdown(
+                "* **단기(檀紀)**: 한국의 전통 연호\n"
+                "* **대한제국 연호**\n"
+                + "".join(f"    - {era_label(era)}: {era_span(era)}\n" for era in KOREAN_ERAS)
+                + "* **일본 연호**\n"
+                + "".join(f"    - {era_label(era)}: {era_span(era)}\n" for era in JAPANESE_ERAS)
+            )
     
     with col2:
         with card("변환 규칙", icon="ℹ️"):
-            st.markdown("""
-            1. **단기 → 서기**: 단기 - 2333
-            2. **일본 연호 → 서기**:
-                - 메이지/명치 N년 → 1867 + N
-                - 다이쇼/대정 N년 → 1911 + N
-                - 쇼와/소화 N년 → 1925 + N
-            """)
+            st.markdown(
+                "1. **단기 → 서기**: 단기 - 2333\n"
+                "2. **대한제국/일본 연호 → 서기**: 원년의 서기 연도 + N - 1\n"
+                + "".join(
+                    f"    - {era.name} N년 → {era.first_year - 1} + N\n"
+                    for era in KOREAN_ERAS + JAPANESE_ERAS
+                    if era.first_year >= 1868 or era.calendar == "korea"
+                )
+                + "3. 한자(明治 四十年, 光武 9年), 가나, 전각 숫자, 원년(元年) 표기도 인식합니다.\n"
+            )
 
 # 메인 변환 인터페이스
 with section("연호 변환", "🔄"):
     st.markdown("### 변환 방식 선택")
     
     # 변환 유형 선택
-    tabs = st.tabs(["📝 일반 입력", "✍️ 자유 입력", "📤 일괄 변환"])
+    tabs = st.tabs(["📝 일반 입력", "✍️ 자유 입력", "📤 일괄 변환", "🔎 문서 추출"])
     
     with tabs[0]:  # 일반 입력
         col1, col2 = st.columns([2, 1])
@@ -223,7 +264,7 @@ with section("연호 변환", "🔄"):
         with col1:
             era_type = st.radio(
                 "연호 유형을 선택하세요:",
-                ["단기", "일본 연호"],
+                ["단기", "대한제국 연호", "일본 연호"],
                 horizontal=True,
                 key="era_type"
             )
@@ -244,11 +285,7 @@ with section("연호 변환", "🔄"):
                             segi_year = convert_to_segi("단기", dangi_year)
                             if segi_year is not None:
                                 with result_box("✨ 변환 결과"):
-                                    st.markdown(f'<div style="text-align: center; font-size: 1.2rem;">', unsafe_allow_html=True)
-                                    st.markdown(f"단기 **{dangi_year:,}**년은", unsafe_allow_html=True)
-                                    st.markdown(f'<div style="font-size: 2rem; font-weight: bold; margin: 1rem 0;">서기 {segi_year:,}년</div>', unsafe_allow_html=True)
-                                    st.markdown("입니다.", unsafe_allow_html=True)
-                                    st.markdown('</div>', unsafe_allow_html=True)
+                                    result_highlight(f"단기 <strong>{dangi_year:,}</strong>년은", f"서기 {segi_year:,}년")
                                     
                                     df = pd.DataFrame({
                                         '구분': ['단기', '서기'],
@@ -264,24 +301,24 @@ with section("연호 변환", "🔄"):
                                             "text/csv",
                                             key="download_dangi"
                                         )
-            else:  # 일본 연호
-                with card("일본 연호 입력", icon="🗾"):
-                    japanese_era = st.selectbox(
-                        "일본 연호를 선택하세요:",
-                        ["메이지 (明治/명치)", "다이쇼 (大正/대정)", "쇼와 (昭和/소화)"],
-                        key="japanese_era"
+            else:  # 대한제국/일본 연호
+                is_japanese = era_type == "일본 연호"
+                era_options = selectable_eras(JAPANESE_ERAS if is_japanese else KOREAN_ERAS)
+                with card(f"{era_type} 입력", icon="🗾" if is_japanese else "🇰🇷"):
+                    selected_era = st.selectbox(
+                        f"{era_type}를 선택하세요:",
+                        era_options,
+                        index=era_options.index(ERAS_BY_NAME["메이지"]) if is_japanese else 0,
+                        format_func=era_label,
+                        key=f"era_select_{era_type}"
                     )
+                    hidden = [era.name for era in OUT_OF_SCOPE_ERAS if era.calendar == selected_era.calendar]
+                    if hidden:
+                        st.caption(f"{', '.join(hidden)}은(는) 사업 대상 기간(~{PROJECT_MAX_YEAR}년) 이후의 연호라 목록에서 제외했습니다.")
                     
-                    # 선택된 연호에 따라 max_value 동적 설정
-                    if "메이지" in japanese_era:
-                        max_year = 45
-                        era_name = "메이지"
-                    elif "다이쇼" in japanese_era:
-                        max_year = 15
-                        era_name = "다이쇼"
-                    else:  # 쇼와
-                        max_year = 64
-                        era_name = "쇼와"
+                    # 선택된 연호에 따라 max_value 동적 설정 (사업 대상 기간까지)
+                    era_name = selected_era.name
+                    max_year = min(selected_era.year_limit, PROJECT_MAX_YEAR - selected_era.first_year + 1)
                     
                     jp_year = st.number_input(
                         "연도를 입력하세요:",
@@ -295,22 +332,13 @@ with section("연호 변환", "🔄"):
                     if action_button("변환하기", key="convert_jp"):
                         with st.spinner("변환 중..."):
                             if is_valid_year(era_name, jp_year):
-                                if "메이지" in japanese_era:
-                                    segi_year = 1867 + jp_year
-                                elif "다이쇼" in japanese_era:
-                                    segi_year = 1911 + jp_year
-                                else:  # 쇼와
-                                    segi_year = 1925 + jp_year
+                                segi_year = convert_era_to_segi(era_name, jp_year)
                                 
                                 with result_box("✨ 변환 결과"):
-                                    st.markdown(f'<div style="text-align: center; font-size: 1.2rem;">', unsafe_allow_html=True)
-                                    st.markdown(f"{era_name} **{jp_year}**년은", unsafe_allow_html=True)
-                                    st.markdown(f'<div style="font-size: 2rem; font-weight: bold; margin: 1rem 0;">서기 {segi_year}년</div>', unsafe_allow_html=True)
-                                    st.markdown("입니다.", unsafe_allow_html=True)
-                                    st.markdown('</div>', unsafe_allow_html=True)
+                                    result_highlight(f"{era_name} <strong>{jp_year}</strong>년은", f"서기 {segi_year}년")
                                     
                                     df = pd.DataFrame({
-                                        '구분': ['일본 연호', '서기'],
+                                        '구분': [era_type, '서기'],
                                         '연도': [f'{era_name} {jp_year}년', f'{segi_year}년']
                                     })
                                     csv = df.to_csv(index=False).encode('utf-8-sig')
@@ -348,11 +376,14 @@ with section("연호 변환", "🔄"):
                 - 쇼와 1년 (소화 1년)
                 - 메이지1년 (명치1년)
                 - 다이쇼 1년 (대정 1년)
+                - 明治 四十年, 大正元年, 光武 9年, 隆熙 2年
                 
                 💡 일본 연호는 한국식/일본식 표기 모두 사용 가능:
                 - 메이지(明治) = 명치
                 - 다이쇼(大正) = 대정
                 - 쇼와(昭和) = 소화
+                
+                💡 한자 숫자(四十), 원년(元年), 전각 숫자(４０)도 인식합니다.
                 """)
                 year_input = st.text_input(
                     "연도를 입력하세요:",
@@ -369,17 +400,22 @@ with section("연호 변환", "🔄"):
                             segi_year = convert_to_segi(era, year)
                             if segi_year:
                                 with result_box("✨ 변환 결과"):
-                                    display_era = era
-                                    if era in ["메이지", "다이쇼", "쇼와"]:
-                                        display_value = f"{era} {year}년"
-                                    else:
+                                    if era == "단기":
                                         display_value = f"단기 {year:,}년"
+                                    else:
+                                        display_value = f"{era} {year}년"
+                                    
+                                    result_highlight(f"{display_value}은(는)", f"서기 {segi_year:,}년")
                                     
-                                    st.markdown(f'<div style="text-align: center; font-size: 1.2rem;">', unsafe_allow_html=True)
-                                    st.markdown(f"{display_value}은(는)", unsafe_allow_html=True)
-                                    st.markdown(f'<div style="font-size: 2rem; font-weight: bold; margin: 1rem 0;">서기 {segi_year:,}년</div>', unsafe_allow_html=True)
-                                    st.markdown("입니다.", unsafe_allow_html=True)
-                                    st.markdown('</div>', unsafe_allow_html=True)
+                                    # 같은 해에 쓰인 다른 연호 표기 (개원한 해에는 두 연호가 겹침)
+                                    same_year = [
+                                        f"{other.name} {segi_year - other.first_year + 1}년"
+                                        for calendar in ("korea", "japan")
+                                        for other in ERA_INDEX.eras_for_year(segi_year, calendar)
+                                        if other.name != era
+                                    ]
+                                    if same_year:
+                                        st.caption("같은 해의 다른 연호 표기: " + " / ".join(same_year))
                                     
                                     df = pd.DataFrame({
                                         '구분': ['입력 연호', '서기'],
@@ -419,6 +455,8 @@ with section("연호 변환", "🔄"):
             ### 📤 파일 업로드
             - CSV 또는 Excel 파일을 업로드하세요.
             - 파일에는 연호가 포함된 '생산년도' 칼럼이 있어야 합니다.
+            - '생산년도' 칼럼이 없으면 표본을 미리 변환해 연도 칼럼을 추천합니다.
+            - 변환 결과에는 선택한 칼럼과 변환 결과 칼럼만 담깁니다.
             - 지원하는 형식: 단기 4300년, 쇼와 1년, 메이지5년 등
             """)
             
@@ -434,37 +472,56 @@ with section("연호 변환", "🔄"):
                         # 파일 확장자 확인
                         file_ext = uploaded_file.name.split(".")[-1].lower()
                         
-                        if file_ext == "csv":
-                            df = pd.read_csv(uploaded_file)
-                        else:  # excel
-                            df = pd.read_excel(uploaded_file)
+                        # 사전 점검 (표본만 변환해 칼럼별 결과를 추정하고 연도 칼럼 추천, 파일 전체를 읽기 전에 수행)
+                        file_key = (uploaded_file.file_id, uploaded_file.size)
+                        with profile_stage("사전 점검"):
+                            if file_ext == "csv":
+                                prescan = prescan_csv_upload(*file_key, uploaded_file)
+                            else:  # excel
+                                prescan = prescan_excel_upload(*file_key, file_ext, uploaded_file)
                         
-                        # 칼럼 선택
-                        if "생산년도" in df.columns:
-                            target_column = "생산년도"
+                        # 칼럼 선택 ('생산년도' 칼럼이 없으면 추천 칼럼을 기본으로 선택)
+                        columns = prescan.column_names
+                        if "생산년도" in columns:
+                            default_column = "생산년도"
                         else:
-                            target_column = st.selectbox(
-                                "변환할 연도가 포함된 칼럼을 선택하세요:",
-                                df.columns.tolist()
-                            )
+                            default_column = prescan.suggested_column
+                        target_column = st.selectbox(
+                            "변환할 연도가 포함된 칼럼을 선택하세요:",
+                            columns,
+                            index=columns.index(default_column) if default_column in columns else 0
+                        )
+                        show_prescan(prescan, target_column)
                         
                         st.markdown("### 📊 데이터 미리보기")
-                        st.dataframe(df.head())
+                        with profile_stage("미리보기 렌더링"):
+                            st.dataframe(read_upload(uploaded_file, file_ext, nrows=5))
+                        
+                        convert_unit = st.radio(
+                            "변환 단위",
+                            ["연도", "날짜 (연/월/일)"],
+                            horizontal=True,
+                            help="날짜 단위는 '메이지 45년 7월 30일', '다이쇼 원년 8월'처럼 월/일이 있는 값을 양력 날짜로 변환합니다.",
+                            key="batch_unit"
+                        )
                         
                         if action_button("일괄 변환하기", key="convert_batch"):
                             with st.spinner("변환 작업 진행 중..."):
-                                # 변환 실행
-                                converted_years, original_values = batch_convert_years(df, target_column)
+                                # 변환을 확정한 뒤에만 파일 전체를 읽되, 선택한 칼럼만 위치로 지정해 읽음
+                                with profile_stage("파일 읽기"):
+                                    df = read_upload(uploaded_file, file_ext, usecols=[columns.index(target_column)])
+                                source_column = df.columns[0]
                                 
-                                # 결과를 데이터프레임에 추가
-                                df["원본_연도"] = original_values
-                                df["변환_서기"] = converted_years
+                                # 변환 실행 (결과 칼럼을 데이터프레임에 추가)
+                                with profile_stage("변환"):
+                                    if convert_unit == "연도":
+                                        success_count = batch_convert_years(df, source_column)
+                                    else:
+                                        success_count = batch_convert_dates(df, source_column)
+                                fail_count = len(df) - success_count
                                 
                                 # 결과 표시
                                 with result_box("✨ 변환 결과"):
-                                    success_count = sum(1 for x in converted_years if x is not None)
-                                    fail_count = sum(1 for x in converted_years if x is None)
-                                    
                                     col1, col2, col3 = st.columns(3)
                                     with col1:
                                         st.metric("총 데이터", f"{len(df):,}건")
@@ -474,13 +531,15 @@ with section("연호 변환", "🔄"):
                                         st.metric("변환 실패", f"{fail_count:,}건", delta=f"-{fail_count/len(df)*100:.1f}%")
                                     
                                     st.markdown("### 📊 결과 미리보기")
-                                    st.dataframe(df)
+                                    with profile_stage("결과 표 렌더링"):
+                                        st.dataframe(df)
                                     
                                     # 결과 다운로드
                                     st.markdown("### 💾 결과 저장")
                                     col1, col2, col3 = st.columns([1,1,1])
                                     with col1:
-                                        csv = df.to_csv(index=False).encode('utf-8-sig')
+                                        with profile_stage("CSV 직렬화"):
+                                            csv = df.to_csv(index=False).encode('utf-8-sig')
                                         st.download_button(
                                             "📥 CSV로 저장",
                                             csv,
@@ -489,9 +548,10 @@ with section("연호 변환", "🔄"):
                                             key="download_batch_csv"
                                         )
                                     with col2:
-                                        excel_buffer = io.BytesIO()
-                                        df.to_excel(excel_buffer, index=False)
-                                        excel_data = excel_buffer.getvalue()
+                                        with profile_stage("Excel 직렬화"):
+                                            excel_buffer = io.BytesIO()
+                                            df.to_excel(excel_buffer, index=False)
+                                            excel_data = excel_buffer.getvalue()
                                         st.download_button(
                                             "📥 Excel로 저장",
                                             excel_data,
@@ -502,16 +562,110 @@ with section("연호 변환", "🔄"):
                 
                 except Exception as e:
                     st.error(f"파일 처리 중 오류가 발생했습니다: {str(e)}")
+    
+    with tabs[3]:  # 문서 추출
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            with card("문서에서 연호 찾기", icon="🔎"):
+                st.markdown("""
+                OCR 결과 등 긴 문서 텍스트에서 연호 표기(예: 소화 12년, 明治 四十年)를
+                모두 찾아 서기로 변환합니다.
+                """)
+                source = st.radio(
+                    "입력 방식을 선택하세요:",
+                    ["텍스트 붙여넣기", "텍스트 파일 업로드"],
+                    horizontal=True,
+                    key="extract_source"
+                )
+                
+                if source == "텍스트 붙여넣기":
+                    document_text = st.text_area(
+                        "문서 텍스트를 입력하세요:",
+                        height=200,
+                        key="extract_text",
+                        placeholder="예: ...소화 12년 3월 본교 설립..."
+                    )
+                    document_file = None
+                else:
+                    document_text = ""
+                    document_file = st.file_uploader(
+                        "텍스트 파일을 선택하세요",
+                        type=["txt"],
+                        key="extract_file"
+                    )
+                    encoding = st.selectbox(
+                        "파일 인코딩",
+                        ["utf-8-sig", "cp949"],
+                        help="한글 Windows에서 저장한 파일은 cp949인 경우가 많습니다.",
+                        key="extract_encoding"
+                    )
+                
+                if action_button("연호 찾기", key="extract_run"):
+                    with st.spinner("문서 검사 중..."), profile_stage("문서 추출"):
+                        if document_file is not None:
+                            document_file.seek(0)
+                            reader = io.TextIOWrapper(document_file, encoding=encoding, errors="replace")
+                            try:
+                                rows, total, valid_count = collect_mentions(iter_mentions(iter_text_chunks(reader)))
+                            finally:
+                                # 업로드 파일이 함께 닫히지 않도록 분리 (재실행 때 다시 읽을 수 있게)
+                                reader.detach()
+                        else:
+                            rows, total, valid_count = collect_mentions(iter_mentions([document_text]))
+                    
+                    if not rows:
+                        st.info("문서에서 연호 표기를 찾지 못했습니다.")
+                    else:
+                        with result_box("✨ 추출 결과"):
+                            result_df = pd.DataFrame(rows)
+                            
+                            col_a, col_b = st.columns(2)
+                            with col_a:
+                                st.metric("찾은 표기", f"{total:,}건")
+                            with col_b:
+                                st.metric("변환 성공", f"{valid_count:,}건")
+                            
+                            if total > len(rows):
+                                st.info(
+                                    f"처음 {len(rows):,}건만 표시하고 저장합니다. "
+                                    "전체 결과는 API(POST /api/extract/file)로 받을 수 있습니다."
+                                )
+                            st.dataframe(result_df, use_container_width=True, hide_index=True)
+                            st.download_button(
+                                "📥 CSV로 저장",
+                                result_df.to_csv(index=False).encode('utf-8-sig'),
+                                "연호추출결과.csv",
+                                "text/csv",
+                                key="download_extract"
+                            )
+        
+        with col2:
+            with card("💡 도움말"):
+                st.markdown("""
+                1. 문서 텍스트를 붙여넣거나 .txt 파일을 올리세요
+                2. '연호 찾기' 버튼을 클릭하세요
+                3. 위치는 문서 처음부터의 글자 수입니다
+                
+                **참고**
+                - 큰 파일도 조금씩 나누어 읽으므로 메모리를 적게 사용합니다
+                - 연호 유효 기간을 벗어난 표기는 변환_서기가 비어 있습니다
+                """)
 
 # 주의사항
 info_box("""
 ⚠️ **주의사항**
 - 입력하는 연도는 해당 연호의 유효 기간 내의 값이어야 합니다:
   • 단기(檀紀): ~4335년 (서기 2002년)
-  • 메이지(明治): 1-45년 (1868-1912)
-  • 다이쇼(大正): 1-15년 (1912-1926)
-  • 쇼와(昭和): 1-64년 (1926-1989)
+""" + "".join(
+    f"  • {era.name}({era.hanja}): {era.min_year}-{era.max_year}년 ({era_span(era)})\n"
+    for era in KOREAN_ERAS + JAPANESE_ERAS
+    if era.max_year
+) + """- 1873년(일본)·1896년(한국) 이전 연호의 월일은 음력 기준입니다.
 - 사업 대상은 2002년 이하의 기록물입니다. 2002년을 초과하는 데이터는 오류로 처리됩니다.
 - 변환된 연도는 참고용으로, 중요한 문서에 사용할 경우 반드시 검증이 필요합니다.
 - 일괄 변환 시 변환할 수 없는 형식의 데이터는 원본 값이 유지됩니다.
-""", "warning") 
\ No newline at end of file
+""", "warning") 
+
+# 재실행 시간 기록 및 프로파일 패널 (프로파일링이 켜져 있을 때만 표시)
+finish_page()
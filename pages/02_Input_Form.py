@@ -1,6 +1,13 @@
 import streamlit as st
-import requests
 import pandas as pd
+from typing import List, Optional
+from storage import MetadataStore
+from components.auth import require_login
+from components.startup import begin_page, finish_page, lazy_import, rerun_page
+from components.profiling import profile_stage
+
+# 변환 API를 호출할 때만 임포트 (pandas는 streamlit이 이미 임포트하므로 지연해도 이득이 없음)
+requests = lazy_import("requests")
 
 st.set_page_config(
     page_title="기록물 메타데이터 입력",
@@ -8,6 +15,48 @@ st.set_page_config(
     layout="wide"
 )
 
+API_BASE_URL = "https://8750000-q8ubvx9pkgdh3kv3na4scy.streamlit.app/api"
+
+# 테이블 한 페이지에 표시할 레코드 수
+PAGE_SIZE = 100
+
+# 일괄 변환 요청 하나에 담을 최대 행 수 (API의 MAX_BATCH_SIZE 이하)
+BATCH_SIZE = 1000
+
+# 일괄 입력 칼럼 순서 (스프레드시트에서 복사한 순서)
+BULK_COLUMNS = ["제목", "생산년도", "생산부서"]
+
+@st.cache_resource
+def get_store() -> MetadataStore:
+    """프로세스당 하나의 메타데이터 저장소를 생성합니다."""
+    return MetadataStore()
+
+def export_csv(owner: str) -> bytes:
+    """저장소에서 스트리밍으로 읽은 CSV 조각을 다운로드용 바이트로 합칩니다.
+    
+    st.download_button은 데이터 전체를 받아 미디어 파일로 보관하므로, 다운로드를 준비할 때만 호출합니다.
+    """
+    return b"".join(get_store().iter_csv(owner))
+
+def current_owner() -> str:
+    """현재 로그인한 사용자 (레코드 소유자)"""
+    return st.session_state.get("username") or "anonymous"
+
+def api_headers() -> dict:
+    """API 서버가 사용자별로 요청 속도를 제한하도록 보내는 사용자 식별 헤더
+    
+    이 페이지는 서버에서 API를 호출하므로 헤더가 없으면 모든 사용자가 같은 한도를 나눠 씁니다.
+    """
+    return {"X-Chrono-Session": current_owner()}
+
+def api_error_message(error) -> str:
+    """API 호출 오류 안내 문구 (요청 한도 초과는 재시도 시점을 안내)"""
+    response = getattr(error, "response", None)
+    if response is not None and response.status_code == 429:
+        retry_after = response.headers.get("Retry-After", "1")
+        return f"요청이 많아 잠시 처리할 수 없습니다. {retry_after}초 후 다시 시도해주세요."
+    return f"API 호출 중 오류가 발생했습니다: {str(error)}"
+
 def convert_year(text: str) -> dict:
     """API를 호출하여 연호를 변환합니다."""
     if not text:
@@ -17,20 +66,194 @@ def convert_year(text: str) -> dict:
         }
     
     try:
-        response = requests.post(
-            "https://8750000-q8ubvx9pkgdh3kv3na4scy.streamlit.app/api/convert",
-            json={"text": text},
-            headers={"Content-Type": "application/json"}
+        # 캐시 가능한 GET (앞단의 프록시/CDN 캐시에서 바로 응답)
+        response = requests.get(
+            f"{API_BASE_URL}/convert",
+            params={"text": text},
+            headers=api_headers()
         )
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
-        st.error(f"API 호출 중 오류가 발생했습니다: {str(e)}")
+        st.error(api_error_message(e))
         return {
             "is_valid": False,
             "message": "서버 연결에 실패했습니다. 잠시 후 다시 시도해주세요."
         }
 
+def convert_years(texts: list[str]) -> list[dict]:
+    """API를 BATCH_SIZE개씩 나눠 호출하여 여러 연호를 일괄 변환합니다.
+    
+    결과는 입력 순서와 같은 순서로 반환됩니다.
+    """
+    if not texts:
+        return []
+    
+    try:
+        results = []
+        for start in range(0, len(texts), BATCH_SIZE):
+            response = requests.post(
+                f"{API_BASE_URL}/convert/batch",
+                json={"texts": texts[start:start + BATCH_SIZE]},
+                headers={"Content-Type": "application/json", **api_headers()}
+            )
+            response.raise_for_status()
+            results.extend(response.json()["results"])
+        return results
+    except requests.exceptions.RequestException as e:
+        st.error(api_error_message(e))
+        return [
+            {
+                "is_valid": False,
+                "message": "서버 연결에 실패했습니다. 잠시 후 다시 시도해주세요."
+            }
+            for _ in texts
+        ]
+
+def parse_pasted_rows(text: str) -> tuple[list[dict], list[dict]]:
+    """탭으로 구분된 붙여넣기 텍스트를 행 목록으로 변환합니다.
+    
+    첫 줄이 칼럼명(제목/생산년도/생산부서)이면 건너뜁니다.
+    
+    Returns:
+        tuple[list[dict], list[dict]]: (입력 행 목록, 형식 오류 목록)
+    """
+    rows = []
+    errors = []
+    
+    for line_no, line in enumerate(text.splitlines(), start=1):
+        if not line.strip():
+            continue
+        
+        cells = [cell.strip() for cell in line.split("\t")]
+        if line_no == 1 and cells[:len(BULK_COLUMNS)] == BULK_COLUMNS:
+            continue
+        
+        if len(cells) < len(BULK_COLUMNS):
+            errors.append({
+                "행": line_no,
+                "생산년도": "",
+                "오류": f"칼럼이 {len(BULK_COLUMNS)}개(제목, 생산년도, 생산부서)여야 합니다."
+            })
+            continue
+        
+        row = dict(zip(BULK_COLUMNS, cells))
+        row["행"] = line_no
+        rows.append(row)
+    
+    return rows, errors
+
+def validate_bulk_rows(rows: list[dict]) -> tuple[list[dict], list[dict], list[dict]]:
+    """입력 행의 생산년도를 한 번의 일괄 변환 호출로 검증합니다.
+    
+    Returns:
+        tuple[list[dict], list[dict], list[dict]]: (추가할 메타데이터 목록, 메타데이터별 입력 행, 오류 목록)
+    """
+    records = []
+    record_rows = []
+    errors = []
+    pending = []
+    
+    for row in rows:
+        if not all(row.get(column) for column in BULK_COLUMNS):
+            errors.append({
+                "행": row["행"],
+                "생산년도": row.get("생산년도") or "",
+                "오류": "모든 필드를 입력해주세요."
+            })
+        else:
+            pending.append(row)
+    
+    results = convert_years([row["생산년도"] for row in pending])
+    
+    for row, result in zip(pending, results):
+        if result["is_valid"]:
+            records.append({
+                "제목": row["제목"],
+                "생산년도(단기)": result["original_year"],
+                "생산년도(서기)": result["segi_year"],
+                "생산부서": row["생산부서"]
+            })
+            record_rows.append(row)
+        else:
+            errors.append({
+                "행": row["행"],
+                "생산년도": row["생산년도"],
+                "오류": result["message"]
+            })
+    
+    return records, record_rows, errors
+
+def add_bulk_records(rows: list[dict], format_errors: Optional[List[dict]] = None):
+    """검증된 행을 한 번에 테이블에 추가하고 결과를 세션에 기록합니다.
+    
+    중복 레코드(제목, 생산년도, 생산부서 동일)는 저장소가 추가하면서 함께 검사하므로
+    다른 세션이 같은 레코드를 동시에 추가해도 한 번만 저장됩니다.
+    """
+    with profile_stage("일괄 검증"):
+        records, record_rows, errors = validate_bulk_rows(rows)
+    
+    result = get_store().append(
+        current_owner(), records, allow_duplicates=st.session_state.get("allow_duplicates", False)
+    )
+    for position, first_position in result.duplicates:
+        row = record_rows[position]
+        errors.append({
+            "행": row["행"],
+            "생산년도": row["생산년도"],
+            "오류": (
+                "이미 입력된 기록물입니다." if first_position is None
+                else f"{record_rows[first_position]['행']}행과 중복된 기록물입니다."
+            )
+        })
+    
+    st.session_state.bulk_report = {
+        "added": result.added,
+        "errors": sorted((format_errors or []) + errors, key=lambda error: error["행"])
+    }
+    
+    # 입력 위젯 초기화 (위젯 키를 바꿔 새 위젯으로 생성)
+    st.session_state.bulk_version += 1
+    rerun_page()
+
+def bulk_grid_editor():
+    """표 편집으로 여러 행을 입력받아 한 번에 추가합니다."""
+    edited = st.data_editor(
+        pd.DataFrame({column: pd.Series(dtype="str") for column in BULK_COLUMNS}),
+        num_rows="dynamic",
+        use_container_width=True,
+        hide_index=True,
+        key=f"bulk_grid_{st.session_state.bulk_version}"
+    )
+    
+    if st.button("검증 후 일괄 추가", use_container_width=True, type="primary", key="bulk_grid_add"):
+        rows = []
+        for line_no, values in enumerate(edited.itertuples(index=False), start=1):
+            row = {
+                column: ("" if pd.isna(value) else str(value).strip())
+                for column, value in zip(BULK_COLUMNS, values)
+            }
+            if any(row.values()):
+                row["행"] = line_no
+                rows.append(row)
+        
+        if not rows:
+            st.error("입력된 행이 없습니다.")
+        else:
+            add_bulk_records(rows)
+
+def show_bulk_report():
+    """직전 일괄 추가 결과를 한 번만 표시합니다."""
+    report = st.session_state.pop("bulk_report", None)
+    if not report:
+        return
+    
+    if report["added"]:
+        st.success(f"메타데이터 {report['added']:,}건이 추가되었습니다.")
+    if report["errors"]:
+        st.error(f"{len(report['errors']):,}건은 추가되지 않았습니다. 아래 내용을 확인해주세요.")
+        st.dataframe(pd.DataFrame(report["errors"]), use_container_width=True, hide_index=True)
+
 def on_year_change():
     """생산년도 입력값이 변경될 때 호출되는 콜백 함수"""
     if 'year' in st.session_state and st.session_state.year:
@@ -44,122 +267,203 @@ def on_year_change():
             st.session_state.year_error = result["message"]
 
 def main():
+    # 인증 상태 확인 (세션 상태만 확인하므로 인증 설정을 다시 읽지 않음)
+    require_login()
+    begin_page("메타데이터 입력")
     st.title("기록물 메타데이터 입력")
     
     # 세션 상태 초기화
-    if 'metadata_list' not in st.session_state:
-        st.session_state.metadata_list = []
+    store = get_store()
+    owner = current_owner()
     if 'year_valid' not in st.session_state:
         st.session_state.year_valid = False
+    if 'bulk_version' not in st.session_state:
+        st.session_state.bulk_version = 0
     
     # 메타데이터 입력 섹션
     st.subheader("메타데이터 입력")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        title = st.text_input(
-            "제목",
-            placeholder="기록물 제목을 입력하세요",
-            help="기록물의 제목을 입력하세요.",
-            key="title"
-        )
+    show_bulk_report()
+    st.checkbox(
+        "중복 레코드도 추가",
+        key="allow_duplicates",
+        help="제목, 생산년도, 생산부서가 모두 같은 기록물이 이미 있어도 추가합니다."
+    )
+    single_tab, paste_tab, grid_tab = st.tabs(["단건 입력", "일괄 붙여넣기", "표 편집"])
     
-    with col2:
-        year = st.text_input(
-            "생산년도",
-            placeholder="예: 단기 4356",
-            help="단기 연도를 입력하세요. 자동으로 서기로 변환됩니다.",
-            key="year",
-            on_change=on_year_change
-        )
+    with single_tab:
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            title = st.text_input(
+                "제목",
+                placeholder="기록물 제목을 입력하세요",
+                help="기록물의 제목을 입력하세요.",
+                key="title"
+            )
+        
+        with col2:
+            year = st.text_input(
+                "생산년도",
+                placeholder="예: 단기 4356",
+                help="단기 연도를 입력하세요. 자동으로 서기로 변환됩니다.",
+                key="year",
+                on_change=on_year_change
+            )
+            
+            # 연도 변환 결과 표시
+            if 'year_valid' in st.session_state:
+                if st.session_state.year_valid:
+                    st.success(f"서기: {st.session_state.segi_year}년")
+                elif 'year_error' in st.session_state and st.session_state.year:
+                    st.error(st.session_state.year_error)
+        
+        with col3:
+            department = st.text_input(
+                "생산부서",
+                placeholder="생산부서를 입력하세요",
+                help="기록물을 생산한 부서명을 입력하세요.",
+                key="department"
+            )
         
-        # 연도 변환 결과 표시
-        if 'year_valid' in st.session_state:
-            if st.session_state.year_valid:
-                st.success(f"서기: {st.session_state.segi_year}년")
-            elif 'year_error' in st.session_state and st.session_state.year:
-                st.error(st.session_state.year_error)
-    
-    with col3:
-        department = st.text_input(
-            "생산부서",
-            placeholder="생산부서를 입력하세요",
-            help="기록물을 생산한 부서명을 입력하세요.",
-            key="department"
+        # 추가 버튼
+        if st.button("메타데이터 추가", use_container_width=True, type="primary"):
+            if not all([title, year, department]):
+                st.error("모든 필드를 입력해주세요.")
+            elif not st.session_state.year_valid:
+                st.error("유효한 생산년도를 입력해주세요.")
+            else:
+                # 메타데이터 추가
+                metadata = {
+                    "제목": title,
+                    "생산년도(단기)": st.session_state.dangi_year,
+                    "생산년도(서기)": st.session_state.segi_year,
+                    "생산부서": department
+                }
+                # 중복 검사와 추가를 저장소의 쓰기 잠금 안에서 함께 수행
+                result = store.append(owner, [metadata], allow_duplicates=st.session_state.allow_duplicates)
+                if result.duplicates:
+                    st.warning("이미 입력된 기록물입니다. (제목, 생산년도, 생산부서 동일) 그래도 추가하려면 '중복 레코드도 추가'를 선택하세요.")
+                else:
+                    st.success("메타데이터가 추가되었습니다.")
+                    
+                    # 입력 필드 초기화
+                    for key in ["title", "year", "department"]:
+                        st.session_state[key] = ""
+                    st.session_state.year_valid = False
+                    rerun_page()
+        
+    with paste_tab:
+        st.caption("스프레드시트에서 제목, 생산년도, 생산부서 순서의 칼럼을 복사해 붙여넣으세요. 첫 줄의 칼럼명은 건너뜁니다.")
+        pasted = st.text_area(
+            "붙여넣기",
+            height=240,
+            placeholder="제목\t생산년도\t생산부서",
+            key=f"bulk_paste_{st.session_state.bulk_version}"
         )
+        
+        if st.button("검증 후 일괄 추가", use_container_width=True, type="primary", key="bulk_paste_add"):
+            rows, format_errors = parse_pasted_rows(pasted)
+            if not rows and not format_errors:
+                st.error("붙여넣은 내용이 없습니다.")
+            else:
+                add_bulk_records(rows, format_errors)
     
-    # 추가 버튼
-    if st.button("메타데이터 추가", use_container_width=True, type="primary"):
-        if not all([title, year, department]):
-            st.error("모든 필드를 입력해주세요.")
-        elif not st.session_state.year_valid:
-            st.error("유효한 생산년도를 입력해주세요.")
-        else:
-            # 메타데이터 추가
-            metadata = {
-                "제목": title,
-                "생산년도(단기)": st.session_state.dangi_year,
-                "생산년도(서기)": st.session_state.segi_year,
-                "생산부서": department
-            }
-            st.session_state.metadata_list.append(metadata)
-            st.success("메타데이터가 추가되었습니다.")
-            
-            # 입력 필드 초기화
-            for key in ["title", "year", "department"]:
-                st.session_state[key] = ""
-            st.session_state.year_valid = False
-            st.rerun()
+    with grid_tab:
+        st.caption("표에 직접 입력하거나 여러 행을 붙여넣은 뒤 한 번에 추가하세요.")
+        # 탭 내용은 선택하지 않아도 매 재실행마다 그려지므로 표(pandas)는 열었을 때만 만듦
+        if st.toggle("표 편집 열기", key="bulk_grid_open"):
+            bulk_grid_editor()
     
     # 구분선
     st.divider()
     
-    # 메타데이터 테이블 표시
-    if st.session_state.metadata_list:
+    # 메타데이터 테이블 표시 (저장소에서 페이지 단위로 조회)
+    revision = store.revision(owner)
+    if revision[0]:
         st.subheader("입력된 메타데이터")
-        df = pd.DataFrame(st.session_state.metadata_list)
-        st.dataframe(
-            df,
-            use_container_width=True,
-            hide_index=True,
-            column_config={
-                "제목": st.column_config.TextColumn(
-                    "제목",
-                    width="large"
-                ),
-                "생산년도(단기)": st.column_config.NumberColumn(
-                    "생산년도(단기)",
-                    help="단기 연도"
-                ),
-                "생산년도(서기)": st.column_config.NumberColumn(
-                    "생산년도(서기)",
-                    help="서기 연도"
-                ),
-                "생산부서": st.column_config.TextColumn(
-                    "생산부서",
-                    width="medium"
-                )
-            }
-        )
+        query = st.text_input(
+            "검색",
+            placeholder="제목 또는 생산부서로 검색",
+            help="입력한 단어를 모두 포함하는 기록물만 표시합니다.",
+            key="table_query"
+        ).strip()
+        
+        # 검색어가 있으면 색인에서 찾은 id만 페이지 단위로 조회
+        matched_ids = store.search(owner, query) if query else None
+        total_count = len(matched_ids) if matched_ids is not None else revision[0]
+        if not total_count:
+            st.info("검색 결과가 없습니다.")
+        
+        # 페이지 번호는 위젯이 관리하고, 처음에는 마지막 페이지를 보여주며 범위를 벗어나면 위젯을 만들기 전에 맞춤
+        page_count = max(total_count - 1, 0) // PAGE_SIZE + 1
+        if "table_page" not in st.session_state or st.session_state.table_page > page_count:
+            st.session_state.table_page = page_count
+        page_col, count_col = st.columns([1, 3])
+        with page_col:
+            page = st.number_input(
+                "페이지",
+                min_value=1,
+                max_value=page_count,
+                help=f"한 페이지에 {PAGE_SIZE}건씩 표시합니다.",
+                key="table_page"
+            )
+        with count_col:
+            st.markdown(f"총 **{total_count:,}**건 · {page_count:,}페이지")
+        
+        with profile_stage("저장소 조회"):
+            if matched_ids is not None:
+                start = (page - 1) * PAGE_SIZE
+                records = store.fetch_by_ids(matched_ids[start:start + PAGE_SIZE])
+            else:
+                records = store.fetch_page(owner, page - 1, PAGE_SIZE)
+            df = pd.DataFrame(records, columns=["제목", "생산년도(단기)", "생산년도(서기)", "생산부서"])
+        
+        with profile_stage("표 렌더링"):
+            st.dataframe(
+                df,
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    "제목": st.column_config.TextColumn(
+                        "제목",
+                        width="large"
+                    ),
+                    "생산년도(단기)": st.column_config.NumberColumn(
+                        "생산년도(단기)",
+                        help="단기 연도"
+                    ),
+                    "생산년도(서기)": st.column_config.NumberColumn(
+                        "생산년도(서기)",
+                        help="서기 연도"
+                    ),
+                    "생산부서": st.column_config.TextColumn(
+                        "생산부서",
+                        width="medium"
+                    )
+                }
+            )
         
         col1, col2 = st.columns(2)
         with col1:
-            # 데이터 다운로드 버튼
-            csv = df.to_csv(index=False).encode('utf-8-sig')
-            st.download_button(
-                label="CSV 다운로드",
-                data=csv,
-                file_name="metadata.csv",
-                mime="text/csv",
-                help="입력된 메타데이터를 CSV 파일로 다운로드합니다.",
-                use_container_width=True
-            )
+            # 데이터 다운로드 (준비 버튼을 누른 재실행에서만 CSV를 생성)
+            if st.button("CSV 내보내기 준비", use_container_width=True, help="입력된 메타데이터를 CSV 파일로 만듭니다."):
+                with profile_stage("CSV 내보내기"):
+                    st.download_button(
+                        label="CSV 다운로드",
+                        data=export_csv(owner),
+                        file_name="metadata.csv",
+                        mime="text/csv",
+                        help="입력된 메타데이터를 CSV 파일로 다운로드합니다.",
+                        use_container_width=True
+                    )
         
         with col2:
             # 테이블 초기화 버튼
             if st.button("테이블 초기화", type="secondary", use_container_width=True):
-                st.session_state.metadata_list = []
-                st.rerun()
+                store.clear(owner)
+                rerun_page()
+    
+    finish_page()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
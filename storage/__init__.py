@@ -0,0 +1,6 @@
+"""
+기록물 메타데이터 저장소 패키지
+"""
+
+from .metadata_store import AppendResult, MetadataStore, METADATA_COLUMNS
+from .metadata_index import MetadataIndex
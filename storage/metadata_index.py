@@ -0,0 +1,104 @@
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional
+
+_SEPARATOR_PATTERN = re.compile(r"[\s\W_]+")
+
+def normalize_text(text) -> str:
+    """비교용 정규화 (NFKC, 소문자, 공백 정리)"""
+    if text is None:
+        return ""
+    text = unicodedata.normalize("NFKC", str(text)).casefold()
+    return " ".join(text.split())
+
+def record_key(title, segi_year, department) -> tuple:
+    """중복 판정용 레코드 키 (제목, 서기 생산년도, 생산부서)"""
+    return normalize_text(title), segi_year, normalize_text(department)
+
+def tokenize(text) -> set:
+    """검색용 토큰 (단어별 2글자 단위 조각, 1글자 단어는 그대로)
+    
+    한글 제목은 띄어쓰기 없이 붙여 쓰는 경우가 많아 단어 단위 대신
+    2-gram으로 색인해 부분 문자열 검색을 지원합니다.
+    """
+    tokens = set()
+    for word in _SEPARATOR_PATTERN.split(normalize_text(text)):
+        if len(word) == 1:
+            tokens.add(word)
+        for i in range(len(word) - 1):
+            tokens.add(word[i:i + 2])
+    return tokens
+
+class MetadataIndex:
+    """메타데이터 중복 검사용 해시 색인과 제목/생산부서 역색인
+    
+    레코드가 추가될 때마다 점진적으로 갱신되며, 레코드 id는 증가하는
+    순서로만 추가되므로 역색인의 각 목록은 항상 정렬된 상태를 유지합니다.
+    """
+    
+    def __init__(self):
+        self._keys: Dict[tuple, int] = {}
+        self._postings: Dict[str, List[int]] = {}
+        self._texts: Dict[int, str] = {}
+    
+    def __len__(self) -> int:
+        return len(self._texts)
+    
+    def add(self, record_id: int, title, segi_year, department):
+        """레코드 하나를 색인에 추가"""
+        self._keys.setdefault(record_key(title, segi_year, department), record_id)
+        
+        text = f"{normalize_text(title)} {normalize_text(department)}"
+        self._texts[record_id] = text
+        for token in tokenize(text):
+            self._postings.setdefault(token, []).append(record_id)
+    
+    def find_duplicate(self, title, segi_year, department) -> Optional[int]:
+        """같은 키의 레코드 id (없으면 None)"""
+        return self._keys.get(record_key(title, segi_year, department))
+    
+    def search(self, query: str) -> List[int]:
+        """검색어의 모든 단어를 제목 또는 생산부서에 포함하는 레코드 id 목록 (입력 순)
+        
+        역색인 목록의 교집합으로 후보를 좁힌 뒤 후보에 대해서만 부분 문자열을 확인합니다.
+        """
+        words = [word for word in _SEPARATOR_PATTERN.split(normalize_text(query)) if word]
+        if not words:
+            return []
+        
+        candidates = None
+        for word in words:
+            if len(word) == 1:
+                ids = self._ids_for_char(word)
+            else:
+                ids = self._ids_for_tokens(word[i:i + 2] for i in range(len(word) - 1))
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                return []
+        
+        return sorted(
+            record_id for record_id in candidates
+            if all(word in self._texts[record_id] for word in words)
+        )
+    
+    def _ids_for_tokens(self, tokens: Iterable[str]) -> set:
+        """모든 토큰을 포함하는 레코드 id (짧은 목록부터 교집합)"""
+        postings = [self._postings.get(token, []) for token in set(tokens)]
+        postings.sort(key=len)
+        if not postings or not postings[0]:
+            return set()
+        
+        ids = set(postings[0])
+        for posting in postings[1:]:
+            ids.intersection_update(posting)
+            if not ids:
+                break
+        return ids
+    
+    def _ids_for_char(self, char: str) -> set:
+        """한 글자 검색어: 해당 글자를 포함하는 토큰들의 합집합"""
+        ids = set()
+        for token, posting in list(self._postings.items()):
+            if char in token:
+                ids.update(posting)
+        return ids
@@ -0,0 +1,276 @@
+import csv
+import io
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .metadata_index import MetadataIndex, record_key
+
+# (DB 칼럼명, 화면/CSV 칼럼명)
+METADATA_COLUMNS = [
+    ("title", "제목"),
+    ("dangi_year", "생산년도(단기)"),
+    ("segi_year", "생산년도(서기)"),
+    ("department", "생산부서"),
+]
+
+DEFAULT_DB_PATH = os.environ.get("METADATA_DB_PATH", "data/metadata.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metadata (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    owner TEXT NOT NULL,
+    title TEXT NOT NULL,
+    dangi_year INTEGER,
+    segi_year INTEGER,
+    department TEXT NOT NULL,
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_metadata_owner_id ON metadata (owner, id);
+"""
+
+@dataclass
+class AppendResult:
+    """레코드 추가 결과
+    
+    Attributes:
+        record_ids (List[int]): 추가된 레코드 id (입력 순)
+        duplicates (List[Tuple[int, Optional[int]]]): 중복이라 추가하지 않은 (레코드 위치, 같은 입력 안에서 먼저 나온 위치)
+            (이미 저장된 레코드와 중복이면 먼저 나온 위치는 None)
+    """
+    record_ids: List[int] = field(default_factory=list)
+    duplicates: List[Tuple[int, Optional[int]]] = field(default_factory=list)
+    
+    @property
+    def added(self) -> int:
+        """추가된 레코드 수"""
+        return len(self.record_ids)
+
+class MetadataStore:
+    """SQLite(WAL) 기반 메타데이터 저장소
+    
+    레코드는 추가만 되며(append-only), 사용자(owner)별로 분리되어 저장됩니다.
+    화면 표시는 (owner, id) 인덱스를 이용한 페이지 단위 조회로,
+    CSV 내보내기는 커서에서 일정 크기씩 읽어 스트리밍으로 처리합니다.
+    중복 검사와 검색은 사용자별 메모리 색인(MetadataIndex)을 사용하며,
+    색인은 처음 사용할 때 한 번 구축된 뒤 레코드 추가 시 점진적으로 갱신됩니다.
+    
+    Streamlit 세션은 각자 다른 스레드에서 실행되므로 연결은 스레드별로 생성합니다.
+    """
+    
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._indexes: Dict[str, MetadataIndex] = {}
+        
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        
+        conn = self._connection()
+        conn.executescript(_SCHEMA)
+    
+    def _connection(self) -> sqlite3.Connection:
+        """현재 스레드의 DB 연결을 반환 (없으면 생성)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+    
+    def append(self, owner: str, records: List[dict], allow_duplicates: bool = True) -> AppendResult:
+        """레코드를 한 트랜잭션으로 추가
+        
+        allow_duplicates가 False이면 이미 저장된 레코드나 같은 입력 안에서 먼저 나온 레코드와
+        (제목, 생산년도, 생산부서)가 같은 레코드는 건너뜁니다. 중복 검사와 추가를 같은 쓰기 잠금 안에서
+        하므로 여러 세션이 같은 레코드를 동시에 추가해도 하나만 저장됩니다.
+        
+        Args:
+            owner (str): 레코드를 입력한 사용자
+            records (List[dict]): 화면 칼럼명(제목, 생산년도(단기) 등)을 키로 하는 레코드 목록
+            allow_duplicates (bool): 중복 레코드도 추가할지 여부
+            
+        Returns:
+            AppendResult: 추가된 레코드 id와 건너뛴 중복 레코드 위치
+        """
+        result = AppendResult()
+        if not records:
+            return result
+        
+        rows = [
+            tuple(record.get(label) for _, label in METADATA_COLUMNS)
+            for record in records
+        ]
+        conn = self._connection()
+        with self._write_lock:
+            if not allow_duplicates:
+                rows = self._skip_duplicates(owner, rows, result)
+                if not rows:
+                    return result
+            
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                record_ids = [
+                    conn.execute(
+                        "INSERT INTO metadata (owner, title, dangi_year, segi_year, department) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (owner, *row)
+                    ).lastrowid
+                    for row in rows
+                ]
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            
+            index = self._indexes.get(owner)
+            if index is not None:
+                for record_id, (title, _, segi_year, department) in zip(record_ids, rows):
+                    index.add(record_id, title, segi_year, department)
+        result.record_ids = record_ids
+        return result
+    
+    def _skip_duplicates(self, owner: str, rows: List[tuple], result: AppendResult) -> List[tuple]:
+        """중복 행을 result.duplicates에 기록하고 나머지 행을 반환 (쓰기 잠금 안에서 호출)"""
+        index = self._build_index(owner)
+        first_positions: Dict[tuple, int] = {}
+        kept = []
+        for position, row in enumerate(rows):
+            title, _, segi_year, department = row
+            key = record_key(title, segi_year, department)
+            if index.find_duplicate(title, segi_year, department) is not None:
+                result.duplicates.append((position, None))
+            elif key in first_positions:
+                result.duplicates.append((position, first_positions[key]))
+            else:
+                first_positions[key] = position
+                kept.append(row)
+        return kept
+    
+    def index(self, owner: str) -> MetadataIndex:
+        """사용자의 중복 검사/검색 색인 (처음 호출 시 DB에서 한 번 구축)"""
+        index = self._indexes.get(owner)
+        if index is not None:
+            return index
+        
+        with self._write_lock:
+            return self._build_index(owner)
+    
+    def _build_index(self, owner: str) -> MetadataIndex:
+        """색인이 없으면 DB에서 구축 (쓰기 잠금 안에서 호출)"""
+        index = self._indexes.get(owner)
+        if index is None:
+            index = MetadataIndex()
+            cursor = self._connection().execute(
+                "SELECT id, title, segi_year, department FROM metadata "
+                "WHERE owner = ? ORDER BY id",
+                (owner,)
+            )
+            for record_id, title, segi_year, department in cursor:
+                index.add(record_id, title, segi_year, department)
+            self._indexes[owner] = index
+        return index
+    
+    def find_duplicate(self, owner: str, record: dict) -> Optional[int]:
+        """같은 (제목, 생산년도, 생산부서) 레코드의 id (없으면 None)"""
+        return self.index(owner).find_duplicate(
+            record.get("제목"), record.get("생산년도(서기)"), record.get("생산부서")
+        )
+    
+    def search(self, owner: str, query: str) -> List[int]:
+        """제목/생산부서 검색 결과 레코드 id 목록 (입력 순)"""
+        return self.index(owner).search(query)
+    
+    def count(self, owner: str) -> int:
+        """사용자의 레코드 수"""
+        row = self._connection().execute(
+            "SELECT COUNT(*) FROM metadata WHERE owner = ?", (owner,)
+        ).fetchone()
+        return row[0]
+    
+    def revision(self, owner: str) -> tuple[int, int]:
+        """사용자 레코드의 변경 여부를 판단하기 위한 (레코드 수, 마지막 id)"""
+        row = self._connection().execute(
+            "SELECT COUNT(*), COALESCE(MAX(id), 0) FROM metadata WHERE owner = ?", (owner,)
+        ).fetchone()
+        return row[0], row[1]
+    
+    def fetch_page(self, owner: str, page: int, page_size: int = 100) -> List[dict]:
+        """입력 순서대로 한 페이지 분량의 레코드를 조회
+        
+        Args:
+            owner (str): 사용자
+            page (int): 0부터 시작하는 페이지 번호
+            page_size (int): 페이지 크기
+            
+        Returns:
+            List[dict]: 화면 칼럼명을 키로 하는 레코드 목록
+        """
+        columns = ", ".join(name for name, _ in METADATA_COLUMNS)
+        cursor = self._connection().execute(
+            f"SELECT {columns} FROM metadata WHERE owner = ? ORDER BY id LIMIT ? OFFSET ?",
+            (owner, page_size, page * page_size)
+        )
+        labels = [label for _, label in METADATA_COLUMNS]
+        return [dict(zip(labels, row)) for row in cursor]
+    
+    def fetch_by_ids(self, record_ids: List[int]) -> List[dict]:
+        """id 목록에 해당하는 레코드를 id 순서대로 조회"""
+        if not record_ids:
+            return []
+        
+        columns = ", ".join(name for name, _ in METADATA_COLUMNS)
+        placeholders = ", ".join("?" for _ in record_ids)
+        cursor = self._connection().execute(
+            f"SELECT {columns} FROM metadata WHERE id IN ({placeholders}) ORDER BY id",
+            list(record_ids)
+        )
+        labels = [label for _, label in METADATA_COLUMNS]
+        return [dict(zip(labels, row)) for row in cursor]
+    
+    def iter_csv(self, owner: str, chunk_size: int = 5000) -> Iterator[bytes]:
+        """사용자의 레코드를 CSV(UTF-8 BOM) 조각으로 스트리밍
+        
+        전체 레코드를 메모리에 올리지 않고 chunk_size 행씩 읽어 인코딩합니다.
+        """
+        columns = ", ".join(name for name, _ in METADATA_COLUMNS)
+        cursor = self._connection().execute(
+            f"SELECT {columns} FROM metadata WHERE owner = ? ORDER BY id", (owner,)
+        )
+        
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow([label for _, label in METADATA_COLUMNS])
+        yield buffer.getvalue().encode("utf-8-sig")
+        
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(rows)
+            yield buffer.getvalue().encode("utf-8")
+    
+    def clear(self, owner: str) -> int:
+        """사용자의 레코드를 모두 삭제
+        
+        Returns:
+            int: 삭제된 레코드 수
+        """
+        conn = self._connection()
+        with self._write_lock:
+            cursor = conn.execute("DELETE FROM metadata WHERE owner = ?", (owner,))
+            self._indexes.pop(owner, None)
+        return cursor.rowcount
+    
+    def close(self):
+        """현재 스레드의 DB 연결 종료"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -0,0 +1,111 @@
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from api.admission import REJECTED, AdmissionConfig, AdmissionController, TokenBucket
+from api.main import create_app
+from api.metrics import REQUESTS
+
+def test_token_bucket_refills_at_rate():
+    bucket = TokenBucket(burst=2, now=0.0)
+    assert bucket.take(rate=1.0, burst=2, now=0.0) == 0
+    assert bucket.take(rate=1.0, burst=2, now=0.0) == 0
+    assert bucket.take(rate=1.0, burst=2, now=0.0) == pytest.approx(1.0)
+    assert bucket.take(rate=1.0, burst=2, now=1.0) == 0
+
+def test_priority_lane_uses_reserved_slots_first():
+    controller = AdmissionController(AdmissionConfig(max_in_flight=1, priority_in_flight=1))
+    
+    assert controller.acquire("shared") == "shared"
+    assert controller.acquire("shared") is None
+    assert controller.acquire("priority") == "priority"
+    assert controller.acquire("priority") is None
+    
+    controller.release("shared")
+    assert controller.acquire("priority") == "shared"
+
+def test_rate_zero_disables_rate_limit():
+    controller = AdmissionController(AdmissionConfig(rate=0))
+    assert all(controller.check_rate("client", "shared") == 0 for _ in range(1000))
+
+def make_client(**config):
+    return TestClient(create_app(AdmissionConfig(client_header="x-forwarded-for", **config)))
+
+def convert(client, session=None, address="10.0.0.1"):
+    headers = {"X-Forwarded-For": address}
+    if session:
+        headers["X-Chrono-Session"] = session
+    return client.post("/api/convert", json={"text": "단기 4300"}, headers=headers)
+
+def test_clients_are_limited_separately():
+    client = make_client(rate=1, burst=1)
+    
+    assert convert(client, address="10.0.0.1").status_code == 200
+    assert convert(client, address="10.0.0.2").status_code == 200
+    assert convert(client, address="10.0.0.1").status_code == 429
+
+def test_rate_limit_returns_429_with_retry_after():
+    client = make_client(rate=1, burst=2, trusted_clients=frozenset())
+    statuses = [convert(client).status_code for _ in range(3)]
+    
+    assert statuses == [200, 200, 429]
+    response = convert(client)
+    assert response.headers["retry-after"] == "1"
+    assert "detail" in response.json()
+
+def test_session_header_from_trusted_client_gets_own_bucket():
+    client = make_client(rate=1, burst=1, trusted_clients=frozenset({"10.0.0.1"}))
+    
+    assert convert(client, "kim").status_code == 200
+    assert convert(client, "kim").status_code == 429
+    assert convert(client, "lee").status_code == 200
+
+def test_session_header_from_untrusted_client_is_ignored():
+    client = make_client(rate=1, burst=1, trusted_clients=frozenset())
+    
+    assert convert(client, "kim").status_code == 200
+    assert convert(client, "lee").status_code == 429
+
+def test_rejected_requests_are_labelled_with_route():
+    client = make_client(rate=1, burst=1, trusted_clients=frozenset())
+    rejected = REJECTED.value(lane="priority", route="/api/convert", reason="rate")
+    requests_429 = REQUESTS.value(method="POST", route="/api/convert", status=429)
+    
+    convert(client)
+    convert(client)
+    
+    assert REJECTED.value(lane="priority", route="/api/convert", reason="rate") == rejected + 1
+    assert REQUESTS.value(method="POST", route="/api/convert", status=429) == requests_429 + 1
+
+def test_exempt_paths_are_not_limited():
+    client = make_client(rate=1, burst=1)
+    assert all(client.get("/healthz").status_code == 200 for _ in range(5))
+
+def test_websocket_messages_share_a_token_bucket():
+    client = make_client(rate=0.001, burst=3)
+    before = REJECTED.value(lane="live", route="/ws/convert", reason="rate")
+    
+    with client.websocket_connect("/ws/convert", headers={"X-Forwarded-For": "10.0.1.1"}) as websocket:
+        websocket.send_text("단기 4300")
+        assert websocket.receive_json()["segi_year"] == 1967
+        websocket.send_text("단기 4301")
+        assert websocket.receive_json()["segi_year"] == 1968
+        
+        # 연결 1 + 메시지 2로 토큰을 모두 씀
+        websocket.send_text("단기 4302")
+        rejected = websocket.receive_json()
+        assert rejected["retry_after"] >= 1
+        assert "detail" in rejected
+    
+    assert REJECTED.value(lane="live", route="/ws/convert", reason="rate") == before + 1
+
+def test_websocket_connection_refused_when_over_rate():
+    client = make_client(rate=0.001, burst=1)
+    headers = {"X-Forwarded-For": "10.0.1.2"}
+    with client.websocket_connect("/ws/convert", headers=headers):
+        pass
+    
+    with pytest.raises(WebSocketDisconnect) as excinfo:
+        with client.websocket_connect("/ws/convert", headers=headers):
+            pass
+    assert excinfo.value.code == 1013
@@ -0,0 +1,184 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.admission import AdmissionConfig
+from api.chrono_api import CACHE_CONTROL, MAX_BATCH_SIZE, conversion_etag, etag_matches
+from api.main import create_app
+from api.metrics import CONVERSIONS
+
+@pytest.fixture
+def client():
+    # 수용 제어의 요청 속도 제한은 끄고 라우트만 검증
+    app = create_app(AdmissionConfig(rate=0))
+    with TestClient(app) as client:
+        yield client
+
+def read_ndjson(response):
+    return [json.loads(line) for line in response.text.splitlines() if line]
+
+def test_extract_file_streams_mentions_from_upload(client):
+    text = "본교는 소화 12년 3월에 설립되어 단기 4290년에 교사를 신축하였다.\n" * 3
+    response = client.post(
+        "/api/extract/file",
+        files={"file": ("ocr.txt", text.encode("utf-8"), "text/plain")},
+    )
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    mentions = read_ndjson(response)
+    assert len(mentions) == 6
+    assert mentions[0]["era"] == "쇼와"
+    assert mentions[0]["segi_year"] == 1937
+    assert mentions[1]["segi_year"] == 1957
+
+def test_extract_file_larger_than_spool_and_other_encoding(client):
+    # 메모리 임시 파일 크기(UPLOAD_SPOOL_SIZE)를 넘어 디스크로 옮겨지는 크기
+    text = "明治 四十年 기록\n" + "기록물 본문\n" * 200000 + "光武 9年 끝\n"
+    response = client.post(
+        "/api/extract/file",
+        params={"encoding": "cp949"},
+        files={"file": ("ocr.txt", text.encode("cp949"), "text/plain")},
+    )
+    
+    assert response.status_code == 200
+    mentions = read_ndjson(response)
+    assert [mention["segi_year"] for mention in mentions] == [1907, 1905]
+
+def test_extract_file_rejects_unknown_encoding(client):
+    response = client.post(
+        "/api/extract/file",
+        params={"encoding": "no-such-codec"},
+        files={"file": ("ocr.txt", b"", "text/plain")},
+    )
+    assert response.status_code == 400
+
+def test_readyz_after_warm_up(client):
+    response = client.get("/readyz")
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+
+def test_get_convert_sets_etag_and_cache_control(client):
+    response = client.get("/api/convert", params={"text": "쇼와 10"})
+    
+    assert response.status_code == 200
+    assert response.json()["segi_year"] == 1935
+    assert response.headers["etag"] == conversion_etag("쇼와 10")
+    assert response.headers["cache-control"] == CACHE_CONTROL
+
+@pytest.mark.parametrize("if_none_match", [
+    "{etag}",
+    "W/{etag}",
+    '"other", {etag}',
+    "*",
+])
+def test_get_convert_not_modified(client, if_none_match):
+    etag = client.get("/api/convert", params={"text": "쇼와 10"}).headers["etag"]
+    
+    response = client.get(
+        "/api/convert",
+        params={"text": "쇼와 10"},
+        headers={"If-None-Match": if_none_match.format(etag=etag)},
+    )
+    
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert response.headers["cache-control"] == CACHE_CONTROL
+
+def test_get_convert_stale_etag_returns_body(client):
+    response = client.get("/api/convert", params={"text": "쇼와 10"}, headers={"If-None-Match": '"stale"'})
+    
+    assert response.status_code == 200
+    assert response.json()["segi_year"] == 1935
+
+def test_get_and_post_convert_echo_raw_input(client):
+    text = " 쇼와　１０년 "
+    
+    from_get = client.get("/api/convert", params={"text": text})
+    from_post = client.post("/api/convert", json={"text": text})
+    
+    assert from_get.json() == from_post.json()
+    assert from_get.json()["input_text"] == text
+    # 본문이 다르면 ETag도 달라야 함
+    assert from_get.headers["etag"] != conversion_etag("쇼와 10년")
+
+def test_etag_matches():
+    etag = conversion_etag("단기 4300")
+    
+    assert etag_matches(etag, etag)
+    assert etag_matches(f"W/{etag}", etag)
+    assert etag_matches(f'"a",  W/{etag} ,"b"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches("", etag)
+    assert not etag_matches(etag.strip('"'), etag)
+
+def test_convert_batch_mixed_rows_keep_order(client):
+    response = client.post("/api/convert/batch", json={"texts": ["단기 4300", "연호 아님", "", "쇼와 100"]})
+    
+    assert response.status_code == 200
+    body = response.json()
+    assert [result["input_text"] for result in body["results"]] == ["단기 4300", "연호 아님", "", "쇼와 100"]
+    assert [result["is_valid"] for result in body["results"]] == [True, False, False, False]
+    assert body["results"][0]["segi_year"] == 1967
+    assert body["results"][3]["message"] == "유효하지 않은 연도입니다."
+    assert (body["valid_count"], body["invalid_count"]) == (1, 3)
+
+def test_convert_batch_rejects_oversized_batch(client):
+    accepted = client.post("/api/convert/batch", json={"texts": ["단기 4300"] * MAX_BATCH_SIZE})
+    rejected = client.post("/api/convert/batch", json={"texts": ["단기 4300"] * (MAX_BATCH_SIZE + 1)})
+    
+    assert accepted.status_code == 200
+    assert accepted.json()["valid_count"] == MAX_BATCH_SIZE
+    assert rejected.status_code == 422
+
+def test_convert_dates_batch_survives_huge_year(client):
+    response = client.post(
+        "/api/convert/dates",
+        json={"texts": ["단기 99999999999999999999", "메이지 45년 7월 29일"]},
+    )
+    
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert results[0]["status"] == "out_of_range"
+    assert results[0]["segi_year"] is None
+    assert results[1]["date"] == "1912-07-29"
+
+def test_convert_dates_batch_counts_only_success_as_valid(client):
+    before = CONVERSIONS.value(era="메이지", outcome="success", channel="http")
+    response = client.post(
+        "/api/convert/dates",
+        json={"texts": ["메이지 45년 7월 29일", "메이지 45년 8월 1일", "융희 4년 9월"]},
+    )
+    
+    body = response.json()
+    assert [result["status"] for result in body["results"]] == ["success", "era_mismatch", "era_mismatch"]
+    assert [result["is_valid"] for result in body["results"]] == [True, False, False]
+    assert body["valid_count"] == 1
+    assert CONVERSIONS.value(era="메이지", outcome="success", channel="http") == before + 1
+
+def test_websocket_converts_text_and_json_messages(client):
+    before = CONVERSIONS.value(era="단기", outcome="success", channel="websocket")
+    with client.websocket_connect("/ws/convert") as websocket:
+        websocket.send_text("단기 4300")
+        assert websocket.receive_json()["segi_year"] == 1967
+        
+        websocket.send_text(json.dumps({"id": 7, "text": "쇼와 10"}))
+        result = websocket.receive_json()
+        assert (result["id"], result["segi_year"]) == (7, 1935)
+    
+    assert CONVERSIONS.value(era="단기", outcome="success", channel="websocket") == before + 1
+
+def test_websocket_rejects_non_string_text_and_binary_frames(client):
+    with client.websocket_connect("/ws/convert") as websocket:
+        websocket.send_text(json.dumps({"id": 1, "text": None}))
+        assert websocket.receive_json() == {"id": 1, "detail": "text는 문자열이어야 합니다."}
+        
+        websocket.send_bytes("단기 4300".encode("utf-8"))
+        assert "detail" in websocket.receive_json()
+        
+        # 오류 뒤에도 연결은 유지
+        websocket.send_text("단기 4300")
+        assert websocket.receive_json()["is_valid"] is True
@@ -0,0 +1,138 @@
+import time
+
+import pytest
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+from components import auth
+from components.auth import VerifiedSessions
+
+class FakeCookieManager:
+    def __init__(self, cookies):
+        self.cookies = cookies
+        self.refreshes = 0
+    
+    def get(self, cookie):
+        return self.cookies.get(cookie)
+    
+    def get_all(self, key="get_all"):
+        self.refreshes += 1
+        return self.cookies
+
+class FakeAuthenticator:
+    """쿠키 관리자와 로그인 폼 결과만 흉내 내는 인증 객체"""
+    cookie_name = "chrono_auth"
+    
+    def __init__(self, cookies=None, login_result=(None, None, None), token=None):
+        self.cookie_manager = FakeCookieManager(cookies or {})
+        self.login_result = login_result
+        self.token = token
+        self.exp_date = time.time() + 60
+        self.login_calls = 0
+    
+    def login(self, form_name, location):
+        self.login_calls += 1
+        return self.login_result
+    
+    def logout(self, button_name, location):
+        st.session_state["logout"] = True
+        st.session_state["authentication_status"] = None
+
+LOGIN_SCRIPT = """
+import streamlit as st
+from components.auth import login
+st.session_state["result"] = login()
+"""
+
+LOGOUT_SCRIPT = """
+from components.auth import logout
+logout()
+"""
+
+@pytest.fixture
+def sessions(monkeypatch):
+    sessions = VerifiedSessions(max_size=10)
+    monkeypatch.setattr(auth, "verified_sessions", lambda: sessions)
+    return sessions
+
+@pytest.fixture
+def authenticators(monkeypatch):
+    """_new_authenticator가 돌려줄 인증 객체 목록 (만든 것은 created에 기록)"""
+    queue = []
+    created = []
+    
+    def new_authenticator():
+        authenticator = queue.pop(0)
+        created.append(authenticator)
+        return authenticator
+    
+    monkeypatch.setattr(auth, "_new_authenticator", new_authenticator)
+    return queue, created
+
+def test_verified_sessions_evicts_oldest_beyond_max_size():
+    sessions = VerifiedSessions(max_size=2)
+    expires_at = time.time() + 60
+    for token in ["a", "b", "c"]:
+        sessions.add(token, token.upper(), token, expires_at)
+    
+    assert sessions.get("a") is None
+    assert sessions.get("b") == ("B", "b")
+    assert sessions.get("c") == ("C", "c")
+
+def test_verified_sessions_ignores_expired_and_empty_tokens():
+    sessions = VerifiedSessions()
+    sessions.add("old", "Kim", "kim", time.time() - 1)
+    sessions.add(None, "Kim", "kim", time.time() + 60)
+    
+    assert sessions.get("old") is None
+    assert sessions.get(None) is None
+    
+    sessions.add("soon", "Kim", "kim", time.time() + 0.05)
+    time.sleep(0.1)
+    assert sessions.get("soon") is None
+
+def test_login_uses_cached_cookie_token_without_login_form(sessions, authenticators):
+    queue, created = authenticators
+    queue.append(FakeAuthenticator(cookies={"chrono_auth": "token-1"}))
+    sessions.add("token-1", "김기록", "kim", time.time() + 60)
+    
+    app = AppTest.from_string(LOGIN_SCRIPT).run()
+    
+    assert app.session_state["result"] == ("김기록", True, "kim")
+    assert app.session_state["authentication_status"] is True
+    assert created[0].login_calls == 0
+
+def test_login_verifies_unknown_token_once_and_caches_it(sessions, authenticators):
+    queue, _ = authenticators
+    queue.append(FakeAuthenticator(login_result=("김기록", True, "kim"), token="token-2"))
+    
+    app = AppTest.from_string(LOGIN_SCRIPT).run()
+    
+    assert app.session_state["result"] == ("김기록", True, "kim")
+    assert sessions.get("token-2") == ("김기록", "kim")
+
+def test_unauthenticated_reruns_reuse_session_authenticator(sessions, authenticators):
+    queue, created = authenticators
+    queue.append(FakeAuthenticator())
+    
+    app = AppTest.from_string(LOGIN_SCRIPT).run()
+    app.run()
+    app.run()
+    
+    assert len(created) == 1
+    assert created[0].login_calls == 3
+    assert created[0].cookie_manager.refreshes == 2
+
+def test_logout_invalidates_cached_token(sessions, authenticators):
+    queue, _ = authenticators
+    queue.append(FakeAuthenticator(login_result=("김기록", True, "kim"), token="token-3"))
+    app = AppTest.from_string(LOGIN_SCRIPT).run()
+    assert sessions.get("token-3") is not None
+    
+    logout_app = AppTest.from_string(LOGOUT_SCRIPT)
+    for key in ["_authenticator", "_auth_token"]:
+        logout_app.session_state[key] = app.session_state[key]
+    logout_app.run()
+    
+    assert sessions.get("token-3") is None
+    assert "_auth_token" not in logout_app.session_state
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+
+from chrono import batch
+from chrono.batch import (
+    INVALID_YEAR,
+    SEGI_YEAR_DTYPE,
+    STATUS_FORMAT_ERROR,
+    STATUS_MISSING,
+    STATUS_OK,
+    STATUS_OUT_OF_RANGE,
+    convert_many,
+    factorize,
+)
+
+def test_convert_many_statuses():
+    result = convert_many(["단기 4300", "쇼와 10", "", None, "연호 아님", "레이와 3000000000"])
+    
+    assert result.segi_years.dtype == SEGI_YEAR_DTYPE
+    assert result.segi_years.tolist()[:2] == [1967, 1935]
+    assert result.era_codes.tolist() == ["dangi", "showa", "", "", "", "reiwa"]
+    assert result.status.tolist() == [
+        STATUS_OK, STATUS_OK, STATUS_MISSING, STATUS_MISSING, STATUS_FORMAT_ERROR, STATUS_OUT_OF_RANGE,
+    ]
+    assert (result.segi_years[2:] == INVALID_YEAR).all()
+
+def test_convert_many_accepts_series_and_keeps_order():
+    series = pd.Series(["쇼와 10", "단기 4300", "쇼와 10", np.nan])
+    
+    result = convert_many(series)
+    
+    assert result.segi_years.tolist()[:3] == [1935, 1967, 1935]
+    assert result.status.tolist()[-1] == STATUS_MISSING
+
+def test_convert_many_out_of_range_instead_of_overflow(monkeypatch):
+    monkeypatch.setattr(batch, "convert_to_segi", lambda era, year: 1 << 70)
+    
+    result = convert_many(["레이와 3000000000", "단기 4300"])
+    
+    assert result.status.tolist() == [STATUS_OUT_OF_RANGE, STATUS_OUT_OF_RANGE]
+    assert (result.segi_years == INVALID_YEAR).all()
+
+def test_factorize_keeps_types_apart():
+    uniques, inverse = factorize([1, 1.0, True, 1, "1"])
+    
+    assert [(type(value), value) for value in uniques] == [(int, 1), (float, 1.0), (bool, True), (str, "1")]
+    assert inverse.tolist() == [0, 1, 2, 0, 3]
+
+def test_factorize_unhashable_values_compared_as_strings():
+    uniques, inverse = factorize([[1], [1], [2]])
+    
+    assert uniques == ["[1]", "[2]"]
+    assert inverse.tolist() == [0, 0, 1]
+
+def test_convert_many_does_not_depend_on_order_of_equal_numbers():
+    forward = convert_many([4300.0, 4300])
+    backward = convert_many([4300, 4300.0])
+    
+    assert forward.status.tolist() == [STATUS_FORMAT_ERROR, STATUS_OK]
+    assert backward.status.tolist() == [STATUS_OK, STATUS_FORMAT_ERROR]
+    assert forward.segi_years[1] == backward.segi_years[0] == 1967
+
+def test_factorize_homogeneous_values_keep_missing_as_value():
+    uniques, inverse = factorize(pd.Series(["쇼와 10", None, "단기 4300", "쇼와 10", np.nan]))
+    
+    assert uniques[0] == "쇼와 10" and uniques[2] == "단기 4300"
+    assert batch.is_missing(uniques[1])
+    assert inverse.tolist() == [0, 1, 2, 0, 1]
+
+def test_factorize_numeric_array_and_generator():
+    uniques, inverse = factorize(np.array([[4300, 4301], [4300, 4300]]))
+    assert uniques == [4300, 4301]
+    assert inverse.tolist() == [0, 1, 0, 0]
+    
+    uniques, inverse = factorize(value for value in ["a", "b", "a"])
+    assert uniques == ["a", "b"]
+    assert inverse.tolist() == [0, 1, 0]
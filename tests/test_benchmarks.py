@@ -0,0 +1,86 @@
+import argparse
+import asyncio
+import csv
+
+import pytest
+
+from benchmarks.ledger import DEFAULT_MIX, generate_ledger, generate_years, write_ledger_csv
+from benchmarks.load import _drive, _free_port, run_load_test
+from benchmarks.run import compare, run_benchmarks
+from chrono.batch import (
+    STATUS_FORMAT_ERROR,
+    STATUS_MISSING,
+    STATUS_OK,
+    STATUS_OUT_OF_RANGE,
+    STATUS_OUT_OF_SCOPE,
+    convert_many,
+)
+
+@pytest.mark.parametrize("kind, statuses", [
+    ("dangi", {STATUS_OK}),
+    ("japanese", {STATUS_OK}),
+    ("korean_empire", {STATUS_OK}),
+    ("number_only", {STATUS_OK}),
+    ("blank", {STATUS_MISSING}),
+    ("junk", {STATUS_FORMAT_ERROR, STATUS_MISSING}),
+    ("out_of_scope", {STATUS_OUT_OF_SCOPE}),
+    ("out_of_range", {STATUS_OUT_OF_RANGE}),
+])
+def test_generated_kinds_convert_to_expected_status(kind, statuses):
+    values = generate_years(500, seed=3, mix={kind: 1.0})
+    
+    assert set(convert_many(values).status.tolist()) <= statuses
+
+def test_generate_years_is_deterministic_and_covers_mix():
+    values = generate_years(2000, seed=7)
+    
+    assert values == generate_years(2000, seed=7)
+    assert abs(sum(DEFAULT_MIX.values()) - 1.0) < 1e-9
+    status = set(convert_many(values).status.tolist())
+    assert {STATUS_OK, STATUS_MISSING, STATUS_FORMAT_ERROR, STATUS_OUT_OF_SCOPE, STATUS_OUT_OF_RANGE} <= status
+
+def test_write_ledger_csv(tmp_path):
+    path = tmp_path / "ledger.csv"
+    
+    write_ledger_csv(str(path), 50, seed=1)
+    
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["번호", "제목", "생산년도", "생산부서"]
+    assert len(rows) == 51
+    assert [row[2] for row in rows[1:]] == [year or "" for _, _, year, _ in generate_ledger(50, seed=1)]
+
+def test_run_benchmarks_smoke(capsys):
+    report = run_benchmarks([200], seed=1)
+    
+    assert [item["case"] for item in report["results"]] == ["single", "batch", "array", "file"]
+    for item in report["results"]:
+        assert item["rows"] == 200
+        assert item["rows_per_sec"] > 0
+        assert item["peak_bytes"] > 0
+    
+    compare(report, report)
+    assert "1.00배" in capsys.readouterr().err
+
+def test_load_drive_backs_off_when_server_is_down():
+    base_url = f"http://127.0.0.1:{_free_port()}"
+    
+    result = asyncio.run(_drive(base_url, "single", 2, 0.5, ["단기 4300"], 1))
+    
+    assert result["requests"] == 0
+    # 0.05, 0.1, 0.2, 0.4초로 늘어나는 대기 때문에 작업자마다 몇 번만 재시도
+    assert 0 < result["errors"] <= 2 * 6
+
+def test_load_test_smoke_against_local_server():
+    args = argparse.Namespace(
+        app="api.main:app", workers=1, endpoint="both", concurrency=[2],
+        duration=0.5, warmup=0.2, batch_size=10, seed=0,
+    )
+    
+    report = run_load_test(args)
+    
+    assert [result["endpoint"] for result in report["results"]] == ["single", "batch"]
+    for result in report["results"]:
+        assert result["requests"] > 0
+        assert result["errors"] == 0
+        assert result["status_codes"] == {"200": result["requests"]}
@@ -0,0 +1,27 @@
+from streamlit.testing.v1 import AppTest
+
+def open_page():
+    app = AppTest.from_file("pages/01_Chrono.py", default_timeout=30)
+    app.session_state["authentication_status"] = True
+    app.session_state["username"] = "kim"
+    return app.run()
+
+def extract(app, text):
+    app.text_area(key="extract_text").input(text)
+    app.button(key="extract_run").click().run()
+    return app
+
+def test_extract_tab_lists_mentions():
+    app = extract(open_page(), "소화 12년 설립, 메이지 50년 기록")
+    
+    assert not app.exception
+    assert [metric.value for metric in app.metric][-2:] == ["2건", "1건"]
+    assert app.dataframe[-1].value["원문 표기"].tolist() == ["소화 12년", "메이지 50년"]
+
+def test_extract_tab_caps_displayed_rows():
+    app = extract(open_page(), "쇼와 3년 " * 10_001)
+    
+    assert not app.exception
+    assert [metric.value for metric in app.metric][-2:] == ["10,001건", "10,001건"]
+    assert len(app.dataframe[-1].value) == 10_000
+    assert any("처음 10,000건만" in element.value for element in app.info)
@@ -0,0 +1,38 @@
+import numpy as np
+
+from chrono.batch import INVALID_YEAR, STATUS_FORMAT_ERROR, STATUS_MISSING, STATUS_OK, STATUS_OUT_OF_RANGE
+from chrono.dates import (
+    PRECISION_DAY,
+    PRECISION_MONTH,
+    PRECISION_YEAR,
+    STATUS_ERA_MISMATCH,
+    STATUS_LUNAR,
+    convert_dates,
+)
+
+def test_convert_dates_precision_and_iso():
+    result = convert_dates(["메이지 45년 7월 29일", "다이쇼 원년 8월", "쇼와 10년", "", "날짜 아님"])
+    
+    assert result.iso.tolist() == ["1912-07-29", "1912-08", "1935", "", ""]
+    assert result.precision.tolist()[:3] == [PRECISION_DAY, PRECISION_MONTH, PRECISION_YEAR]
+    assert result.segi_years.tolist()[:3] == [1912, 1912, 1935]
+    assert result.status.tolist() == [STATUS_OK, STATUS_OK, STATUS_OK, STATUS_MISSING, STATUS_FORMAT_ERROR]
+    assert np.isnat(result.dates[3:]).all()
+
+def test_convert_dates_era_mismatch_and_lunar():
+    result = convert_dates(["메이지 45년 8월 1일", "메이지 3년 5월 1일"])
+    
+    assert result.status.tolist() == [STATUS_ERA_MISMATCH, STATUS_LUNAR]
+    assert result.resolved_era_codes.tolist()[0] == "taisho"
+
+def test_convert_dates_huge_year_is_out_of_range_not_overflow():
+    result = convert_dates(["단기 99999999999999999999", "쇼와 99999999999999999999년 1월", "쇼와 10년"])
+    
+    assert result.status.tolist() == [STATUS_OUT_OF_RANGE, STATUS_OUT_OF_RANGE, STATUS_OK]
+    assert result.segi_years.tolist()[:2] == [INVALID_YEAR, INVALID_YEAR]
+
+def test_yunghui_ends_at_annexation():
+    result = convert_dates(["융희 4년 8월 28일", "융희 4년 8월 29일", "융희 4년 9월", "융희 4년"])
+    
+    assert result.status.tolist() == [STATUS_OK, STATUS_ERA_MISMATCH, STATUS_ERA_MISMATCH, STATUS_OK]
+    assert result.resolved_era_codes.tolist() == ["yunghui", "", "", "yunghui"]
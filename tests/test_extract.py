@@ -0,0 +1,43 @@
+import io
+
+import pytest
+
+from chrono.extract import extract_mentions, iter_mentions, iter_text_chunks
+
+TEXT = "본교는 소화 12년 3월에 설립되어 단기 4290년에 교사를 신축하였고, 明治 四十年의 문서와 대정원년 기록이 남아 있다."
+
+def test_extract_mentions_positions_and_years():
+    mentions = extract_mentions(TEXT)
+    
+    assert [(m.era, m.year, m.segi_year) for m in mentions] == [
+        ("쇼와", 12, 1937),
+        ("단기", 4290, 1957),
+        ("메이지", 40, 1907),
+        ("다이쇼", 1, 1912),
+    ]
+    for mention in mentions:
+        assert TEXT[mention.start:mention.end] == mention.text
+
+def test_out_of_range_and_out_of_scope_mentions():
+    mentions = extract_mentions("메이지 50년, 레이와 3년")
+    assert mentions[0].segi_year is None
+    assert not mentions[0].in_scope
+    assert mentions[1].segi_year == 2021
+    assert not mentions[1].in_scope
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64])
+def test_iter_mentions_matches_whole_text_across_chunk_boundaries(chunk_size):
+    text = (TEXT + "\n") * 20
+    chunks = iter_text_chunks(io.StringIO(text), chunk_size=chunk_size)
+    assert list(iter_mentions(chunks)) == extract_mentions(text)
+
+def test_iter_mentions_skips_empty_chunks():
+    assert list(iter_mentions(["", "쇼와 ", "", "3년"])) == extract_mentions("쇼와 3년")
+
+def test_mention_excludes_trailing_whitespace_without_year_suffix():
+    text = "쇼와 12   다음, 소화 3 년"
+    
+    mentions = extract_mentions(text)
+    
+    assert [mention.text for mention in mentions] == ["쇼와 12", "소화 3 년"]
+    assert mentions[0].end == text.index("   다음")
@@ -0,0 +1,113 @@
+import pytest
+import requests
+import streamlit as st
+from fastapi.testclient import TestClient
+from streamlit.testing.v1 import AppTest
+
+import storage
+from api.admission import AdmissionConfig
+from api.main import create_app
+from storage import MetadataStore
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = MetadataStore(str(tmp_path / "metadata.db"))
+    # 페이지의 get_store()가 임시 DB를 쓰도록 교체
+    monkeypatch.setattr(storage, "MetadataStore", lambda: store)
+    st.cache_resource.clear()
+    yield store
+    st.cache_resource.clear()
+    store.close()
+
+@pytest.fixture
+def api_calls(monkeypatch):
+    """페이지의 일괄 변환 호출을 로컬 API 앱으로 보내고 요청마다 입력 수를 기록"""
+    calls = []
+    with TestClient(create_app(AdmissionConfig(rate=0))) as client:
+        def post(url, json, headers):
+            calls.append(len(json["texts"]))
+            return client.post("/api/convert/batch", json=json, headers=headers)
+        
+        monkeypatch.setattr(requests, "post", post)
+        yield calls
+
+def open_page(**state):
+    app = AppTest.from_file("pages/02_Input_Form.py", default_timeout=30)
+    app.session_state["authentication_status"] = True
+    app.session_state["username"] = "kim"
+    for key, value in state.items():
+        app.session_state[key] = value
+    return app.run()
+
+def make_records(count):
+    return [
+        {"제목": f"문서 {i}", "생산년도(단기)": 4300, "생산년도(서기)": 1967, "생산부서": "총무과"}
+        for i in range(count)
+    ]
+
+def test_table_page_starts_on_last_page_and_is_owned_by_widget(store):
+    store.append("kim", make_records(250))
+    app = open_page()
+    
+    page = app.number_input(key="table_page")
+    assert page.value == 3
+    
+    page.set_value(1).run()
+    assert app.number_input(key="table_page").value == 1
+    assert not app.warning
+    assert not app.exception
+
+def test_table_page_out_of_range_is_clamped(store):
+    store.append("kim", make_records(250))
+    app = open_page(table_page=9)
+    
+    assert app.number_input(key="table_page").value == 3
+    assert not app.warning
+    assert not app.exception
+
+def test_export_builds_csv_bytes(store):
+    store.append("kim", make_records(3))
+    app = open_page()
+    
+    next(button for button in app.button if button.label == "CSV 내보내기 준비").click().run()
+    
+    assert not app.exception
+    assert [element for element in app.get("download_button")]
+
+def paste_rows(app, text):
+    app.text_area(key="bulk_paste_0").input(text)
+    app.button(key="bulk_paste_add").click().run()
+    return app
+
+def test_paste_mixed_rows_adds_valid_and_reports_errors(store, api_calls):
+    app = open_page()
+    
+    paste_rows(app, "\n".join([
+        "제목\t생산년도\t생산부서",
+        "문서 1\t단기 4300\t총무과",
+        "문서 2\t연호 아님\t총무과",
+        "칼럼 부족\t단기 4300",
+        "\t단기 4300\t총무과",
+        "",
+        "문서 1\t단기 4300\t총무과",
+        "문서 3\t쇼와 10\t기획과",
+    ]))
+    
+    assert not app.exception
+    assert store.count("kim") == 2
+    assert api_calls == [4]
+    assert "메타데이터 2건이 추가되었습니다." in [element.value for element in app.success]
+    errors = app.dataframe[0].value
+    assert errors["행"].tolist() == [3, 4, 5, 7]
+    assert errors["오류"][1] == "칼럼이 3개(제목, 생산년도, 생산부서)여야 합니다."
+    assert errors["오류"][2] == "모든 필드를 입력해주세요."
+    assert errors["오류"][3] == "2행과 중복된 기록물입니다."
+
+def test_paste_larger_than_batch_size_is_split(store, api_calls):
+    app = open_page()
+    
+    paste_rows(app, "\n".join(f"문서 {i}\t단기 4300\t총무과" for i in range(1001)))
+    
+    assert not app.exception
+    assert api_calls == [1000, 1]
+    assert store.count("kim") == 1001
@@ -0,0 +1,92 @@
+import threading
+
+import pytest
+
+from storage import MetadataStore
+from storage.metadata_index import MetadataIndex, record_key, tokenize
+
+def make_record(title, segi_year=1967, department="총무과"):
+    return {
+        "제목": title,
+        "생산년도(단기)": segi_year + 2333,
+        "생산년도(서기)": segi_year,
+        "생산부서": department,
+    }
+
+@pytest.fixture
+def store(tmp_path):
+    store = MetadataStore(str(tmp_path / "metadata.db"))
+    yield store
+    store.close()
+
+def test_find_duplicate_uses_normalized_key(store):
+    store.append("kim", [make_record("학교 연혁")])
+    
+    assert store.find_duplicate("kim", make_record(" 학교  연혁 ")) is not None
+    assert store.find_duplicate("kim", make_record("학교 연혁", segi_year=1968)) is None
+    assert store.find_duplicate("lee", make_record("학교 연혁")) is None
+
+def test_index_is_updated_after_append(store):
+    store.append("kim", [make_record("학교 연혁")])
+    assert len(store.search("kim", "연혁")) == 1
+    
+    store.append("kim", [make_record("졸업 대장", department="교무과")])
+    assert len(store.search("kim", "교무")) == 1
+    assert len(store.search("kim", "대장 교무과")) == 1
+
+def test_clear_removes_records_and_index(store):
+    store.append("kim", [make_record("학교 연혁")])
+    assert store.clear("kim") == 1
+    assert store.count("kim") == 0
+    assert store.search("kim", "연혁") == []
+
+def test_record_key_normalizes_width_and_case():
+    assert record_key("ＡＢＣ 문서", 1967, "총무과") == record_key("abc  문서", 1967, " 총무과")
+
+def test_tokenize_bigrams_and_single_chars():
+    assert tokenize("연혁 a") == {"연혁", "a"}
+    assert tokenize("졸업대장") == {"졸업", "업대", "대장"}
+
+def test_index_search_requires_all_words():
+    index = MetadataIndex()
+    index.add(1, "학교 연혁", 1967, "총무과")
+    index.add(2, "졸업 대장", 1967, "교무과")
+    index.add(3, "학교 졸업 앨범", 1970, "교무과")
+    
+    assert index.search("학교") == [1, 3]
+    assert index.search("학교 졸업") == [3]
+    assert index.search("혁") == [1]
+    assert index.search("없는말") == []
+    assert index.search("  ") == []
+
+def test_append_skips_duplicates_when_not_allowed(store):
+    store.append("kim", [make_record("학교 연혁")])
+    
+    result = store.append(
+        "kim",
+        [make_record("학교  연혁"), make_record("졸업 대장"), make_record("졸업 대장"), make_record("교지")],
+        allow_duplicates=False,
+    )
+    
+    assert result.added == 2
+    assert result.duplicates == [(0, None), (2, 1)]
+    assert store.count("kim") == 3
+    assert store.append("kim", [make_record("학교 연혁")]).added == 1
+
+def test_concurrent_appends_store_one_copy(store):
+    barrier = threading.Barrier(8)
+    results = []
+    
+    def worker():
+        barrier.wait()
+        results.append(store.append("kim", [make_record("학교 연혁")], allow_duplicates=False).added)
+        store.close()
+    
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert sorted(results) == [0] * 7 + [1]
+    assert store.count("kim") == 1
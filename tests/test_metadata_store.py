@@ -0,0 +1,50 @@
+import csv
+import io
+
+import pytest
+
+from storage import MetadataStore
+
+def make_record(title, dangi_year=4300, segi_year=1967, department="총무과"):
+    return {
+        "제목": title,
+        "생산년도(단기)": dangi_year,
+        "생산년도(서기)": segi_year,
+        "생산부서": department,
+    }
+
+@pytest.fixture
+def store(tmp_path):
+    store = MetadataStore(str(tmp_path / "metadata.db"))
+    yield store
+    store.close()
+
+def test_append_and_fetch_page_in_insert_order(store):
+    assert store.append("kim", [make_record(f"문서 {i}") for i in range(5)]).added == 5
+    store.append("lee", [make_record("다른 사용자")])
+    
+    assert store.count("kim") == 5
+    assert [r["제목"] for r in store.fetch_page("kim", 0, page_size=2)] == ["문서 0", "문서 1"]
+    assert [r["제목"] for r in store.fetch_page("kim", 2, page_size=2)] == ["문서 4"]
+    assert store.revision("kim")[0] == 5
+
+def test_append_empty_records_is_noop(store):
+    assert store.append("kim", []).added == 0
+    assert store.revision("kim") == (0, 0)
+
+def test_iter_csv_streams_all_rows(store):
+    store.append("kim", [make_record(f"문서 {i}") for i in range(12)])
+    
+    data = b"".join(store.iter_csv("kim"))
+    
+    assert data.startswith("\ufeff".encode("utf-8"))
+    rows = list(csv.reader(io.StringIO(data.decode("utf-8-sig"))))
+    assert rows[0] == ["제목", "생산년도(단기)", "생산년도(서기)", "생산부서"]
+    assert len(rows) == 13
+    assert rows[-1] == ["문서 11", "4300", "1967", "총무과"]
+
+def test_iter_csv_chunks(store):
+    store.append("kim", [make_record(f"문서 {i}") for i in range(5)])
+    chunks = list(store.iter_csv("kim", chunk_size=2))
+    # 헤더 + 2 + 2 + 1
+    assert len(chunks) == 4
@@ -0,0 +1,180 @@
+import json
+import os
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+
+from api.metrics import (
+    CONVERSIONS,
+    IN_FLIGHT,
+    REQUEST_LATENCY,
+    REQUESTS,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsMiddleware,
+    Registry,
+    WorkerSnapshots,
+    prepare_multiprocess_dir,
+    record_conversion,
+    route_label,
+)
+
+def make_registry():
+    registry = Registry()
+    requests = registry.register(Counter("requests_total", "요청 수", ("route",)))
+    in_flight = registry.register(Gauge("in_flight", "처리 중"))
+    latency = registry.register(Histogram("latency_seconds", "처리 시간", buckets=(0.1, 1.0)))
+    return registry, requests, in_flight, latency
+
+def write_other_worker(directory, registry, pid=1):
+    with open(os.path.join(directory, f"worker-{pid}.json"), "w", encoding="utf-8") as f:
+        json.dump(registry.snapshot(), f)
+
+def test_render_single_process():
+    registry, requests, in_flight, latency = make_registry()
+    requests.inc(route="/api/convert")
+    in_flight.inc()
+    latency.observe(0.5)
+    
+    text = registry.render()
+    assert 'requests_total{route="/api/convert"} 1' in text
+    assert "in_flight 1" in text
+    assert 'latency_seconds_bucket{le="1"} 1' in text
+    assert "latency_seconds_count 1" in text
+
+def test_worker_snapshots_sum_all_workers(tmp_path):
+    registry, requests, in_flight, latency = make_registry()
+    other, other_requests, other_in_flight, other_latency = make_registry()
+    requests.inc(2, route="/api/convert")
+    latency.observe(0.05)
+    other_requests.inc(3, route="/api/convert")
+    other_requests.inc(route="/api/extract")
+    other_in_flight.inc()
+    other_latency.observe(5)
+    write_other_worker(tmp_path, other)
+    
+    text = WorkerSnapshots(registry, str(tmp_path)).render()
+    
+    assert 'requests_total{route="/api/convert"} 5' in text
+    assert 'requests_total{route="/api/extract"} 1' in text
+    assert "in_flight 1" in text
+    assert 'latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 2' in text
+    assert "latency_seconds_count 2" in text
+
+def test_final_snapshot_keeps_counters_and_drops_gauges(tmp_path):
+    registry, requests, in_flight, _ = make_registry()
+    requests.inc(route="/api/convert")
+    in_flight.inc()
+    snapshots = WorkerSnapshots(registry, str(tmp_path), interval=60)
+    
+    snapshots.start()
+    snapshots.stop()
+    
+    with open(snapshots.path, encoding="utf-8") as f:
+        saved = json.load(f)
+    assert saved["requests_total"] == [[["/api/convert"], 1]]
+    assert "in_flight" not in saved
+
+def test_prepare_multiprocess_dir_clears_old_snapshots(tmp_path, monkeypatch):
+    monkeypatch.delenv("CHRONO_METRICS_DIR", raising=False)
+    old = tmp_path / "worker-123.json"
+    old.write_text("{}")
+    
+    assert prepare_multiprocess_dir(str(tmp_path)) == str(tmp_path)
+    assert not old.exists()
+    assert os.environ["CHRONO_METRICS_DIR"] == str(tmp_path)
+
+def latency_count(method, route):
+    for labels, state in REQUEST_LATENCY.snapshot():
+        if labels == [method, route]:
+            return sum(state[:-1])
+    return 0
+
+class RejectBeforeRouting:
+    """라우팅 전에 응답하는 미들웨어 (수용 제어의 429처럼 scope에 라우트가 없음)"""
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith("/items/") and scope["method"] == "DELETE":
+            await PlainTextResponse("busy", status_code=429)(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int):
+        if item_id == 0:
+            raise HTTPException(status_code=404)
+        return {"item_id": item_id}
+    
+    @app.delete("/items/{item_id}")
+    async def delete_item(item_id: int):
+        return {}
+    
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+    
+    app.add_middleware(RejectBeforeRouting)
+    app.add_middleware(MetricsMiddleware)
+    with TestClient(app, raise_server_exceptions=False) as client:
+        yield client
+
+def test_middleware_labels_path_params_with_route_template(client):
+    before = REQUESTS.value(method="GET", route="/items/{item_id}", status=200)
+    not_found = REQUESTS.value(method="GET", route="/items/{item_id}", status=404)
+    observed = latency_count("GET", "/items/{item_id}")
+    
+    client.get("/items/1")
+    client.get("/items/2")
+    client.get("/items/0")
+    
+    assert REQUESTS.value(method="GET", route="/items/{item_id}", status=200) == before + 2
+    assert REQUESTS.value(method="GET", route="/items/{item_id}", status=404) == not_found + 1
+    assert REQUESTS.value(method="GET", route="/items/1", status=200) == 0
+    assert latency_count("GET", "/items/{item_id}") == observed + 3
+    assert IN_FLIGHT.value() == 0
+
+def test_middleware_labels_unmatched_and_pre_routing_responses(client):
+    unmatched = REQUESTS.value(method="GET", route="unmatched", status=404)
+    rejected = REQUESTS.value(method="DELETE", route="/items/{item_id}", status=429)
+    
+    client.get("/no/such/path")
+    client.delete("/items/3")
+    
+    assert REQUESTS.value(method="GET", route="unmatched", status=404) == unmatched + 1
+    assert REQUESTS.value(method="DELETE", route="/items/{item_id}", status=429) == rejected + 1
+
+def test_middleware_records_500_when_app_raises(client):
+    before = REQUESTS.value(method="GET", route="/boom", status=500)
+    
+    assert client.get("/boom").status_code == 500
+    
+    assert REQUESTS.value(method="GET", route="/boom", status=500) == before + 1
+    assert IN_FLIGHT.value() == 0
+
+def test_route_label_without_app_or_route():
+    assert route_label({"type": "http", "path": "/x", "method": "GET"}) == "unmatched"
+
+@pytest.mark.parametrize("era, is_valid, outcome, era_label", [
+    ("쇼와", True, "success", "쇼와"),
+    ("쇼와", False, "out_of_range", "쇼와"),
+    (None, False, "format_error", "none"),
+])
+def test_record_conversion_outcomes(era, is_valid, outcome, era_label):
+    before = CONVERSIONS.value(era=era_label, outcome=outcome, channel="http")
+    other_channel = CONVERSIONS.value(era=era_label, outcome=outcome, channel="websocket")
+    
+    record_conversion(era, is_valid)
+    
+    assert CONVERSIONS.value(era=era_label, outcome=outcome, channel="http") == before + 1
+    assert CONVERSIONS.value(era=era_label, outcome=outcome, channel="websocket") == other_channel
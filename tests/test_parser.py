@@ -0,0 +1,81 @@
+import pytest
+
+from chrono import (
+    ERA_INDEX,
+    ERAS_BY_NAME,
+    OPEN_ERA_MAX_SEGI_YEAR,
+    convert_to_segi,
+    is_valid_year,
+    is_within_project_scope,
+    parse_numeral,
+    parse_year_input,
+)
+
+@pytest.mark.parametrize("token, expected", [
+    ("40", 40),
+    ("４０", 40),
+    ("四十", 40),
+    ("一九", 19),
+    ("廿三", 23),
+    ("百二", 102),
+    ("元", 1),
+    ("원", 1),
+    ("", None),
+    ("四x", None),
+])
+def test_parse_numeral(token, expected):
+    assert parse_numeral(token) == expected
+
+@pytest.mark.parametrize("text, expected", [
+    ("단기 4300", ("단기", 4300)),
+    ("단기4300년", ("단기", 4300)),
+    ("4300", ("단기", 4300)),
+    ("쇼와 1년", ("쇼와", 1)),
+    ("소화 1년", ("쇼와", 1)),
+    ("메이지5년", ("메이지", 5)),
+    ("明治 四十年", ("메이지", 40)),
+    ("大正元年", ("다이쇼", 1)),
+    ("光武 9年", ("광무", 9)),
+    ("㍼ ２０年", ("쇼와", 20)),
+    ("しょうわ 3年", ("쇼와", 3)),
+    ("알 수 없음", (None, None)),
+    ("", (None, None)),
+])
+def test_parse_year_input(text, expected):
+    assert parse_year_input(text) == expected
+
+def test_convert_to_segi():
+    assert convert_to_segi("단기", 4300) == 1967
+    assert convert_to_segi("메이지", 45) == 1912
+    assert convert_to_segi("광무", 11) == 1907
+    assert convert_to_segi("메이지", 46) is None
+    assert convert_to_segi("메이지", 0) is None
+    assert convert_to_segi("없는연호", 1) is None
+
+def test_dangi_is_limited_to_project_scope():
+    assert convert_to_segi("단기", 4335) == 2002
+    assert not is_valid_year("단기", 4336)
+
+def test_open_ended_era_has_upper_bound():
+    reiwa = ERAS_BY_NAME["레이와"]
+    assert reiwa.max_year is None
+    assert reiwa.to_segi(reiwa.year_limit) == OPEN_ERA_MAX_SEGI_YEAR
+    assert is_valid_year("레이와", reiwa.year_limit)
+    assert not is_valid_year("레이와", reiwa.year_limit + 1)
+    assert convert_to_segi("레이와", 10 ** 20) is None
+
+def test_project_scope():
+    assert is_within_project_scope(2002)
+    assert not is_within_project_scope(2003)
+
+def test_eras_for_year_includes_both_eras_in_change_year():
+    names = [era.name for era in ERA_INDEX.eras_for_year(1912, "japan")]
+    assert names == ["메이지", "다이쇼"]
+    assert [era.name for era in ERA_INDEX.eras_for_year(2100, "japan")] == ["레이와"]
+
+def test_era_start_dates_are_solar_and_ordered():
+    starts, eras = ERA_INDEX.date_table("japan")
+    assert starts == sorted(starts)
+    assert ERAS_BY_NAME["덴포"].start.isoformat() == "1831-01-23"
+    assert ERA_INDEX.next_start(ERAS_BY_NAME["메이지"]) == ERAS_BY_NAME["다이쇼"].start
+    assert ERA_INDEX.next_start(ERAS_BY_NAME["레이와"]) is None
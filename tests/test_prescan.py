@@ -0,0 +1,71 @@
+import io
+
+from openpyxl import Workbook
+
+from chrono.prescan import SAMPLE_SIZE, prescan_csv, prescan_rows, prescan_xlsx, reservoir_sample
+
+def test_reservoir_sample_keeps_input_order_and_counts_all():
+    sample, total = reservoir_sample(iter(range(10000)), k=100, seed=1)
+    
+    assert total == 10000
+    assert len(sample) == 100
+    assert sample == sorted(sample)
+    assert sample == reservoir_sample(range(10000), k=100, seed=1)[0]
+
+def test_reservoir_sample_shorter_than_k():
+    assert reservoir_sample(["a", "b"], k=5) == (["a", "b"], 2)
+
+def test_prescan_rows_suggests_year_column():
+    rows = [[str(idx), f"쇼와 {idx % 60 + 1}년", "메모"] for idx in range(SAMPLE_SIZE * 3)]
+    
+    result = prescan_rows(rows, ["번호", "생산연도", "비고"])
+    
+    assert result.total_rows == SAMPLE_SIZE * 3
+    assert result.suggested_column == "생산연도"
+    estimate = result.get("생산연도")
+    assert estimate.sampled == SAMPLE_SIZE
+    assert estimate.success_rate == 1.0
+    assert result.get("비고").failure_rate == 1.0
+
+def test_prescan_csv_streams_text_with_short_rows():
+    text = "\ufeff제목,연도\n첫째,단기 4300\n둘째,\n셋째\n넷째,날짜 아님\n"
+    stream = io.TextIOWrapper(io.BytesIO(text.encode("utf-8")), encoding="utf-8-sig", newline="")
+    
+    result = prescan_csv(stream)
+    
+    estimate = result.get("연도")
+    assert result.total_rows == 4
+    assert (estimate.success, estimate.missing, estimate.failure) == (1, 2, 1)
+    assert result.suggested_column == "연도"
+
+def test_prescan_csv_empty_file():
+    result = prescan_csv(io.StringIO(""))
+    
+    assert result.total_rows == 0
+    assert result.suggested_column is None
+
+def test_prescan_keeps_file_column_order():
+    rows = [[str(idx), f"쇼와 {idx % 60 + 1}년"] for idx in range(10)]
+    
+    result = prescan_rows(rows, ["번호", "생산연도"])
+    
+    assert [estimate.column for estimate in result.columns] == ["생산연도", "번호"]
+    assert result.column_names == ["번호", "생산연도"]
+
+def test_prescan_xlsx_streams_first_sheet():
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(["제목", "연도", None])
+    sheet.append(["첫째", "단기 4300", 1])
+    sheet.append([None, None, None])
+    sheet.append(["둘째", "쇼와 10년", 2])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    buffer.seek(0)
+    
+    result = prescan_xlsx(buffer)
+    
+    assert result.column_names == ["제목", "연도", "Unnamed: 2"]
+    assert result.total_rows == 2
+    assert result.get("연도").success == 2
+    assert result.suggested_column == "연도"
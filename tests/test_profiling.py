@@ -0,0 +1,103 @@
+import tracemalloc
+from types import SimpleNamespace
+
+import pytest
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+from components import profiling
+from components.profiling import DeltaCounter, RerunProfiler
+
+@pytest.fixture(autouse=True)
+def no_tracing():
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+    yield
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+def test_tracing_stops_when_last_profiler_finishes():
+    first = RerunProfiler("홈")
+    second = RerunProfiler("연호 변환기")
+    assert tracemalloc.is_tracing()
+    
+    first.finish()
+    assert tracemalloc.is_tracing()
+    second.finish()
+    assert not tracemalloc.is_tracing()
+
+def test_close_is_idempotent():
+    profiler = RerunProfiler("홈")
+    profiler.close()
+    profiler.close()
+    assert not tracemalloc.is_tracing()
+    
+    # 다른 측정이 시작되면 다시 켜짐
+    other = RerunProfiler("홈")
+    assert tracemalloc.is_tracing()
+    other.close()
+    assert not tracemalloc.is_tracing()
+
+def test_tracing_started_elsewhere_is_left_on():
+    tracemalloc.start()
+    RerunProfiler("홈").finish()
+    assert tracemalloc.is_tracing()
+
+def test_finish_records_stages():
+    profiler = RerunProfiler("홈")
+    with profiler.stage("변환"):
+        data = [0] * 1000
+    record = profiler.finish()
+    
+    assert record["page"] == "홈"
+    assert [stage["stage"] for stage in record["stages"]] == ["변환"]
+    assert record["deltas"] is None
+    del data
+
+@pytest.fixture
+def ctx(monkeypatch):
+    sent = []
+    ctx = SimpleNamespace(_enqueue=sent.append, cursors={}, sent=sent)
+    monkeypatch.setattr(profiling, "get_script_run_ctx", lambda: ctx)
+    return ctx
+
+def delta_msg():
+    msg = ForwardMsg()
+    msg.delta.new_element.markdown.body = "본문"
+    return msg
+
+def test_delta_counter_restores_enqueue_on_error(ctx):
+    original = ctx._enqueue
+    with pytest.raises(RuntimeError):
+        with DeltaCounter() as deltas:
+            ctx._enqueue(delta_msg())
+            raise RuntimeError("st.stop")
+    
+    assert ctx._enqueue == original
+    assert deltas.count == 1
+    assert len(ctx.sent) == 1
+
+def test_interrupted_delta_counter_restores_on_next_rerun(ctx):
+    original = ctx._enqueue
+    deltas = DeltaCounter().__enter__()  # 재실행이 중단되어 __exit__에 도달하지 못함
+    ctx._enqueue(delta_msg())
+    
+    ctx.cursors = {}  # ScriptRunContext.reset()
+    ctx._enqueue(delta_msg())
+    
+    assert ctx._enqueue == original
+    assert deltas.count == 1
+    assert len(ctx.sent) == 2
+
+def test_profiler_unwraps_counter_left_by_interrupted_rerun(ctx):
+    original = ctx._enqueue
+    abandoned = RerunProfiler("홈")  # finish/close 없이 중단된 측정
+    
+    profiler = RerunProfiler("홈")
+    ctx._enqueue(delta_msg())
+    record = profiler.finish()
+    
+    assert ctx._enqueue == original
+    assert record["deltas"] == 1
+    abandoned.close()
+    assert not tracemalloc.is_tracing()
+
@@ -0,0 +1,75 @@
+import sys
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from components.startup import lazy_import
+
+@pytest.fixture
+def probe_module(tmp_path, monkeypatch):
+    (tmp_path / "lazy_probe.py").write_text("import sys\nsys.lazy_probe_loaded = True\nVALUE = 42\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "lazy_probe"
+    sys.modules.pop("lazy_probe", None)
+    if hasattr(sys, "lazy_probe_loaded"):
+        del sys.lazy_probe_loaded
+
+def test_lazy_import_runs_module_on_first_attribute(probe_module):
+    module = lazy_import(probe_module)
+    assert not hasattr(sys, "lazy_probe_loaded")
+    
+    assert module.VALUE == 42
+    assert sys.lazy_probe_loaded
+
+def test_lazy_import_returns_already_imported_module():
+    import json
+    assert lazy_import("json") is json
+
+def test_lazy_import_missing_module():
+    with pytest.raises(ModuleNotFoundError):
+        lazy_import("no_such_module_for_chrono")
+
+CSS_SCRIPT = """
+import pathlib
+import streamlit as st
+from components.startup import load_css
+
+css = pathlib.Path(st.session_state["css"])
+st.write(load_css(str(css)))
+css.write_text("body { color: blue; }", encoding="utf-8")
+st.write(load_css(str(css)))
+"""
+
+def test_load_css_reads_file_once_per_process(tmp_path):
+    css = tmp_path / "style.css"
+    css.write_text("body { color: red; }", encoding="utf-8")
+    app = AppTest.from_string(CSS_SCRIPT)
+    app.session_state["css"] = str(css)
+    app.run()
+    
+    # 파일이 바뀌어도 처음 읽은 내용을 사용
+    assert [element.value for element in app.markdown] == ["<style>body { color: red; }</style>"] * 2
+
+PAGE_SCRIPT = """
+import streamlit as st
+from components.startup import _page_timings, begin_page, finish_page
+
+begin_page("startup-test")
+finish_page()
+stats = _page_timings()["pages"]["startup-test"]
+st.write(f"warm={stats['warm_count']}")
+st.write(f"pending={'_page_started' in st.session_state}")
+"""
+
+def test_finish_page_counts_cold_then_warm_reruns():
+    app = AppTest.from_string(PAGE_SCRIPT).run()
+    assert [element.value for element in app.markdown] == ["warm=0", "pending=False"]
+    
+    app.run()
+    assert [element.value for element in app.markdown] == ["warm=1", "pending=False"]
+
+def test_finish_page_without_begin_page_is_noop():
+    app = AppTest.from_string(
+        "from components.startup import finish_page\nfinish_page()\n"
+    ).run()
+    assert not app.exception
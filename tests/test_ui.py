@@ -0,0 +1,27 @@
+import pytest
+
+from components import ui
+from components.ui import RenderBuffer
+
+@pytest.fixture
+def markdown(monkeypatch):
+    calls = []
+    monkeypatch.setattr(ui.st, "markdown", lambda body, **kwargs: calls.append(body))
+    return calls
+
+def test_buffer_merges_fragments_and_drops_close_tags(markdown):
+    buffer = RenderBuffer(enabled=True)
+    buffer.emit('<div class="card">', "<h3>제목</h3>")
+    buffer.close()
+    buffer.emit("<p>관계없는 출력</p>")
+    
+    assert markdown == ['<div class="card"><h3>제목</h3>', "<p>관계없는 출력</p>"]
+    assert buffer.finish() == {"enabled": True, "fragments": 4, "calls": 2}
+
+def test_unbuffered_sends_every_fragment(markdown):
+    buffer = RenderBuffer(enabled=False)
+    buffer.emit('<div class="card">', "", "<h3>제목</h3>")
+    buffer.close()
+    
+    assert markdown == ['<div class="card">', "<h3>제목</h3>", "</div>"]
+    assert buffer.finish()["calls"] == 3